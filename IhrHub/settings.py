@@ -38,6 +38,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 
     'corsheaders',
     'rest_framework',
@@ -124,6 +125,41 @@ DATABASES = {
     }
 }
 
+# --------------------------------------------------
+# CACHE
+# --------------------------------------------------
+# Per-process memory cache by default; point CACHE_URL at Redis
+# (e.g. redis://127.0.0.1:6379/1) to share it between workers.
+if os.environ.get('CACHE_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['CACHE_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'ihrhub-default',
+        }
+    }
+
+# --------------------------------------------------
+# JOBS
+# --------------------------------------------------
+# Seconds between in-process sweeps that close postings past their
+# application_deadline (0 disables; use `manage.py close_expired_jobs` from cron instead)
+JOBS_AUTO_CLOSE_INTERVAL = int(os.environ.get('JOBS_AUTO_CLOSE_INTERVAL', 0))
+
+# Build the job recommendation index in a background thread as each process
+# starts (otherwise on the first recommendation request); leave off for manage.py
+JOBS_RECOMMENDER_WARMUP = bool(int(os.environ.get('JOBS_RECOMMENDER_WARMUP', 0)))
+
+# Seconds view/impression increments are buffered in memory before one batched
+# upsert (also the most a crashed worker can lose; 0 writes on every request)
+VIEW_COUNTER_FLUSH_INTERVAL = int(os.environ.get('VIEW_COUNTER_FLUSH_INTERVAL', 10))
+
 # --------------------------------------------------
 # PASSWORD VALIDATION
 # --------------------------------------------------
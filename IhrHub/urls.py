@@ -7,7 +7,7 @@ from drf_yasg import openapi
 from django.conf import settings
 from django.conf.urls.static import static
 from . import views  # for get_user_roles
-from jobs.views import get_jobs_for_freelancer, get_interviews_by_job
+from jobs.views import get_jobs_for_freelancer, get_interviews_by_job, get_recommended_jobs
 
 # from rest_framework_simplejwt.views import (
 #     TokenObtainPairView,
@@ -69,6 +69,8 @@ urlpatterns = [
     path('api/user/<int:user_id>/roles/', views.get_user_roles, name='get_user_roles'),
     # GET /api/freelance/{freelance_id}/ - Jobs related to a freelancer
     path('api/freelance/<int:freelance_id>/', get_jobs_for_freelancer, name='freelance-jobs'),
+    # GET /api/freelance/{freelance_id}/recommended-jobs/ - Open jobs ranked for a freelancer
+    path('api/freelance/<int:freelance_id>/recommended-jobs/', get_recommended_jobs, name='freelance-recommended-jobs'),
     # GET /api/interview/{job_id} - Interviews for a job filtered by access token
     path('api/interview/<int:job_id>/', get_interviews_by_job, name='interviews-by-job'),
 
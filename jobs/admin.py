@@ -219,6 +219,8 @@ class JobOfferAdmin(admin.ModelAdmin):
         'id',
         'application',
         'offer_status',
+        'salary',
+        'start_date',
         'date_offered',
         'date_accepted',
         'date_rejected'
@@ -227,6 +229,7 @@ class JobOfferAdmin(admin.ModelAdmin):
     list_filter = [
         'offer_status',
         'date_offered',
+        'start_date',
         'application__job__job_type'
     ]
     
@@ -0,0 +1,169 @@
+import logging
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.mail import send_mail
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import SavedJobSearch, SavedSearchMatch
+from .recommend import tokenize
+
+
+logger = logging.getLogger(__name__)
+
+# Posting text a saved search's keywords are matched against
+ALERT_TEXT_FIELDS = (
+    'job_title', 'job_category', 'department', 'role_overview', 'key_responsibilities',
+    'required_qualifications', 'preferred_qualifications', 'languages_required',
+)
+
+# Term every posting carries, for searches with no keyword or filter
+MATCH_ALL_TERM = '*'
+
+# Postings listed per digest email; the rest are summarized as a count
+MAX_DIGEST_JOBS = 20
+
+# Existing (search, job) pairs are skipped; RETURNING yields only the rows really inserted
+_INSERT_MATCHES_SQL = """
+    INSERT INTO {table} (search_id, job_id, date_matched)
+    VALUES {rows}
+    ON CONFLICT (search_id, job_id) DO NOTHING
+    RETURNING id
+"""
+
+
+def index_term(search):
+    """
+    The most selective term a posting must contain to match the search: the longest
+    keyword (long words are rarer), else the narrowest exact filter.
+    """
+    keywords = tokenize(search.keywords)
+    if keywords:
+        return max(keywords, key=lambda t: (len(t), t))
+    if search.job_type:
+        return f'type:{search.job_type}'
+    if search.work_mode:
+        return f'mode:{search.work_mode}'
+    if search.job_category:
+        return f'category:{search.job_category}'
+    return MATCH_ALL_TERM
+
+
+def posting_terms(job):
+    """Every term a search can be indexed under that this posting satisfies"""
+    terms = {MATCH_ALL_TERM, f'type:{job.job_type}', f'mode:{job.work_mode}', f'category:{job.job_category}'}
+    for field in ALERT_TEXT_FIELDS:
+        terms.update(tokenize(getattr(job, field)))
+    return terms
+
+
+def search_matches(search, job, terms):
+    """Check every criterion of the search against a posting whose terms are given"""
+    if search.job_category and search.job_category != job.job_category:
+        return False
+    if search.job_type and search.job_type != job.job_type:
+        return False
+    if search.work_mode and search.work_mode != job.work_mode:
+        return False
+    if search.min_salary is not None:
+        salary = job.salary_to if job.salary_to is not None else job.salary_from
+        if salary is None or salary < search.min_salary:
+            return False
+    return all(word in terms for word in tokenize(search.keywords))
+
+
+def percolate(jobs):
+    """
+    Match open postings against the saved searches indexed under their terms and
+    record new SavedSearchMatch rows. One candidate query per call, not one per search.
+    Returns the number of new matches.
+    """
+    jobs = [job for job in jobs if job.job_status == 'open']
+    if not jobs:
+        return 0
+    terms_by_job = {job.id: posting_terms(job) for job in jobs}
+    all_terms = set().union(*terms_by_job.values())
+
+    candidates = defaultdict(list)
+    for search in SavedJobSearch.objects.filter(is_active=True, index_term__in=all_terms):
+        candidates[search.index_term].append(search)
+
+    matches = set()
+    for job in jobs:
+        terms = terms_by_job[job.id]
+        for term in terms & candidates.keys():
+            for search in candidates[term]:
+                if search_matches(search, job, terms):
+                    matches.add((search.id, job.id))
+    if not matches:
+        return 0
+
+    # bulk_create(ignore_conflicts=True) returns every attempted row, so count via RETURNING
+    now = timezone.now()
+    values, params = [], []
+    for search_id, job_id in sorted(matches):
+        values.append('(%s, %s, %s)')
+        params.extend([search_id, job_id, now])
+    sql = _INSERT_MATCHES_SQL.format(table=SavedSearchMatch._meta.db_table, rows=', '.join(values))
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return len(cursor.fetchall())
+
+
+def pending_digests():
+    """Un-notified matches on still-open postings, grouped by user: {user: [match]}"""
+    digests = defaultdict(list)
+    pending = (
+        SavedSearchMatch.objects.filter(notified_at=None, search__is_active=True, job__job_status='open')
+        .select_related('search__user', 'job')
+        .order_by('search__user_id', '-date_matched')
+    )
+    for match in pending:
+        digests[match.search.user].append(match)
+    return digests
+
+
+def _digest_body(user, matches):
+    jobs = {}
+    for match in matches:
+        jobs.setdefault(match.job_id, match)
+    lines = [f"Hello {user.get_full_name() or user.username},", "", "New jobs match your saved searches:", ""]
+    for match in list(jobs.values())[:MAX_DIGEST_JOBS]:
+        search_name = match.search.name or match.search.keywords or 'saved search'
+        lines.append(f"- {match.job.job_title} ({match.job.work_location}, {match.job.work_mode}) [{search_name}]")
+    if len(jobs) > MAX_DIGEST_JOBS:
+        lines.append(f"...and {len(jobs) - MAX_DIGEST_JOBS} more")
+    return len(jobs), "\n".join(lines)
+
+
+def send_search_digests(dry_run=False):
+    """
+    Email each user one digest of their pending matches and mark them notified.
+    A failed send leaves that user's matches pending for the next run.
+    Returns (digests sent, matches notified).
+    """
+    sent = notified = 0
+    for user, matches in pending_digests().items():
+        if not user.email:
+            continue
+        count, body = _digest_body(user, matches)
+        if dry_run:
+            sent += 1
+            notified += len(matches)
+            continue
+        try:
+            send_mail(
+                f"{count} new job{'s' if count != 1 else ''} match your saved searches",
+                body,
+                settings.DEFAULT_FROM_EMAIL,
+                [user.email],
+            )
+        except Exception:
+            logger.exception("Job alert digest to user %s failed", user.id)
+            continue
+        with transaction.atomic():
+            SavedSearchMatch.objects.filter(id__in=[m.id for m in matches]).update(notified_at=timezone.now())
+        sent += 1
+        notified += len(matches)
+    return sent, notified
@@ -3,4 +3,17 @@ from django.apps import AppConfig
 
 class JobsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'jobs'
\ No newline at end of file
+    name = 'jobs'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+
+        from django.conf import settings
+        interval = getattr(settings, 'JOBS_AUTO_CLOSE_INTERVAL', 0)
+        if interval:
+            from .deadlines import start_deadline_scheduler
+            start_deadline_scheduler(interval)
+
+        if getattr(settings, 'JOBS_RECOMMENDER_WARMUP', False):
+            from .recommend import recommender
+            recommender.warm()
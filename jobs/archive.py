@@ -0,0 +1,108 @@
+import json
+from datetime import timedelta
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models.fields.files import FieldFile
+from django.db import transaction
+from django.db.models import Prefetch, Q
+from django.utils import timezone
+
+from .models import ArchivedJobPosting, JobApplication, JobInterview, JobOffer, JobPosting
+
+
+# Postings in these states are finished and can leave the live tables
+ARCHIVABLE_STATUSES = ('closed', 'filled')
+
+# Inactive this long (since the last change) before a posting is archived
+ARCHIVE_AFTER = timedelta(days=180)
+
+ARCHIVE_BATCH_SIZE = 200
+
+
+def _row(instance, exclude=()):
+    """Column values of a model instance as JSON-safe data"""
+    data = {}
+    for field in instance._meta.concrete_fields:
+        if field.attname in exclude:
+            continue
+        value = getattr(instance, field.attname)
+        if isinstance(value, FieldFile):
+            # Keep the storage name; archived rows still reference the same blob
+            value = value.name or None
+        data[field.attname] = value
+    return json.loads(json.dumps(data, cls=DjangoJSONEncoder))
+
+
+def snapshot_posting(job):
+    """A posting with its applications, interviews, offers and withdrawals as one document"""
+    applications = []
+    for app in job.jobapplication_set.all():
+        item = _row(app)
+        item["interviews"] = [_row(iv) for iv in app.interviews.all()]
+        item["offers"] = [_row(of) for of in app.offers.all()]
+        withdrawal = getattr(app, 'withdrawal', None)
+        item["withdrawal"] = _row(withdrawal) if withdrawal else None
+        applications.append(item)
+    return {
+        "posting": _row(job, exclude=('search_vector',)),
+        "applications": applications,
+    }
+
+
+def archivable_postings(now=None, older_than=ARCHIVE_AFTER):
+    cutoff = (now or timezone.now()) - older_than
+    return JobPosting.objects.filter(job_status__in=ARCHIVABLE_STATUSES).filter(
+        Q(date_updated__lt=cutoff) | Q(date_updated__isnull=True, date_posted__lt=cutoff)
+    )
+
+
+def _archive_batch(ids):
+    with transaction.atomic():
+        # Rows another worker is archiving (or someone is editing) are left for the next run
+        locked = list(
+            JobPosting.objects.select_for_update(skip_locked=True)
+            .filter(id__in=ids, job_status__in=ARCHIVABLE_STATUSES)
+            .values_list('id', flat=True)
+        )
+        if not locked:
+            return 0
+        jobs = JobPosting.objects.filter(id__in=locked).prefetch_related(
+            Prefetch('jobapplication_set', queryset=JobApplication.objects.select_related('withdrawal').prefetch_related(
+                Prefetch('interviews', queryset=JobInterview.objects.order_by('interview_date')),
+                Prefetch('offers', queryset=JobOffer.objects.order_by('date_offered')),
+            ))
+        )
+        archived = []
+        for job in jobs:
+            snapshot = snapshot_posting(job)
+            archived.append(ArchivedJobPosting(
+                job_id=job.id,
+                job_provider_id=job.job_provider_id,
+                job_title=job.job_title,
+                job_status=job.job_status,
+                date_posted=job.date_posted,
+                application_count=len(snapshot["applications"]),
+                data=snapshot,
+            ))
+        ArchivedJobPosting.objects.bulk_create(archived, ignore_conflicts=True)
+        # Children go with the posting through on_delete=CASCADE
+        JobPosting.objects.filter(id__in=locked).delete()
+    return len(archived)
+
+
+def archive_postings(now=None, older_than=ARCHIVE_AFTER, batch_size=ARCHIVE_BATCH_SIZE, limit=None):
+    """
+    Move finished postings and their child rows into job_posting_archive, one
+    transaction per batch so locks stay short. Returns the number archived.
+    """
+    total = 0
+    last_id = 0
+    queryset = archivable_postings(now, older_than).order_by('id')
+    while limit is None or total < limit:
+        size = batch_size if limit is None else min(batch_size, limit - total)
+        ids = list(queryset.filter(id__gt=last_id).values_list('id', flat=True)[:size])
+        if not ids:
+            break
+        total += _archive_batch(ids)
+        last_id = ids[-1]
+    return total
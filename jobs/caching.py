@@ -0,0 +1,80 @@
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import JobPosting
+
+
+# Rendered job detail payloads; entries also die as soon as the posting changes
+JOB_DETAIL_CACHE_TTL = 10 * 60
+
+
+def generation(key):
+    """
+    Current generation token stored under key (created on first use).
+
+    Cache entries embed the token in their own keys, so starting a new
+    generation invalidates all of them without knowing what was cached.
+    """
+    token = cache.get(key)
+    if token is None:
+        token = uuid.uuid4().hex
+        if not cache.add(key, token, None):
+            token = cache.get(key, token)
+    return token
+
+
+def cache_is_shared():
+    """
+    Whether the default cache is shared by every process (CACHE_URL set). With the
+    per-process LocMemCache, a generation started in one worker is never seen by the others.
+    """
+    return 'locmem' not in settings.CACHES['default']['BACKEND'].lower()
+
+
+def new_generations(keys):
+    """
+    Start a new generation for each key. Random tokens (not a counter) so an
+    evicted generation key can never revive an old entry.
+    """
+    keys = set(keys)
+    if keys:
+        cache.set_many({key: uuid.uuid4().hex for key in keys}, None)
+
+
+def job_detail_version(modified):
+    """
+    Version of a posting's detail payload, derived from its date_updated (or
+    date_posted) so every worker computes the same value without a shared cache.
+    """
+    return str(int(modified.timestamp() * 1_000_000)) if modified else '0'
+
+
+def job_detail_state(job_id):
+    """
+    (version, last_modified) for a posting from a single indexed lookup of its
+    timestamps, or None if it does not exist. last_modified is whole seconds.
+    """
+    row = JobPosting.objects.filter(pk=job_id).values_list('date_updated', 'date_posted').first()
+    if row is None:
+        return None
+    modified = row[0] or row[1]
+    return job_detail_version(modified), int(modified.timestamp()) if modified else None
+
+
+def job_detail_etag(job_id, version):
+    return f'"job-{job_id}-{version}"'
+
+
+def get_job_detail(job_id, version, build):
+    """
+    Cached detail payload for a posting at `version`; build() produces it on a miss.
+    Keys carry the version, so a stale entry is never served once the row changes.
+    """
+    key = f'job_detail:{job_id}:{version}'
+    entry = cache.get(key)
+    if entry is None:
+        entry = build()
+        cache.set(key, entry, JOB_DETAIL_CACHE_TTL)
+    return entry
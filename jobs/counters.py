@@ -0,0 +1,149 @@
+import atexit
+import logging
+import threading
+from collections import Counter
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+
+from .models import ViewCounter
+
+
+logger = logging.getLogger(__name__)
+
+COUNTER_FIELDS = ('views', 'impressions')
+
+# Flush early once this many distinct (target, id) pairs are pending, so a
+# crash loses at most FLUSH_INTERVAL seconds or this many rows of increments
+MAX_PENDING_KEYS = 5000
+
+_UPSERT_SQL = """
+    INSERT INTO {table} (target_type, object_id, views, impressions, date_updated)
+    VALUES {rows}
+    ON CONFLICT (target_type, object_id) DO UPDATE SET
+        views = {table}.views + EXCLUDED.views,
+        impressions = {table}.impressions + EXCLUDED.impressions,
+        date_updated = EXCLUDED.date_updated
+"""
+
+
+class CounterBuffer:
+    """
+    Per-process buffer of view/impression increments.
+
+    Requests only bump an in-memory Counter; a daemon thread writes the
+    aggregate every `interval` seconds as one INSERT ... ON CONFLICT DO UPDATE,
+    so a viral posting costs one row update per flush instead of one per hit.
+    Failed flushes are merged back and retried on the next tick.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._pending = Counter()        # (target_type, object_id, field) -> n
+        self._keys = set()               # (target_type, object_id) with pending counts
+        self._thread = None
+        self._stopped = threading.Event()
+
+    def incr(self, target_type, object_ids, field='views', n=1):
+        with self._lock:
+            for object_id in object_ids:
+                self._pending[(target_type, int(object_id), field)] += n
+                self._keys.add((target_type, int(object_id)))
+            full = len(self._keys) >= MAX_PENDING_KEYS
+        if self.interval <= 0 or full:
+            try:
+                self.flush()
+            except Exception:
+                # Counting must never fail the request; the next flush retries
+                logger.exception("View counter flush failed; increments kept for the next attempt")
+        self._ensure_thread()
+
+    def pending(self, target_type, object_id):
+        """Counts for one object not yet written to the database"""
+        with self._lock:
+            return {f: self._pending.get((target_type, int(object_id), f), 0) for f in COUNTER_FIELDS}
+
+    def _take(self):
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+            self._keys = set()
+        return pending
+
+    def _restore(self, pending):
+        with self._lock:
+            self._pending.update(pending)
+            self._keys.update((t, i) for t, i, _f in pending)
+
+    def flush(self):
+        """Write all pending increments in one upsert; returns the number of rows touched"""
+        pending = self._take()
+        if not pending:
+            return 0
+        rows = {}
+        for (target_type, object_id, field), n in pending.items():
+            rows.setdefault((target_type, object_id), dict.fromkeys(COUNTER_FIELDS, 0))[field] += n
+        try:
+            write_counts(rows)
+        except Exception:
+            self._restore(pending)
+            raise
+        return len(rows)
+
+    def _ensure_thread(self):
+        if self._thread is None and self.interval > 0:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name='view-counter-flush', daemon=True)
+                    self._thread.start()
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            close_old_connections()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("View counter flush failed; increments kept for the next attempt")
+            finally:
+                close_old_connections()
+
+    def stop(self):
+        self._stopped.set()
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Final view counter flush failed")
+
+
+def write_counts(rows):
+    """Add {(target_type, object_id): {"views": n, "impressions": n}} to the stored counters"""
+    values, params = [], []
+    for (target_type, object_id), counts in sorted(rows.items()):
+        values.append('(%s, %s, %s, %s, now())')
+        params.extend([target_type, object_id, counts['views'], counts['impressions']])
+    sql = _UPSERT_SQL.format(table=ViewCounter._meta.db_table, rows=', '.join(values))
+    # Sorted keys keep row-lock order stable across concurrent flushes (no deadlocks)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(sql, params)
+
+
+buffer = CounterBuffer(getattr(settings, 'VIEW_COUNTER_FLUSH_INTERVAL', 10))
+atexit.register(buffer.stop)
+
+
+def record_views(target_type, object_ids):
+    buffer.incr(target_type, object_ids, 'views')
+
+
+def record_impressions(target_type, object_ids):
+    buffer.incr(target_type, object_ids, 'impressions')
+
+
+def get_counts(target_type, object_id):
+    """Stored counts plus this process's unflushed increments"""
+    stored = (
+        ViewCounter.objects.filter(target_type=target_type, object_id=object_id)
+        .values('views', 'impressions').first()
+    ) or dict.fromkeys(COUNTER_FIELDS, 0)
+    pending = buffer.pending(target_type, object_id)
+    return {f: stored[f] + pending[f] for f in COUNTER_FIELDS}
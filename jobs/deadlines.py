@@ -0,0 +1,78 @@
+import logging
+import threading
+
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from .models import JobPosting
+from .signals import job_postings_closed
+
+
+logger = logging.getLogger(__name__)
+
+CLOSE_BATCH_SIZE = 500
+
+
+def expired_postings(now=None):
+    """Open postings whose application_deadline has passed (served by job_posting_open_deadline_idx)"""
+    return JobPosting.objects.filter(job_status='open', application_deadline__lt=now or timezone.now())
+
+
+def close_expired_postings(now=None, batch_size=CLOSE_BATCH_SIZE):
+    """
+    Move expired open postings to 'closed' in batches of batch_size.
+
+    Each batch is one UPDATE in its own transaction, followed (on commit) by a
+    job_postings_closed signal carrying the closed ids. Returns the number closed.
+    """
+    now = now or timezone.now()
+    total = 0
+    while True:
+        ids = list(expired_postings(now).order_by('application_deadline').values_list('id', flat=True)[:batch_size])
+        if not ids:
+            break
+        with transaction.atomic():
+            closed = JobPosting.objects.filter(id__in=ids, job_status='open').update(
+                job_status='closed', date_updated=timezone.now()
+            )
+            transaction.on_commit(
+                lambda ids=ids: job_postings_closed.send(sender=JobPosting, job_ids=ids)
+            )
+        total += closed
+    return total
+
+
+class DeadlineScheduler(threading.Thread):
+    """Daemon thread that runs close_expired_postings every `interval` seconds"""
+
+    def __init__(self, interval):
+        super().__init__(name='job-deadline-scheduler', daemon=True)
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            close_old_connections()
+            try:
+                closed = close_expired_postings()
+                if closed:
+                    logger.info("Closed %s job postings past their application deadline", closed)
+            except Exception:
+                logger.exception("Job deadline sweep failed")
+            finally:
+                close_old_connections()
+
+    def stop(self):
+        self._stopped.set()
+
+
+_scheduler = None
+
+
+def start_deadline_scheduler(interval):
+    """Start the in-process sweep once per process; extra calls are no-ops"""
+    global _scheduler
+    if _scheduler is None and interval:
+        _scheduler = DeadlineScheduler(interval)
+        _scheduler.start()
+    return _scheduler
@@ -0,0 +1,151 @@
+import hashlib
+import random
+import struct
+
+from .models import JobPostingSignature
+from .recommend import tokenize
+
+
+# Text compared for near-duplicates
+DEDUPE_FIELDS = ('job_title', 'role_overview', 'key_responsibilities', 'required_qualifications')
+
+SHINGLE_SIZE = 3
+
+# 64 permutations in 16 bands of 4 rows: pairs with Jaccard ~0.5 collide in
+# at least one band about half the time, pairs above ~0.8 almost always
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+
+# Estimated Jaccard similarity at which postings are reported as duplicates
+DUPLICATE_THRESHOLD = 0.8
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(0x10B5)
+# Fixed coefficients so signatures agree across processes and deploys
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+
+def _hash64(data):
+    return struct.unpack('<Q', hashlib.blake2b(data, digest_size=8).digest())[0]
+
+
+def shingles(job):
+    """Word n-grams of the posting's normalized text, hashed to 64-bit ints"""
+    words = []
+    for field in DEDUPE_FIELDS:
+        words.extend(tokenize(getattr(job, field, None)))
+    if len(words) < SHINGLE_SIZE:
+        return {_hash64(' '.join(words).encode())} if words else set()
+    return {
+        _hash64(' '.join(words[i:i + SHINGLE_SIZE]).encode())
+        for i in range(len(words) - SHINGLE_SIZE + 1)
+    }
+
+
+def minhash(shingle_set):
+    """NUM_PERM minimum hash values; identical signatures for identical shingle sets"""
+    if not shingle_set:
+        return [_PRIME] * NUM_PERM
+    return [min((a * x + b) % _PRIME for x in shingle_set) for a, b in _PERMUTATIONS]
+
+
+def band_keys(signature):
+    """One signed 64-bit LSH bucket key per band (band index is mixed in); none for empty text"""
+    if signature[0] == _PRIME:
+        return []
+    keys = []
+    for band in range(BANDS):
+        rows = signature[band * ROWS:(band + 1) * ROWS]
+        digest = hashlib.blake2b(struct.pack(f'<H{ROWS}Q', band, *rows), digest_size=8).digest()
+        keys.append(struct.unpack('<q', digest)[0])
+    return keys
+
+
+def similarity(sig_a, sig_b):
+    """Estimated Jaccard similarity of two signatures"""
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / NUM_PERM
+
+
+def compute_signature(job):
+    """Store the MinHash signature and LSH bands of one posting (only its own text is read)"""
+    signature = minhash(shingles(job))
+    JobPostingSignature.objects.update_or_create(
+        job_id=job.id,
+        defaults={'minhash': signature, 'bands': band_keys(signature)},
+    )
+    return signature
+
+
+def refresh_signatures(jobs):
+    """compute_signature for postings inserted without post_save (bulk_create)"""
+    rows = []
+    for job in jobs:
+        signature = minhash(shingles(job))
+        rows.append(JobPostingSignature(job_id=job.id, minhash=signature, bands=band_keys(signature)))
+    JobPostingSignature.objects.bulk_create(
+        rows, update_conflicts=True, unique_fields=['job'], update_fields=['minhash', 'bands'],
+    )
+
+
+def find_duplicates(job_id, signature, threshold=DUPLICATE_THRESHOLD, limit=10):
+    """
+    Postings whose signature shares an LSH band with `signature` (GIN lookup on
+    bands, no scan) and whose estimated similarity reaches threshold.
+    Returns [(job_id, job_title, similarity)] best first.
+    """
+    candidates = (
+        JobPostingSignature.objects.filter(bands__overlap=band_keys(signature))
+        .exclude(job_id=job_id)
+        .values_list('job_id', 'minhash', 'job__job_title')
+    )
+    matches = []
+    for other_id, other_signature, title in candidates:
+        score = similarity(signature, other_signature)
+        if score >= threshold:
+            matches.append((other_id, title, round(score, 3)))
+    matches.sort(key=lambda m: (-m[2], m[0]))
+    return matches[:limit]
+
+
+def cluster_duplicates(threshold=DUPLICATE_THRESHOLD):
+    """
+    Group all postings into near-duplicate clusters with union-find over pairs
+    that share a band. Returns {cluster_id: [job_ids]} for clusters of 2+;
+    cluster_id is the oldest (lowest) job id in the cluster.
+    """
+    parent = {}
+
+    def find(x):
+        root = x
+        while parent.get(root, root) != root:
+            root = parent[root]
+        while x != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    signatures = {}
+    buckets = {}
+    for job_id, signature, bands in JobPostingSignature.objects.values_list('job_id', 'minhash', 'bands').iterator():
+        signatures[job_id] = signature
+        for key in bands:
+            buckets.setdefault(key, []).append(job_id)
+
+    for members in buckets.values():
+        for i, a in enumerate(members):
+            for b in members[i + 1:]:
+                root_a, root_b = find(a), find(b)
+                if root_a != root_b and similarity(signatures[a], signatures[b]) >= threshold:
+                    parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    clusters = {}
+    for job_id in signatures:
+        clusters.setdefault(find(job_id), []).append(job_id)
+    return {root: sorted(ids) for root, ids in clusters.items() if len(ids) > 1}
+
+
+def save_clusters(clusters):
+    """Record cluster_id on every signature (None for postings without duplicates)"""
+    JobPostingSignature.objects.exclude(cluster_id=None).update(cluster_id=None)
+    for root, job_ids in clusters.items():
+        JobPostingSignature.objects.filter(job_id__in=job_ids).update(cluster_id=root)
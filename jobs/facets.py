@@ -0,0 +1,72 @@
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from .models import JobPosting
+
+
+# Choice fields counted per value
+FACET_FIELDS = ('job_category', 'job_type', 'work_mode', 'currency')
+
+# Boolean benefit flags counted when set
+BENEFIT_FLAGS = ('health_insurance', 'remote_work', 'paid_leave', 'bonus')
+
+# (label, lower bound inclusive, upper bound exclusive) applied to salary_from
+SALARY_BUCKETS = (
+    ('0-25k', 0, 25000),
+    ('25k-50k', 25000, 50000),
+    ('50k-100k', 50000, 100000),
+    ('100k+', 100000, None),
+)
+
+FACET_CACHE_TTL = 60  # seconds
+
+
+def _facet_buckets():
+    """Yield (facet, value, Q) for every bucket reported by compute_facets"""
+    for field in FACET_FIELDS:
+        for value, _label in JobPosting._meta.get_field(field).choices:
+            yield field, value, Q(**{field: value})
+    for flag in BENEFIT_FLAGS:
+        yield 'benefits', flag, Q(**{flag: True})
+    for label, low, high in SALARY_BUCKETS:
+        condition = Q(salary_from__gte=low)
+        if high is not None:
+            condition &= Q(salary_from__lt=high)
+        yield 'salary', label, condition
+    yield 'salary', 'unspecified', Q(salary_from__isnull=True)
+
+
+def compute_facets(queryset):
+    """
+    Count every facet bucket for the postings in queryset with a single query.
+
+    Returns {"total": n, "job_category": {value: n}, ..., "benefits": {...}, "salary": {...}}.
+    """
+    buckets = list(_facet_buckets())
+    # Choice values may contain spaces, so aggregate under positional aliases
+    aggregates = {f'b{i}': Count('id', filter=condition) for i, (_f, _v, condition) in enumerate(buckets)}
+    row = queryset.order_by().aggregate(total=Count('id'), **aggregates)
+
+    facets = {"total": row['total']}
+    for i, (facet, value, _condition) in enumerate(buckets):
+        facets.setdefault(facet, {})[value] = row[f'b{i}']
+    return facets
+
+
+def facet_cache_key(filters):
+    """Cache key for a normalized filter dict (order-independent)"""
+    digest = hashlib.md5(json.dumps(filters, sort_keys=True).encode()).hexdigest()
+    return f'job_facets:{digest}'
+
+
+def get_facets(queryset, filters):
+    """compute_facets(queryset), cached for FACET_CACHE_TTL under the normalized filters"""
+    key = facet_cache_key(filters)
+    facets = cache.get(key)
+    if facets is None:
+        facets = compute_facets(queryset)
+        cache.set(key, facets, FACET_CACHE_TTL)
+    return facets
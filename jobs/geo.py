@@ -0,0 +1,187 @@
+import csv
+import math
+import re
+from functools import lru_cache
+from pathlib import Path
+
+from django.db.models import F, Q
+from django.db.models.functions import ASin, Cos, Least, Power, Radians, Sin, Sqrt
+
+
+# Offline gazetteer bundled with the app: name, country, latitude, longitude, aliases (|-separated)
+GAZETTEER_PATH = Path(__file__).resolve().parent / 'data' / 'gazetteer.csv'
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Stored geohash length (~150 m cells); radius queries use shorter prefixes of it
+GEOHASH_PRECISION = 7
+# Most prefixes a radius query ORs together; coarser cells are used beyond this
+MAX_COVER_CELLS = 32
+
+DEFAULT_RADIUS_KM = 50
+MAX_RADIUS_KM = 1000
+
+# Longest place name, in words, looked for inside free-text locations
+MAX_PLACE_WORDS = 4
+
+_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+_WORD_RE = re.compile(r"[a-z]+")
+_POINT_RE = re.compile(r"^\s*(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)\s*$")
+
+
+def normalize_place(text):
+    return ' '.join(_WORD_RE.findall((text or '').lower()))
+
+
+@lru_cache(maxsize=1)
+def gazetteer():
+    """{normalized name or alias: (latitude, longitude)}, loaded once per process"""
+    places = {}
+    with open(GAZETTEER_PATH, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            point = (float(row['latitude']), float(row['longitude']))
+            for name in [row['name'], *row['aliases'].split('|')]:
+                name = normalize_place(name)
+                if name:
+                    places.setdefault(name, point)
+    return places
+
+
+def geocode(text):
+    """
+    (latitude, longitude) of the first gazetteer place named in free text such as
+    "Dubai Marina, UAE" (longer names win, so "new york city" beats "york"); None if none.
+    """
+    words = normalize_place(text).split()
+    places = gazetteer()
+    for size in range(min(MAX_PLACE_WORDS, len(words)), 0, -1):
+        for i in range(len(words) - size + 1):
+            point = places.get(' '.join(words[i:i + size]))
+            if point:
+                return point
+    return None
+
+
+def parse_point(value):
+    """A "lat,lon" pair or a place name for ?near=; raises ValueError if neither"""
+    match = _POINT_RE.match(value)
+    if match:
+        lat, lon = float(match.group(1)), float(match.group(2))
+        if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+            raise ValueError("near coordinates are out of range")
+        return lat, lon
+    point = geocode(value)
+    if point is None:
+        raise ValueError(f"Unknown location: {value}")
+    return point
+
+
+def parse_radius(value):
+    try:
+        radius = float(value) if value not in (None, '') else DEFAULT_RADIUS_KM
+    except ValueError:
+        raise ValueError("radius_km must be a number")
+    if not 0 < radius <= MAX_RADIUS_KM:
+        raise ValueError(f"radius_km must be between 0 and {MAX_RADIUS_KM}")
+    return radius
+
+
+def geohash(lat, lon, precision=GEOHASH_PRECISION):
+    """Standard base32 geohash; nearby points share long prefixes"""
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars = []
+    bits = bit_count = 0
+    even = True
+    while len(chars) < precision:
+        bounds, value = (lon_range, lon) if even else (lat_range, lat)
+        mid = (bounds[0] + bounds[1]) / 2
+        if value >= mid:
+            bits = bits * 2 + 1
+            bounds[0] = mid
+        else:
+            bits = bits * 2
+            bounds[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = bit_count = 0
+    return ''.join(chars)
+
+
+def _cell_size(precision):
+    """(height, width) in degrees of a geohash cell"""
+    bits = 5 * precision
+    return 180.0 / 2 ** (bits // 2), 360.0 / 2 ** ((bits + 1) // 2)
+
+
+def covering_cells(lat, lon, radius_km):
+    """
+    Geohash prefixes whose cells together cover the circle's bounding box, at the
+    finest precision that needs no more than MAX_COVER_CELLS of them.
+    """
+    dlat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    min_lat, max_lat = max(lat - dlat, -90.0), min(lat + dlat, 90.0)
+    # Meridians converge, so the widest span is at the latitude nearest a pole;
+    # a circle that reaches a pole spans every longitude
+    cos_edge = math.cos(math.radians(max(abs(min_lat), abs(max_lat))))
+    dlon = 180.0 if cos_edge < 1e-6 else dlat / cos_edge
+    full_span = dlon >= 180.0
+    min_lon, max_lon = lon - dlon, lon + dlon
+
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        height, width = _cell_size(precision)
+        rows = range(int((min_lat + 90) // height), int((max_lat + 90) // height) + 1)
+        if full_span:
+            cols = range(round(360 / width))
+        else:
+            cols = range(int((min_lon + 180) // width), int((max_lon + 180) // width) + 1)
+        if len(rows) * len(cols) <= MAX_COVER_CELLS:
+            break
+
+    cells = set()
+    for row in rows:
+        cell_lat = min(-90 + (row + 0.5) * height, 90 - height / 2)
+        for col in cols:
+            # Wrap across the antimeridian
+            cell_lon = (-180 + (col + 0.5) * width + 180) % 360 - 180
+            cells.add(geohash(cell_lat, cell_lon, precision))
+    return cells
+
+
+def distance_km(lat, lon, lat_field='latitude', lon_field='longitude'):
+    """Haversine distance from (lat, lon) to the row's point, as a database expression"""
+    a = Power(Sin(Radians(F(lat_field) - lat) / 2), 2) + (
+        math.cos(math.radians(lat)) * Cos(Radians(F(lat_field))) * Power(Sin(Radians(F(lon_field) - lon) / 2), 2)
+    )
+    return 2 * EARTH_RADIUS_KM * ASin(Sqrt(Least(a, 1.0)))
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    dlat = math.radians(lat2 - lat1)
+    dlon = math.radians(lon2 - lon1)
+    a = math.sin(dlat / 2) ** 2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def filter_near(queryset, lat, lon, radius_km, field='geohash'):
+    """
+    Rows within radius_km of (lat, lon), annotated with distance_km.
+
+    The geohash prefix ranges select candidate rows from the index; only those
+    get the exact great-circle distance check.
+    """
+    cells = Q()
+    for cell in covering_cells(lat, lon, radius_km):
+        cells |= Q(**{f'{field}__startswith': cell})
+    return queryset.filter(cells).annotate(distance_km=distance_km(lat, lon)).filter(distance_km__lte=radius_km)
+
+
+def places_within(lat, lon, radius_km, names):
+    """The names (e.g. city choice values) whose gazetteer point lies within radius_km"""
+    within = []
+    for name in names:
+        point = geocode(name.replace('-', ' '))
+        if point and haversine_km(lat, lon, *point) <= radius_km:
+            within.append(name)
+    return within
@@ -0,0 +1,80 @@
+from django.core.cache import cache
+
+from .caching import cache_is_shared, generation, new_generations
+from .models import JobApplication
+from .pagination import keyset_paginate
+
+
+# Job-side changes (title, status) also invalidate, so the TTL only bounds memory use.
+# Only used with a shared cache: invalidations must reach every worker and the sweeps.
+FREELANCER_JOBS_CACHE_TTL = 15 * 60
+
+# Only these columns are read for the history (no full JobPosting rows)
+HISTORY_FIELDS = (
+    'id', 'job_id', 'status', 'date_applied',
+    'job__job_title', 'job__job_category', 'job__date_posted', 'job__job_status',
+)
+
+
+def _version_key(freelancer_id):
+    return f'freelancer_jobs_version:{freelancer_id}'
+
+
+def freelancer_jobs_version(freelancer_id):
+    """Current cache generation for a freelancer's history"""
+    return generation(_version_key(freelancer_id))
+
+
+def invalidate_freelancer_jobs(freelancer_ids):
+    new_generations(_version_key(fid) for fid in freelancer_ids)
+
+
+def invalidate_for_postings(job_ids):
+    """Invalidate the history of every freelancer who applied to these postings"""
+    invalidate_freelancer_jobs(
+        JobApplication.objects.filter(job_id__in=list(job_ids))
+        .values_list('freelancer_id', flat=True).distinct()
+    )
+
+
+def _history_item(row):
+    return {
+        "job_id": row['job_id'],
+        "job_title": row['job__job_title'],
+        "job_category": row['job__job_category'],
+        "date_posted": row['job__date_posted'].strftime('%Y-%m-%d') if row['job__date_posted'] else None,
+        "job_status": row['job__job_status'],
+        "application_id": row['id'],
+        "application_status": row['status'],
+        "date_applied": row['date_applied'].strftime('%Y-%m-%dT%H:%M:%SZ') if row['date_applied'] else None,
+    }
+
+
+def freelancer_job_history(freelancer_id, request, paginate):
+    """
+    Jobs a freelancer applied to, newest application first, with their status.
+
+    (job, freelancer_id) is unique, so one row per application is already one
+    row per job. Returns {"jobs": [...], "next_cursor": ...}; cached per
+    freelancer generation and page when the cache is shared between processes.
+    """
+    if not cache_is_shared():
+        return _build_history(freelancer_id, request, paginate)
+
+    cursor = request.query_params.get('cursor', '') if paginate else ''
+    limit = request.query_params.get('limit', '') if paginate else ''
+    key = f'freelancer_jobs:{freelancer_id}:{freelancer_jobs_version(freelancer_id)}:{limit}:{cursor}'
+    result = cache.get(key)
+    if result is None:
+        result = _build_history(freelancer_id, request, paginate)
+        cache.set(key, result, FREELANCER_JOBS_CACHE_TTL)
+    return result
+
+
+def _build_history(freelancer_id, request, paginate):
+    rows = JobApplication.objects.filter(freelancer_id=freelancer_id).values(*HISTORY_FIELDS)
+    if paginate:
+        rows, next_cursor = keyset_paginate(rows, request, ('date_applied', 'id'))
+    else:
+        rows, next_cursor = rows.order_by('-date_applied', '-id'), None
+    return {"jobs": [_history_item(row) for row in rows], "next_cursor": next_cursor}
@@ -0,0 +1,170 @@
+import csv
+import io
+import json
+
+from django.db import transaction
+from rest_framework.exceptions import ValidationError
+
+from .alerts import percolate
+from .dedupe import refresh_signatures
+from .models import JobPosting
+from .search import refresh_search_vectors
+from .serializers import JobPostingSerializer
+
+
+IMPORT_FORMATS = ('csv', 'jsonl')
+IMPORT_CHUNK_SIZE = 500
+
+# Detailed per-row errors kept in the report; further failures are only counted
+MAX_REPORTED_ERRORS = 1000
+
+
+def detect_format(filename, default='csv'):
+    """Guess the import format from a file name"""
+    name = (filename or '').lower()
+    if name.endswith(('.jsonl', '.ndjson', '.json')):
+        return 'jsonl'
+    if name.endswith('.csv'):
+        return 'csv'
+    return default
+
+
+class ImportFileError(ValueError):
+    """
+    The file itself cannot be read (not UTF-8, malformed CSV). `report` holds
+    what had already been committed when it was found, or None if nothing was.
+    """
+
+    def __init__(self, message, report=None):
+        super().__init__(message)
+        self.report = report
+
+
+def _text_stream(stream):
+    """Wrap a binary file object so it is decoded lazily, line by line"""
+    if isinstance(stream, io.TextIOBase):
+        return stream
+    return io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+
+
+def check_file(stream, fmt):
+    """
+    Decode (and for CSV, tokenize) the whole file once before anything is written,
+    so encoding and CSV syntax errors are reported while nothing has been committed.
+    Raises ImportFileError; rewinds the stream.
+    """
+    text = _text_stream(stream)
+    reader = None
+    try:
+        if fmt == 'csv':
+            reader = csv.reader(text)
+            for _row in reader:
+                pass
+        else:
+            for _line in text:
+                pass
+    except UnicodeDecodeError:
+        raise ImportFileError("File must be UTF-8 encoded")
+    except csv.Error as e:
+        raise ImportFileError(f"Malformed CSV near line {reader.line_num}: {e}")
+    finally:
+        if text is not stream:
+            # Keep the wrapper from closing the caller's file
+            text.detach()
+        stream.seek(0)
+
+
+def iter_rows(stream, fmt):
+    """
+    Yield (row_number, data, error) from a CSV or JSONL stream without reading it whole.
+
+    Empty CSV cells are dropped so optional columns fall back to model defaults.
+    data is None and error is set for lines that cannot be parsed.
+    """
+    text = _text_stream(stream)
+    if fmt == 'csv':
+        reader = csv.DictReader(text)
+        for number, row in enumerate(reader, start=2):  # row 1 is the header
+            yield number, {k.strip(): v for k, v in row.items() if k and v not in (None, '')}, None
+    elif fmt == 'jsonl':
+        for number, line in enumerate(text, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                data = json.loads(line)
+            except ValueError as e:
+                yield number, None, {"non_field_errors": [f"Invalid JSON: {e}"]}
+                continue
+            if not isinstance(data, dict):
+                yield number, None, {"non_field_errors": ["Each line must be a JSON object"]}
+                continue
+            yield number, data, None
+    else:
+        raise ValueError(f"Unsupported import format: {fmt}")
+
+
+def _flush(objects, report, dry_run):
+    if not objects or dry_run:
+        return
+    with transaction.atomic():
+        created = JobPosting.objects.bulk_create(objects, batch_size=len(objects))
+        # bulk_create skips post_save, so index the new rows here
+        refresh_search_vectors(job.id for job in created)
+        refresh_signatures(created)
+        transaction.on_commit(lambda: percolate(created))
+    report["created"] += len(created)
+
+
+def import_job_postings(stream, fmt, job_provider, chunk_size=IMPORT_CHUNK_SIZE, dry_run=False):
+    """
+    Stream-parse postings from stream, validate them with JobPostingSerializer and
+    insert the valid ones for job_provider in bulk_create batches of chunk_size.
+
+    Returns a report: {"created", "failed", "valid", "errors": [{"row", "errors"}], "errors_truncated"}.
+    With dry_run nothing is written, but every row is still validated.
+
+    An unreadable file raises ImportFileError, normally from check_file before the
+    first chunk commits; if reading still fails later, the error carries the report
+    of the chunks already committed.
+    """
+    check_file(stream, fmt)
+    report = {"created": 0, "valid": 0, "failed": 0, "errors": [], "errors_truncated": False}
+    try:
+        _import_rows(stream, fmt, job_provider, chunk_size, dry_run, report)
+    except UnicodeDecodeError:
+        raise ImportFileError("File must be UTF-8 encoded", report)
+    except csv.Error as e:
+        raise ImportFileError(f"Malformed CSV: {e}", report)
+    return report
+
+
+def _import_rows(stream, fmt, job_provider, chunk_size, dry_run, report):
+    # One bound serializer validates every row; building a new one per row dominates the cost
+    serializer = JobPostingSerializer()
+    pending = []
+
+    for number, data, error in iter_rows(stream, fmt):
+        if error is None:
+            try:
+                validated = serializer.run_validation(data)
+            except ValidationError as e:
+                error = e.detail
+        if error is not None:
+            report["failed"] += 1
+            if len(report["errors"]) < MAX_REPORTED_ERRORS:
+                report["errors"].append({"row": number, "errors": error})
+            else:
+                report["errors_truncated"] = True
+            continue
+
+        report["valid"] += 1
+        job = JobPosting(job_provider=job_provider, **validated)
+        # bulk_create skips save(), which geocodes work_location
+        job.geocode_location()
+        pending.append(job)
+        if len(pending) >= chunk_size:
+            _flush(pending, report, dry_run)
+            pending = []
+
+    _flush(pending, report, dry_run)
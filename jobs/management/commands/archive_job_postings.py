@@ -0,0 +1,24 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from jobs.archive import ARCHIVE_AFTER, ARCHIVE_BATCH_SIZE, archivable_postings, archive_postings
+
+
+class Command(BaseCommand):
+    help = "Move closed/filled job postings and their applications, interviews and offers to the archive (run from cron)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=ARCHIVE_AFTER.days,
+                            help="Archive postings unchanged for this many days")
+        parser.add_argument('--batch-size', type=int, default=ARCHIVE_BATCH_SIZE, help="Postings moved per transaction")
+        parser.add_argument('--limit', type=int, default=None, help="Stop after this many postings")
+        parser.add_argument('--dry-run', action='store_true', help="Only report how many would be archived")
+
+    def handle(self, *args, **options):
+        older_than = timedelta(days=options['days'])
+        if options['dry_run']:
+            self.stdout.write(f"{archivable_postings(older_than=older_than).count()} job postings can be archived")
+            return
+        archived = archive_postings(older_than=older_than, batch_size=options['batch_size'], limit=options['limit'])
+        self.stdout.write(self.style.SUCCESS(f"Archived {archived} job postings"))
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from jobs.deadlines import CLOSE_BATCH_SIZE, close_expired_postings, expired_postings
+
+
+class Command(BaseCommand):
+    help = "Close open job postings whose application_deadline has passed (run from cron)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=CLOSE_BATCH_SIZE, help="Postings closed per UPDATE")
+        parser.add_argument('--dry-run', action='store_true', help="Only report how many would be closed")
+
+    def handle(self, *args, **options):
+        if options['dry_run']:
+            self.stdout.write(f"{expired_postings().count()} job postings are past their deadline")
+            return
+        closed = close_expired_postings(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Closed {closed} expired job postings"))
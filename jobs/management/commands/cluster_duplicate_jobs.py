@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from jobs.dedupe import DUPLICATE_THRESHOLD, cluster_duplicates, refresh_signatures, save_clusters
+from jobs.models import JobPosting
+
+
+class Command(BaseCommand):
+    help = "Group job postings into near-duplicate clusters (MinHash/LSH) and record cluster_id"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threshold', type=float, default=DUPLICATE_THRESHOLD,
+                            help="Estimated Jaccard similarity that counts as a duplicate")
+        parser.add_argument('--backfill', action='store_true',
+                            help="First compute signatures for postings that have none")
+        parser.add_argument('--batch-size', type=int, default=1000, help="Postings per backfill batch")
+
+    def handle(self, *args, **options):
+        if options['backfill']:
+            missing = JobPosting.objects.filter(signature__isnull=True).order_by('id')
+            total = 0
+            while True:
+                batch = list(missing[:options['batch_size']])
+                if not batch:
+                    break
+                refresh_signatures(batch)
+                total += len(batch)
+            self.stdout.write(f"Computed signatures for {total} job postings")
+
+        clusters = cluster_duplicates(options['threshold'])
+        save_clusters(clusters)
+        duplicates = sum(len(ids) for ids in clusters.values())
+        self.stdout.write(self.style.SUCCESS(
+            f"Found {len(clusters)} duplicate clusters covering {duplicates} job postings"
+        ))
@@ -0,0 +1,35 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from jobs.models import JobApplication, ResumeDocument
+from jobs.resumes import EXTRACT_BATCH_SIZE, process_pending, queue_resumes
+from profiles.models import FreelancerProfile
+
+
+class Command(BaseCommand):
+    help = "Extract and index the text of uploaded resumes in a pool of worker processes"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+        parser.add_argument('--batch-size', type=int, default=EXTRACT_BATCH_SIZE, help="Resumes claimed per batch")
+        parser.add_argument('--backfill', action='store_true', help="Queue every resume already on file first")
+        parser.add_argument('--retry-failed', action='store_true', help="Queue failed extractions again")
+        parser.add_argument('--watch', type=int, metavar='SECONDS', default=0,
+                            help="Keep running, polling for new resumes every SECONDS")
+
+    def handle(self, *args, **options):
+        if options['backfill']:
+            for model in (JobApplication, FreelancerProfile):
+                names = model.objects.exclude(resume='').exclude(resume__isnull=True).values_list('resume', flat=True)
+                queue_resumes(names.iterator())
+        if options['retry_failed']:
+            ResumeDocument.objects.filter(status='failed').update(status='pending', error='')
+
+        while True:
+            extracted, failed = process_pending(workers=options['workers'], batch_size=options['batch_size'])
+            if extracted or failed:
+                self.stdout.write(self.style.SUCCESS(f"Extracted {extracted} resumes ({failed} failed)"))
+            if not options['watch']:
+                break
+            time.sleep(options['watch'])
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from jobs.models import JobPosting
+
+
+class Command(BaseCommand):
+    help = "Geocode work_location of existing job postings against the bundled gazetteer"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help="Redo postings that already have coordinates")
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        postings = JobPosting.objects.only('id', 'work_location').order_by('id')
+        if not options['all']:
+            postings = postings.filter(geohash='')
+        last_id = located = total = 0
+        while True:
+            batch = list(postings.filter(id__gt=last_id)[:options['batch_size']])
+            if not batch:
+                break
+            for job in batch:
+                job.geocode_location()
+                located += job.latitude is not None
+            JobPosting.objects.bulk_update(batch, ['latitude', 'longitude', 'geohash'])
+            total += len(batch)
+            last_id = batch[-1].id
+        self.stdout.write(self.style.SUCCESS(f"Geocoded {located} of {total} job postings"))
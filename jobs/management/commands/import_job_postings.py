@@ -0,0 +1,47 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.importer import IMPORT_CHUNK_SIZE, IMPORT_FORMATS, ImportFileError, detect_format, import_job_postings
+from profiles.models import JobProviderProfile
+
+
+class Command(BaseCommand):
+    help = "Bulk import job postings from a CSV or JSONL file for one job provider"
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="CSV (header row of JobPosting field names) or JSONL file")
+        parser.add_argument('--provider-id', type=int, required=True, help="JobProviderProfile id that owns the postings")
+        parser.add_argument('--format', choices=IMPORT_FORMATS, help="Defaults to the file extension")
+        parser.add_argument('--chunk-size', type=int, default=IMPORT_CHUNK_SIZE, help="Rows per bulk insert")
+        parser.add_argument('--dry-run', action='store_true', help="Validate only; write nothing")
+        parser.add_argument('--report', help="Write the full JSON report to this path")
+
+    def handle(self, *args, **options):
+        try:
+            provider = JobProviderProfile.objects.get(id=options['provider_id'])
+        except JobProviderProfile.DoesNotExist:
+            raise CommandError(f"JobProviderProfile {options['provider_id']} does not exist")
+
+        fmt = options['format'] or detect_format(options['path'])
+        with open(options['path'], 'rb') as stream:
+            try:
+                report = import_job_postings(
+                    stream, fmt, provider,
+                    chunk_size=options['chunk_size'], dry_run=options['dry_run'],
+                )
+            except ImportFileError as e:
+                created = e.report["created"] if e.report else 0
+                raise CommandError(f"{e} ({created} postings were already created)")
+
+        if options['report']:
+            with open(options['report'], 'w') as out:
+                json.dump(report, out, indent=2, default=str)
+
+        for error in report['errors'][:20]:
+            self.stderr.write(f"row {error['row']}: {json.dumps(error['errors'], default=str)}")
+
+        summary = f"{report['created']} created, {report['valid']} valid, {report['failed']} failed"
+        if options['dry_run']:
+            summary += " (dry run)"
+        self.stdout.write(self.style.SUCCESS(summary))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from jobs.uploads import purge_stale_uploads
+
+
+class Command(BaseCommand):
+    help = "Delete unfinished chunked uploads older than a day and their partial files (run from cron)"
+
+    def handle(self, *args, **options):
+        purged = purge_stale_uploads()
+        self.stdout.write(self.style.SUCCESS(f"Purged {purged} stale upload sessions"))
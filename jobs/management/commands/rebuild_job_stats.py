@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from jobs.models import JobPosting, JobPipelineStats
+from jobs.stats import COUNTER_FIELDS, compute_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount job_pipeline_stats from applications, interviews and offers (repairs counter drift). "
+        "Run once after the migration that creates the table."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help="Jobs recounted per transaction")
+        parser.add_argument('--job-id', type=int, action='append', dest='job_ids', help="Only rebuild these jobs")
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        queryset = JobPosting.objects.order_by('id')
+        if options['job_ids']:
+            queryset = queryset.filter(id__in=options['job_ids'])
+
+        total = 0
+        last_id = 0
+        while True:
+            job_ids = list(queryset.filter(id__gt=last_id).values_list('id', flat=True)[:batch_size])
+            if not job_ids:
+                break
+            with transaction.atomic():
+                JobPipelineStats.objects.bulk_create(
+                    compute_stats(job_ids),
+                    update_conflicts=True,
+                    unique_fields=['job'],
+                    update_fields=COUNTER_FIELDS + ['date_updated'],
+                )
+            total += len(job_ids)
+            last_id = job_ids[-1]
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt pipeline stats for {total} jobs"))
@@ -0,0 +1,32 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from jobs.models import JobOffer
+
+
+class Command(BaseCommand):
+    help = "Re-extract JobOffer.salary/start_date from offer_details (run once after converting the column to JSON)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help="Offers written per UPDATE batch")
+
+    def handle(self, *args, **options):
+        batch, total = [], 0
+        for offer in JobOffer.objects.only('id', 'offer_details').iterator(chunk_size=options['batch_size']):
+            # Rows written by the old TextField code may hold a JSON-encoded string
+            if isinstance(offer.offer_details, str):
+                try:
+                    offer.offer_details = json.loads(offer.offer_details)
+                except ValueError:
+                    pass
+            offer.extract_offer_fields()
+            batch.append(offer)
+            if len(batch) >= options['batch_size']:
+                JobOffer.objects.bulk_update(batch, ['offer_details', 'salary', 'start_date'])
+                total += len(batch)
+                batch = []
+        if batch:
+            JobOffer.objects.bulk_update(batch, ['offer_details', 'salary', 'start_date'])
+            total += len(batch)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt offer fields for {total} offers"))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from jobs.alerts import send_search_digests
+
+
+class Command(BaseCommand):
+    help = "Email each freelancer one digest of new postings matching their saved searches (run from cron)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help="Count digests without sending or marking them")
+
+    def handle(self, *args, **options):
+        sent, notified = send_search_digests(dry_run=options['dry_run'])
+        self.stdout.write(self.style.SUCCESS(f"Sent {sent} job alert digests covering {notified} matches"))
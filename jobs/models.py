@@ -1,5 +1,15 @@
+import uuid
+from datetime import date
+from decimal import Decimal, InvalidOperation
+
 from django.db import models
 from django.contrib.auth.models import User
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+
+from .geo import geocode, geohash
+from .storage import get_content_storage
 
 
 class JobPosting(models.Model):
@@ -140,14 +150,55 @@ class JobPosting(models.Model):
         help_text="Job status"
     )
     
+    date_updated = models.DateTimeField(auto_now=True, null=True, blank=True, help_text="Date the job was last modified")
+    
+    # Full-text search document, maintained by jobs.signals (see jobs.search.JOB_SEARCH_VECTOR)
+    search_vector = SearchVectorField(null=True, blank=True, editable=False)
+    
+    # work_location geocoded against the bundled gazetteer on save (jobs.geo)
+    latitude = models.FloatField(null=True, blank=True, editable=False)
+    longitude = models.FloatField(null=True, blank=True, editable=False)
+    geohash = models.CharField(max_length=12, blank=True, db_index=True, editable=False)
+    
     class Meta:
         db_table = 'job_posting'
         ordering = ['-date_posted']
+        indexes = [
+            # Serves the keyset-paginated listing: ORDER BY date_posted DESC, id DESC
+            models.Index(fields=['-date_posted', '-id'], name='job_posting_date_id_idx'),
+            GinIndex(fields=['search_vector'], name='job_posting_search_idx'),
+            # Incremental refresh of in-process indexes (jobs.recommend)
+            models.Index(fields=['date_updated'], name='job_posting_updated_idx'),
+            # Deadline sweep (jobs.deadlines): only open postings are ever scanned
+            models.Index(
+                fields=['application_deadline'],
+                condition=models.Q(job_status='open'),
+                name='job_posting_open_deadline_idx',
+            ),
+        ]
         verbose_name = 'Job Posting'
         verbose_name_plural = 'Job Postings'
     
     def __str__(self):
         return f"{self.job_title} - {self.department}"
+    
+    def geocode_location(self):
+        """Set latitude/longitude/geohash from work_location (cleared if no known place is named)"""
+        point = geocode(self.work_location)
+        if point:
+            self.latitude, self.longitude = point
+            self.geohash = geohash(*point)
+        else:
+            self.latitude = self.longitude = None
+            self.geohash = ''
+    
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'work_location' in update_fields:
+            self.geocode_location()
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'latitude', 'longitude', 'geohash'}
+        super().save(*args, **kwargs)
 
 
 class JobApplication(models.Model):
@@ -166,7 +217,13 @@ class JobApplication(models.Model):
     freelancer_id = models.IntegerField(help_text="Foreign key to freelancer_profile.id")
     
     # Column 4: resume (store uploaded resume file)
-    resume = models.FileField(upload_to='resumes/', blank=True, null=True, help_text="Resume file upload")
+    resume = models.FileField(
+        upload_to='resumes/',
+        storage=get_content_storage,
+        blank=True,
+        null=True,
+        help_text="Resume file upload (content-addressed; identical files share one blob)"
+    )
     
     # Column 5: cover_letter
     cover_letter = models.TextField(help_text="Cover letter submitted by freelancer")
@@ -278,6 +335,11 @@ class JobInterview(models.Model):
         help_text="Scheduled date and time for the interview"
     )
     
+    duration_minutes = models.PositiveIntegerField(
+        default=60,
+        help_text="Length of the interview in minutes (used for conflict detection)"
+    )
+    
     # Column 4: interview_mode
     interview_mode = models.CharField(
         max_length=20,
@@ -347,6 +409,11 @@ class JobInterview(models.Model):
     class Meta:
         db_table = 'job_interview'
         ordering = ['-interview_date']
+        indexes = [
+            # Overlap checks and availability scans per participant (jobs.scheduling)
+            models.Index(fields=['freelancer_id', 'interview_date'], name='job_interview_freelancer_idx'),
+            models.Index(fields=['job', 'interview_date'], name='job_interview_job_date_idx'),
+        ]
         verbose_name = 'Job Interview'
         verbose_name_plural = 'Job Interviews'
     
@@ -396,8 +463,25 @@ class JobOffer(models.Model):
     )
     
     # Column 4: offer_details
-    offer_details = models.TextField(
-        help_text="Detailed offer (salary, benefits, etc.)"
+    offer_details = models.JSONField(
+        default=dict,
+        help_text="Detailed offer (salary, start_date, benefits, etc.)"
+    )
+    
+    # Extracted from offer_details on save so offers can be filtered and sorted in SQL
+    salary = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="offer_details['salary'], extracted"
+    )
+    start_date = models.DateField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="offer_details['start_date'], extracted"
     )
     
     # Column 5: date_offered
@@ -421,18 +505,46 @@ class JobOffer(models.Model):
     )
     
     # Column 8: multi_doc
-    multi_doc = models.FileField(upload_to='multi_doc/', blank=True, null=True)
+    multi_doc = models.FileField(upload_to='multi_doc/', storage=get_content_storage, blank=True, null=True)
     
     
     class Meta:
         db_table = 'job_offer'
         ordering = ['-date_offered']
+        indexes = [
+            models.Index(fields=['offer_status', '-date_offered', '-id'], name='job_offer_status_date_idx'),
+            models.Index(fields=['salary'], name='job_offer_salary_idx'),
+            models.Index(fields=['start_date'], name='job_offer_start_date_idx'),
+            # Containment queries on the raw document, e.g. offer_details__contains={"benefits": [...]}
+            GinIndex(fields=['offer_details'], opclasses=['jsonb_path_ops'], name='job_offer_details_gin'),
+        ]
         verbose_name = 'Job Offer'
         verbose_name_plural = 'Job Offers'
     
     def __str__(self):
         return f"Offer for Application {self.application.id} - {self.offer_status}"
     
+    def extract_offer_fields(self):
+        """Copy salary and start_date out of offer_details (None when missing or malformed)"""
+        details = self.offer_details if isinstance(self.offer_details, dict) else {}
+        try:
+            self.salary = Decimal(str(details['salary'])).quantize(Decimal('0.01'))
+            if not self.salary.is_finite() or abs(self.salary) >= 10 ** 10:
+                self.salary = None
+        except (KeyError, InvalidOperation, TypeError):
+            self.salary = None
+        try:
+            self.start_date = date.fromisoformat(str(details['start_date']))
+        except (KeyError, ValueError):
+            self.start_date = None
+    
+    def save(self, *args, **kwargs):
+        self.extract_offer_fields()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'offer_details' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'salary', 'start_date'}
+        super().save(*args, **kwargs)
+    
     @property
     def is_pending(self):
         """Check if the offer is pending"""
@@ -480,4 +592,310 @@ class ApplicationWithdrawal(models.Model):
         verbose_name_plural = 'Application Withdrawals'
     
     def __str__(self):
-        return f"Withdrawal for Application {self.application.id} - {self.withdrawal_date.strftime('%Y-%m-%d')}"
\ No newline at end of file
+        return f"Withdrawal for Application {self.application.id} - {self.withdrawal_date.strftime('%Y-%m-%d')}"
+
+class JobPipelineStats(models.Model):
+    """
+    Denormalized per-job counts of applications, interviews and offers by status.
+    Maintained incrementally by jobs.stats; rebuild with `manage.py rebuild_job_stats`.
+    Run that once right after the table is created, so jobs with existing
+    applications start from their real counts instead of 0.
+    """
+    
+    job = models.OneToOneField(
+        JobPosting,
+        on_delete=models.CASCADE,
+        related_name='pipeline_stats',
+        primary_key=True,
+        help_text="Foreign key to job_posting.id"
+    )
+    
+    # Applications by status
+    applications_pending = models.PositiveIntegerField(default=0)
+    applications_accepted = models.PositiveIntegerField(default=0)
+    applications_rejected = models.PositiveIntegerField(default=0)
+    applications_saved = models.PositiveIntegerField(default=0, help_text="Applications in 'Save for Later'")
+    applications_withdrawn = models.PositiveIntegerField(default=0)
+    
+    # Interviews by status
+    interviews_scheduled = models.PositiveIntegerField(default=0)
+    interviews_completed = models.PositiveIntegerField(default=0)
+    interviews_cancelled = models.PositiveIntegerField(default=0)
+    interviews_rescheduled = models.PositiveIntegerField(default=0)
+    interviews_no_show = models.PositiveIntegerField(default=0)
+    
+    # Offers by status
+    offers_pending = models.PositiveIntegerField(default=0)
+    offers_accepted = models.PositiveIntegerField(default=0)
+    offers_rejected = models.PositiveIntegerField(default=0)
+    offers_withdrawn = models.PositiveIntegerField(default=0)
+    
+    date_updated = models.DateTimeField(auto_now=True, help_text="Last time any counter changed")
+    
+    class Meta:
+        db_table = 'job_pipeline_stats'
+        verbose_name = 'Job Pipeline Stats'
+        verbose_name_plural = 'Job Pipeline Stats'
+    
+    def __str__(self):
+        return f"Pipeline stats for Job {self.job_id}"
+
+
+class UploadSession(models.Model):
+    """
+    Resumable chunked upload of a document (resume, offer document).
+    Chunks are appended to a partial file; on completion the file is hashed and
+    moved into content-addressed storage and `blob` names the stored file.
+    """
+    
+    STATUS_CHOICES = [
+        ('active', 'Active'),
+        ('complete', 'Complete'),
+    ]
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    
+    user = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True, related_name='upload_sessions')
+    
+    filename = models.CharField(max_length=255, help_text="Original client file name")
+    
+    total_size = models.BigIntegerField(help_text="Declared file size in bytes")
+    
+    received = models.BigIntegerField(default=0, help_text="Bytes stored so far (the offset to resume from)")
+    
+    sha256 = models.CharField(max_length=64, blank=True, help_text="Expected digest from the client, then the verified digest")
+    
+    blob = models.CharField(max_length=100, blank=True, help_text="Storage name once complete")
+    
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='active')
+    
+    date_created = models.DateTimeField(auto_now_add=True)
+    date_updated = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'job_upload_session'
+        ordering = ['-date_created']
+        verbose_name = 'Upload Session'
+        verbose_name_plural = 'Upload Sessions'
+    
+    def __str__(self):
+        return f"Upload {self.id} - {self.filename} ({self.status})"
+
+
+class ResumeDocument(models.Model):
+    """
+    Extracted, searchable text of a stored resume. Keyed by storage name, so a
+    resume shared by many applications (content-addressed) is extracted once.
+    Filled off the request path by `manage.py extract_resumes`.
+    """
+    
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ]
+    
+    blob = models.CharField(max_length=100, primary_key=True, help_text="Storage name of the resume file")
+    
+    text = models.TextField(blank=True, help_text="Normalized plain text")
+    
+    search_vector = SearchVectorField(null=True, blank=True, editable=False)
+    
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    
+    error = models.TextField(blank=True, help_text="Why extraction failed")
+    
+    date_created = models.DateTimeField(auto_now_add=True)
+    date_extracted = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        db_table = 'job_resume_document'
+        indexes = [
+            GinIndex(fields=['search_vector'], name='job_resume_search_idx'),
+            models.Index(fields=['status', 'date_created'], name='job_resume_status_idx'),
+        ]
+        verbose_name = 'Resume Document'
+        verbose_name_plural = 'Resume Documents'
+    
+    def __str__(self):
+        return f"Resume text {self.blob} ({self.status})"
+
+
+class ViewCounter(models.Model):
+    """
+    View (detail page) and impression (listing) counts for job postings and projects.
+    Written in aggregated batches by jobs.counters, never per request.
+    """
+    
+    TARGET_CHOICES = [
+        ('job_posting', 'Job Posting'),
+        ('project', 'Project'),
+    ]
+    
+    target_type = models.CharField(max_length=20, choices=TARGET_CHOICES)
+    
+    object_id = models.BigIntegerField(help_text="id of the job posting or project")
+    
+    views = models.BigIntegerField(default=0)
+    impressions = models.BigIntegerField(default=0)
+    
+    date_updated = models.DateTimeField(auto_now=True, help_text="Last flush that touched this row")
+    
+    class Meta:
+        db_table = 'view_counter'
+        constraints = [
+            models.UniqueConstraint(fields=['target_type', 'object_id'], name='view_counter_target_uniq'),
+        ]
+        verbose_name = 'View Counter'
+        verbose_name_plural = 'View Counters'
+    
+    def __str__(self):
+        return f"{self.target_type} {self.object_id}: {self.views} views"
+
+
+class ArchivedJobPosting(models.Model):
+    """
+    Closed/filled posting moved out of the live tables by jobs.archive.
+    `data` holds the posting row and its applications (with interviews, offers
+    and withdrawal) as they were when archived; the original ids are kept.
+    """
+    
+    job_id = models.BigIntegerField(primary_key=True, help_text="Original job_posting.id")
+    
+    job_provider_id = models.BigIntegerField(null=True, blank=True, help_text="Original job_provider_id")
+    
+    job_title = models.CharField(max_length=255)
+    
+    job_status = models.CharField(max_length=20)
+    
+    date_posted = models.DateTimeField(null=True, blank=True)
+    
+    date_archived = models.DateTimeField(auto_now_add=True)
+    
+    application_count = models.PositiveIntegerField(default=0)
+    
+    data = models.JSONField(help_text="Snapshot of the posting and all of its child rows")
+    
+    class Meta:
+        db_table = 'job_posting_archive'
+        ordering = ['-date_posted']
+        indexes = [
+            models.Index(fields=['job_provider_id', '-date_posted', '-job_id'], name='job_archive_provider_idx'),
+        ]
+        verbose_name = 'Archived Job Posting'
+        verbose_name_plural = 'Archived Job Postings'
+    
+    def __str__(self):
+        return f"Archived {self.job_title} ({self.job_id})"
+
+
+class JobPostingSignature(models.Model):
+    """
+    MinHash signature of a posting's text and its LSH band keys (jobs.dedupe).
+    The GIN index on bands finds postings sharing a band without a table scan.
+    """
+    
+    job = models.OneToOneField(
+        JobPosting,
+        on_delete=models.CASCADE,
+        related_name='signature',
+        primary_key=True,
+        help_text="Foreign key to job_posting.id"
+    )
+    
+    minhash = ArrayField(models.BigIntegerField(), help_text="MinHash values, one per permutation")
+    
+    bands = ArrayField(models.BigIntegerField(), help_text="LSH bucket key per band")
+    
+    cluster_id = models.BigIntegerField(
+        null=True,
+        blank=True,
+        db_index=True,
+        help_text="Lowest job id of the near-duplicate cluster (set by `manage.py cluster_duplicate_jobs`)"
+    )
+    
+    date_computed = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'job_posting_signature'
+        indexes = [
+            GinIndex(fields=['bands'], name='job_signature_bands_idx'),
+        ]
+        verbose_name = 'Job Posting Signature'
+        verbose_name_plural = 'Job Posting Signatures'
+    
+    def __str__(self):
+        return f"Signature for Job {self.job_id}"
+
+
+class SavedJobSearch(models.Model):
+    """
+    A freelancer's saved job search. New and updated postings are matched against
+    it by jobs.alerts; `index_term` is the one term every matching posting must
+    contain, so a posting only has to be checked against searches indexed under its terms.
+    """
+    
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='saved_job_searches')
+    
+    name = models.CharField(max_length=100, blank=True)
+    
+    keywords = models.CharField(max_length=255, blank=True, help_text="All words must appear in the posting")
+    
+    job_category = models.CharField(max_length=100, blank=True)
+    
+    job_type = models.CharField(max_length=50, blank=True)
+    
+    work_mode = models.CharField(max_length=20, blank=True)
+    
+    min_salary = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        blank=True,
+        null=True,
+        help_text="Salary floor compared with the posting's salary_to (or salary_from)"
+    )
+    
+    index_term = models.CharField(max_length=120, db_index=True, editable=False)
+    
+    is_active = models.BooleanField(default=True)
+    
+    date_created = models.DateTimeField(auto_now_add=True)
+    date_updated = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'saved_job_search'
+        ordering = ['-date_created']
+        verbose_name = 'Saved Job Search'
+        verbose_name_plural = 'Saved Job Searches'
+    
+    def __str__(self):
+        return f"{self.user_id} - {self.name or self.keywords or self.index_term}"
+
+
+class SavedSearchMatch(models.Model):
+    """
+    A posting that matched a saved search; `notified_at` is set once it went out in a digest
+    """
+    
+    search = models.ForeignKey(SavedJobSearch, on_delete=models.CASCADE, related_name='matches')
+    
+    job = models.ForeignKey(JobPosting, on_delete=models.CASCADE, related_name='search_matches')
+    
+    date_matched = models.DateTimeField(auto_now_add=True)
+    
+    notified_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        db_table = 'saved_search_match'
+        ordering = ['-date_matched']
+        constraints = [
+            models.UniqueConstraint(fields=['search', 'job'], name='saved_search_match_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['notified_at', 'search'], name='saved_search_match_pending_idx'),
+        ]
+        verbose_name = 'Saved Search Match'
+        verbose_name_plural = 'Saved Search Matches'
+    
+    def __str__(self):
+        return f"Search {self.search_id} - Job {self.job_id}"
@@ -0,0 +1,85 @@
+import base64
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursor(ValueError):
+    """Raised when a client sends a cursor we did not issue"""
+
+
+def get_page_size(request, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    """Read ?limit= from the request, clamped to [1, maximum]"""
+    try:
+        limit = int(request.query_params.get('limit', default))
+    except (TypeError, ValueError):
+        limit = default
+    return max(1, min(limit, maximum))
+
+
+def encode_cursor(values):
+    """Encode the keyset values of the last row on a page as an opaque token"""
+    raw = json.dumps([v.isoformat() if hasattr(v, 'isoformat') else v for v in values], default=str)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Decode a token produced by encode_cursor back into its keyset values"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (ValueError, TypeError):
+        raise InvalidCursor(cursor)
+    if not isinstance(values, list):
+        raise InvalidCursor(cursor)
+    return values
+
+
+def _after(fields, values, descending):
+    """Build the keyset predicate (a, b, ...) < (va, vb, ...) for the given direction"""
+    op = 'lt' if descending else 'gt'
+    condition = Q()
+    for i, field in enumerate(fields):
+        term = Q(**{f'{field}__{op}': values[i]})
+        for prev_field, prev_value in zip(fields[:i], values[:i]):
+            term &= Q(**{prev_field: prev_value})
+        condition |= term
+    return condition
+
+
+def keyset_paginate(queryset, request, fields, descending=True, page_size=None):
+    """
+    Slice one page out of queryset using keyset (seek) pagination on fields.
+
+    fields must end with a unique column (usually 'id') so the ordering is total.
+    Returns (rows, next_cursor); next_cursor is None on the last page.
+    Raises InvalidCursor for a malformed ?cursor= value.
+    """
+    limit = page_size or get_page_size(request)
+    prefix = '-' if descending else ''
+    queryset = queryset.order_by(*[prefix + f for f in fields])
+
+    cursor = request.query_params.get('cursor')
+    if cursor:
+        values = decode_cursor(cursor)
+        if len(values) != len(fields):
+            raise InvalidCursor(cursor)
+        try:
+            queryset = queryset.filter(_after(fields, values, descending))
+        except (ValidationError, ValueError, TypeError):
+            raise InvalidCursor(cursor)
+
+    rows = list(queryset[:limit + 1])
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor([
+            last[f] if isinstance(last, dict) else getattr(last, f) for f in fields
+        ])
+    return rows, next_cursor
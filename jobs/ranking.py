@@ -0,0 +1,147 @@
+import math
+from collections import Counter
+
+from django.core.cache import cache
+from django.db.models import Count, Max
+
+from .caching import generation, job_detail_version, new_generations
+from .models import JobApplication
+from .recommend import EXPERIENCE_TERMS, posting_terms, profile_terms, tokenize
+
+
+# Component weights of the 0-100 fit score
+SCORE_WEIGHTS = {
+    'skills': 0.55,
+    'experience': 0.15,
+    'language': 0.10,
+    'rate': 0.20,
+}
+
+# Neutral component value when the posting or applicant gives nothing to compare
+NEUTRAL = 0.5
+
+APPLICANT_SCORES_CACHE_TTL = 30 * 60
+
+
+def _profiles_version_key(job_id):
+    return f'job_applicant_profiles_version:{job_id}'
+
+
+def invalidate_applicant_scores(job_ids):
+    """Drop cached scores for these postings (call when one of their applicants' profiles changes)"""
+    new_generations(_profiles_version_key(job_id) for job_id in job_ids)
+
+
+def applications_version(job_id):
+    """
+    Version of a posting's applicant pool from the database (count and latest
+    date_applied), so an application created or deleted by any process changes it.
+    """
+    state = JobApplication.objects.filter(job_id=job_id).aggregate(n=Count('id'), latest=Max('date_applied'))
+    return f"{state['n']}-{job_detail_version(state['latest'])}"
+
+
+def _posting_level(job):
+    """Experience level a posting asks for, inferred from its title and qualifications"""
+    words = set(tokenize(' '.join(filter(None, (job.job_title, job.required_qualifications)))))
+    for level in ('senior', 'beginner', 'mid'):
+        if words & set(tokenize(EXPERIENCE_TERMS[level])):
+            return level
+    return None
+
+
+def _experience_score(job_level, profile):
+    if job_level is None or profile is None or not profile.experience_level:
+        return NEUTRAL
+    order = ('beginner', 'mid', 'senior')
+    if profile.experience_level not in order:
+        return NEUTRAL
+    gap = order.index(profile.experience_level) - order.index(job_level)
+    # Over-qualified is a softer miss than under-qualified
+    return 1.0 if gap == 0 else (0.6 if gap > 0 else 0.2 / -gap)
+
+
+def _language_score(required, profile):
+    if not required:
+        return NEUTRAL
+    if profile is None or not profile.language:
+        return 0.0
+    return 1.0 if profile.language in required else 0.0
+
+
+def _rate_score(expected_rate, salary_from, salary_to):
+    """1.0 inside the posting's range, decaying with how far the ask exceeds salary_to"""
+    if expected_rate is None or (salary_from is None and salary_to is None):
+        return NEUTRAL
+    rate = float(expected_rate)
+    ceiling = float(salary_to if salary_to is not None else salary_from)
+    if rate <= ceiling:
+        return 1.0
+    return max(0.0, ceiling / rate) ** 2 if rate > 0 else 1.0
+
+
+def score_applicants(job, applicants):
+    """
+    Score every applicant of a posting in one pass.
+
+    applicants: iterable of (application, FreelancerProfile or None).
+    Skill fit is a cosine similarity between the posting's term vector and each
+    applicant's profile + cover letter terms, with idf taken over this applicant
+    pool (a term every applicant shares separates nobody). Returns
+    {application_id: {"score": 0-100, "breakdown": {component: 0-1}}}.
+    """
+    job_vector = posting_terms(job)
+    job_level = _posting_level(job)
+    required_languages = set(tokenize(job.languages_required))
+
+    applicant_terms = {}
+    for application, profile in applicants:
+        weights = profile_terms(profile) if profile is not None else Counter()
+        for term in tokenize(application.cover_letter):
+            weights[term] += 1
+        applicant_terms[application.id] = (application, profile, weights)
+
+    # Document frequency over the pool, restricted to terms the posting cares about
+    pool = len(applicant_terms) or 1
+    df = Counter()
+    for _app, _profile, weights in applicant_terms.values():
+        df.update(term for term in weights if term in job_vector)
+    idf = {term: math.log((1 + pool) / (1 + df[term])) + 1 for term in job_vector}
+    job_weights = {term: tf * idf[term] for term, tf in job_vector.items()}
+    job_norm = math.sqrt(sum(w * w for w in job_weights.values())) or 1.0
+
+    scores = {}
+    for app_id, (application, profile, weights) in applicant_terms.items():
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        dot = sum(job_weights[t] * w for t, w in weights.items() if t in job_weights)
+        breakdown = {
+            'skills': dot / (job_norm * norm),
+            'experience': _experience_score(job_level, profile),
+            'language': _language_score(required_languages, profile),
+            'rate': _rate_score(application.expected_rate, job.salary_from, job.salary_to),
+        }
+        total = sum(SCORE_WEIGHTS[k] * v for k, v in breakdown.items())
+        scores[app_id] = {
+            "score": round(100 * total, 1),
+            "breakdown": {k: round(v, 3) for k, v in breakdown.items()},
+        }
+    return scores
+
+
+def get_applicant_scores(job, load_applicants):
+    """
+    score_applicants() over the posting's whole applicant pool, cached until the
+    posting (its date_updated) or its set of applications changes, or an
+    applicant's profile is edited. load_applicants() is only called on a miss.
+    """
+    key = 'applicant_scores:{}:{}:{}:{}'.format(
+        job.id,
+        job_detail_version(job.date_updated or job.date_posted),
+        applications_version(job.id),
+        generation(_profiles_version_key(job.id)),
+    )
+    scores = cache.get(key)
+    if scores is None:
+        scores = score_applicants(job, load_applicants())
+        cache.set(key, scores, APPLICANT_SCORES_CACHE_TTL)
+    return scores
@@ -0,0 +1,246 @@
+import heapq
+import logging
+import math
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import timedelta
+
+from django.db import close_old_connections
+from django.utils import timezone
+
+from .models import JobPosting
+
+
+logger = logging.getLogger(__name__)
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or our the to we will with
+you your this that who work working job role team years year experience ability strong
+""".split())
+
+# Text fed into each posting's document, with a term-frequency multiplier
+POSTING_TEXT_FIELDS = (
+    ('job_title', 3),
+    ('job_category', 2),
+    ('department', 1),
+    ('role_overview', 1),
+    ('key_responsibilities', 1),
+    ('required_qualifications', 1),
+    ('preferred_qualifications', 1),
+    ('languages_required', 1),
+)
+
+# FreelancerProfile choice values expanded into the words postings actually use
+SPECIALIZATION_TERMS = {
+    'web-dev': 'web development developer frontend backend',
+    'design': 'design designer ui ux',
+    'marketing': 'marketing seo campaigns',
+}
+EXPERIENCE_TERMS = {
+    'beginner': 'junior entry graduate intern',
+    'mid': 'mid intermediate',
+    'senior': 'senior lead principal',
+}
+
+# Seconds between incremental refreshes of a process's index
+REFRESH_INTERVAL = 5
+
+# Re-read this much history on each refresh so rows committed late by
+# long transactions are not skipped (re-adding a posting is idempotent)
+SYNC_OVERLAP = timedelta(minutes=2)
+
+# Postings read per database round trip, and applied per hold of the index lock
+REFRESH_CHUNK_SIZE = 2000
+
+# Candidates scored per requested result, so postings deleted or closed by other
+# processes (only dropped when a ranking finds them gone) don't leave pages short
+CANDIDATE_OVERFETCH = 2
+
+
+def tokenize(text):
+    if not text:
+        return []
+    return [t for t in TOKEN_RE.findall(text.lower()) if t not in STOPWORDS and len(t) > 1]
+
+
+def posting_terms(job):
+    """Length-normalized term frequencies for a posting"""
+    tf = Counter()
+    for field, boost in POSTING_TEXT_FIELDS:
+        for term in tokenize(getattr(job, field, None)):
+            tf[term] += boost
+    norm = math.sqrt(sum(n * n for n in tf.values())) or 1.0
+    return {term: n / norm for term, n in tf.items()}
+
+
+def profile_terms(profile):
+    """Weighted query terms for a FreelancerProfile"""
+    weights = Counter()
+    for skill in (profile.skills or '').split(','):
+        for term in tokenize(skill):
+            weights[term] += 3
+    for term in tokenize(profile.professional_title):
+        weights[term] += 2
+    for term in tokenize(SPECIALIZATION_TERMS.get(profile.specialization, profile.specialization)):
+        weights[term] += 2
+    for term in tokenize(EXPERIENCE_TERMS.get(profile.experience_level, profile.experience_level)):
+        weights[term] += 1
+    for term in tokenize(profile.language):
+        weights[term] += 1
+    return weights
+
+
+class JobRecommender:
+    """
+    In-process TF-IDF index over open job postings.
+
+    Postings are kept as an inverted index (term -> {job_id: normalized tf}), so
+    scoring a profile only touches postings that share at least one term with it.
+    The index is built once per process in a background thread and then refreshed
+    incrementally from JobPosting.date_updated; postings that leave the 'open'
+    state are dropped. Requests always score whatever is already indexed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()            # guards the index structures
+        self._refresh_lock = threading.Lock()    # one refresh at a time; others keep serving
+        self._index = defaultdict(dict)     # term -> {job_id: tf}
+        self._doc_terms = {}                # job_id -> terms, for removal
+        self._synced_at = None
+        self._checked_at = 0.0
+        self._warmer = None
+
+    # ----- maintenance -----
+
+    def _remove(self, job_id):
+        for term in self._doc_terms.pop(job_id, ()):
+            postings = self._index.get(term)
+            if postings is not None:
+                postings.pop(job_id, None)
+                if not postings:
+                    del self._index[term]
+
+    def _add(self, job_id, terms):
+        """Index a posting's terms; None (a posting that is no longer open) just removes it"""
+        self._remove(job_id)
+        if terms is None:
+            return
+        for term, weight in terms.items():
+            self._index[term][job_id] = weight
+        self._doc_terms[job_id] = tuple(terms)
+
+    def discard(self, job_id):
+        """Drop a posting immediately (e.g. on delete in this process)"""
+        with self._lock:
+            self._remove(job_id)
+
+    def _changed_postings(self, queryset):
+        """(job_id, terms or None) for each row; tokenizing happens here, outside the index lock"""
+        fields = [f for f, _boost in POSTING_TEXT_FIELDS] + ['id', 'job_status']
+        for job in queryset.only(*fields).iterator(chunk_size=REFRESH_CHUNK_SIZE):
+            yield job.id, posting_terms(job) if job.job_status == 'open' else None
+
+    def _build(self):
+        """Index every open posting into fresh structures, then swap them in at once"""
+        fresh = JobRecommender()
+        started = timezone.now()
+        for job_id, terms in self._changed_postings(JobPosting.objects.filter(job_status='open')):
+            fresh._add(job_id, terms)
+        with self._lock:
+            self._index, self._doc_terms = fresh._index, fresh._doc_terms
+        return started
+
+    def _update(self):
+        """Apply postings changed since the last sync, a chunk per lock hold"""
+        started = timezone.now()
+        # date_updated is set by save() and by the bulk status updates
+        changed = JobPosting.objects.filter(date_updated__gte=self._synced_at - SYNC_OVERLAP)
+        batch = []
+        for item in self._changed_postings(changed):
+            batch.append(item)
+            if len(batch) >= REFRESH_CHUNK_SIZE:
+                self._apply(batch)
+                batch = []
+        self._apply(batch)
+        return started
+
+    def _apply(self, batch):
+        with self._lock:
+            for job_id, terms in batch:
+                self._add(job_id, terms)
+
+    def refresh(self, force=False):
+        """
+        Pull postings changed since the last sync (all open postings the first time).
+        Scoring carries on meanwhile; a caller that finds another refresh running
+        returns at once unless force is set.
+        """
+        now = time.monotonic()
+        if not force and now - self._checked_at < REFRESH_INTERVAL:
+            return
+        if not self._refresh_lock.acquire(blocking=force):
+            return
+        try:
+            self._synced_at = self._build() if self._synced_at is None else self._update()
+            self._checked_at = now
+        finally:
+            self._refresh_lock.release()
+
+    def warm(self):
+        """Start the initial build in a background thread (once per process)"""
+        with self._lock:
+            if self._warmer is not None:
+                return
+            self._warmer = threading.Thread(target=self._warm, name='job-recommender-warmup', daemon=True)
+            self._warmer.start()
+
+    def _warm(self):
+        close_old_connections()
+        try:
+            self.refresh(force=True)
+        except Exception:
+            logger.exception("Job recommender warm-up failed; retrying on the next request")
+            self._warmer = None
+        finally:
+            close_old_connections()
+
+    # ----- scoring -----
+
+    def score(self, query_weights, limit=20, exclude=()):
+        """
+        Return [(job_id, score)] for the best `limit` postings.
+
+        Score is sum over shared terms of query weight * idf^2 * normalized tf,
+        i.e. a TF-IDF dot product with idf applied on both sides.
+        """
+        if self._synced_at is None:
+            # Never build inline: the first request of a process would block for seconds
+            self.warm()
+        else:
+            self.refresh()
+        exclude = set(exclude)
+        with self._lock:
+            total = len(self._doc_terms) or 1
+            scores = defaultdict(float)
+            for term, weight in query_weights.items():
+                postings = self._index.get(term)
+                if not postings:
+                    continue
+                idf = math.log((1 + total) / (1 + len(postings))) + 1
+                factor = weight * idf * idf
+                for job_id, tf in postings.items():
+                    scores[job_id] += factor * tf
+            best = heapq.nlargest(limit, ((s, job_id) for job_id, s in scores.items() if job_id not in exclude))
+        return [(job_id, s) for s, job_id in best]
+
+
+recommender = JobRecommender()
+
+
+def recommend_jobs(profile, limit=20, exclude=()):
+    """Rank open postings for a FreelancerProfile; returns [(job_id, score)]"""
+    return recommender.score(profile_terms(profile), limit=limit, exclude=exclude)
@@ -0,0 +1,148 @@
+import os
+import re
+import unicodedata
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from xml.etree import ElementTree
+
+from django.contrib.postgres.search import SearchVector
+from django.db.models import F
+from django.utils import timezone
+
+from .models import ResumeDocument
+from .search import SEARCH_CONFIG
+from .storage import content_storage
+
+
+# Stored text is capped; ranking gains nothing from the tail of very long documents
+MAX_RESUME_CHARS = 100_000
+
+EXTRACT_BATCH_SIZE = 50
+
+_WORD_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_CONTROL_CHARS = re.compile(r'[\x00-\x08\x0b-\x1f\x7f]')
+_WHITESPACE = re.compile(r'\s+')
+
+
+class ExtractionError(Exception):
+    pass
+
+
+def normalize_text(text):
+    """NFKC-normalize, drop control characters and collapse whitespace"""
+    text = unicodedata.normalize('NFKC', text)
+    text = _CONTROL_CHARS.sub(' ', text)
+    return _WHITESPACE.sub(' ', text).strip()[:MAX_RESUME_CHARS]
+
+
+def _pdf_text(path):
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        raise ExtractionError("pypdf is required to extract PDF resumes")
+    try:
+        reader = PdfReader(path)
+        return '\n'.join(page.extract_text() or '' for page in reader.pages)
+    except Exception as e:
+        raise ExtractionError(f"Unreadable PDF: {e}")
+
+
+def _docx_text(path):
+    try:
+        with zipfile.ZipFile(path) as archive:
+            root = ElementTree.fromstring(archive.read('word/document.xml'))
+    except (zipfile.BadZipFile, KeyError, ElementTree.ParseError) as e:
+        raise ExtractionError(f"Unreadable DOCX: {e}")
+    paragraphs = []
+    for paragraph in root.iter(f'{_WORD_NS}p'):
+        paragraphs.append(''.join(node.text or '' for node in paragraph.iter(f'{_WORD_NS}t')))
+    return '\n'.join(paragraphs)
+
+
+def _plain_text(path):
+    with open(path, 'rb') as f:
+        return f.read(MAX_RESUME_CHARS * 4).decode('utf-8', errors='replace')
+
+
+EXTRACTORS = {
+    '.pdf': _pdf_text,
+    '.docx': _docx_text,
+    '.txt': _plain_text,
+}
+
+
+def extract_text(path):
+    """Plain, normalized text of a resume file; raises ExtractionError"""
+    ext = os.path.splitext(path)[1].lower()
+    extractor = EXTRACTORS.get(ext)
+    if extractor is None:
+        raise ExtractionError(f"Unsupported resume type '{ext}'")
+    return normalize_text(extractor(path))
+
+
+def _extract_worker(job):
+    """
+    Process-pool entry point: (blob, path) -> (blob, text, error).
+
+    Never raises: any failure (corrupt or encrypted archives, unsupported
+    compression, parser bugs) marks only this file failed, so one bad upload
+    cannot abort its batch and leave the queue stuck on it.
+    """
+    blob, path = job
+    try:
+        return blob, extract_text(path), ''
+    except ExtractionError as e:
+        return blob, '', str(e)
+    except OSError as e:
+        return blob, '', f"Cannot read file: {e}"
+    except Exception as e:
+        return blob, '', f"Extraction failed: {type(e).__name__}: {e}"
+
+
+def queue_resumes(names):
+    """Register stored resumes for extraction (one INSERT; known blobs are ignored)"""
+    names = {name for name in names if name}
+    if names:
+        ResumeDocument.objects.bulk_create(
+            [ResumeDocument(blob=name) for name in names],
+            ignore_conflicts=True,
+        )
+
+
+def _save_results(results):
+    now = timezone.now()
+    done, failed = [], []
+    for blob, text, error in results:
+        doc = ResumeDocument(blob=blob, text=text, error=error, date_extracted=now,
+                             status='failed' if error else 'done')
+        (failed if error else done).append(doc)
+    ResumeDocument.objects.bulk_update(done + failed, ['text', 'error', 'status', 'date_extracted'])
+    if done:
+        ResumeDocument.objects.filter(blob__in=[d.blob for d in done]).update(
+            search_vector=SearchVector(F('text'), config=SEARCH_CONFIG)
+        )
+    return len(done), len(failed)
+
+
+def process_pending(workers=None, batch_size=EXTRACT_BATCH_SIZE, limit=None):
+    """
+    Extract every pending resume in a pool of worker processes.
+
+    Parsing is CPU-bound and runs in the pool; this process only claims
+    batches and writes the results. Returns (extracted, failed).
+    """
+    extracted = failed = 0
+    if not ResumeDocument.objects.filter(status='pending').exists():
+        return extracted, failed
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while limit is None or extracted + failed < limit:
+            size = batch_size if limit is None else min(batch_size, limit - extracted - failed)
+            blobs = list(ResumeDocument.objects.filter(status='pending').order_by('date_created')
+                         .values_list('blob', flat=True)[:size])
+            if not blobs:
+                break
+            jobs = [(blob, content_storage.path(blob)) for blob in blobs]
+            done, bad = _save_results(pool.map(_extract_worker, jobs))
+            extracted += done
+            failed += bad
+    return extracted, failed
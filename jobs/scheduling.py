@@ -0,0 +1,147 @@
+from datetime import datetime, time, timedelta
+
+from django.db import connection
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import JobApplication, JobInterview, JobPosting
+
+
+# Interviews that still occupy their slot
+ACTIVE_INTERVIEW_STATUSES = ('Scheduled', 'Rescheduled')
+
+MIN_INTERVIEW_MINUTES = 5
+MAX_INTERVIEW_MINUTES = 480
+
+# Longest window the availability endpoint will expand into slots
+MAX_AVAILABILITY_DAYS = 31
+
+# First key of the pg_advisory_xact_lock(int, int) pair that serializes one freelancer's bookings
+FREELANCER_SCHEDULE_LOCK = 0x1f7e
+
+
+def lock_schedules(job_id, freelancer_id):
+    """
+    Serialize bookings for the job and the freelancer until the transaction ends,
+    so two concurrent requests can't both pass the overlap check. The job row is
+    locked; a freelancer's interviews span jobs of different providers and have
+    no row of their own to lock, so they get a transaction-level advisory lock.
+    Always job first, then freelancer, so lock order is the same everywhere.
+    """
+    JobPosting.objects.select_for_update().only('id').get(id=job_id)
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT pg_advisory_xact_lock(%s, %s)', [FREELANCER_SCHEDULE_LOCK, freelancer_id])
+
+
+def can_view_availability(user, job_id=None, freelancer_id=None):
+    """
+    Booked time is private: a job's to its provider and applicants, a freelancer's
+    to themselves and to providers they have applied to.
+    """
+    if job_id is not None and not (
+        JobPosting.objects.filter(id=job_id, job_provider__user_id=user.id).exists()
+        or JobApplication.objects.filter(job_id=job_id, freelancer_id=user.id).exists()
+    ):
+        return False
+    if freelancer_id is not None and freelancer_id != user.id:
+        return JobApplication.objects.filter(freelancer_id=freelancer_id, job__job_provider__user_id=user.id).exists()
+    return True
+
+
+def interview_end(interview):
+    return interview.interview_date + timedelta(minutes=interview.duration_minutes)
+
+
+def busy_interviews(start, end, freelancer_id=None, job_id=None, exclude_id=None):
+    """
+    Active interviews of the freelancer or the job that overlap [start, end), sorted by start.
+
+    The range scan uses the (freelancer_id, interview_date) / (job_id, interview_date)
+    indexes: an interview can only overlap if it starts before `end` and no earlier
+    than `start` minus the longest allowed duration; the exact end is checked in memory.
+    """
+    participants = Q()
+    if freelancer_id is not None:
+        participants |= Q(freelancer_id=freelancer_id)
+    if job_id is not None:
+        participants |= Q(job_id=job_id)
+    if not participants:
+        return []
+
+    candidates = JobInterview.objects.filter(
+        participants,
+        status__in=ACTIVE_INTERVIEW_STATUSES,
+        interview_date__lt=end,
+        interview_date__gt=start - timedelta(minutes=MAX_INTERVIEW_MINUTES),
+    ).order_by('interview_date')
+    if exclude_id is not None:
+        candidates = candidates.exclude(id=exclude_id)
+
+    return [iv for iv in candidates if interview_end(iv) > start]
+
+
+def find_conflicts(start, duration_minutes, freelancer_id=None, job_id=None, exclude_id=None):
+    """Interviews that would overlap a new one at `start` lasting `duration_minutes`"""
+    end = start + timedelta(minutes=duration_minutes)
+    return busy_interviews(start, end, freelancer_id=freelancer_id, job_id=job_id, exclude_id=exclude_id)
+
+
+def conflict_dict(interview, freelancer_id=None, job_id=None):
+    """Describe a conflicting interview and which participant it collides on"""
+    reasons = []
+    if freelancer_id is not None and interview.freelancer_id == freelancer_id:
+        reasons.append('freelancer')
+    if job_id is not None and interview.job_id == job_id:
+        reasons.append('job')
+    return {
+        "interview_id": interview.id,
+        "application_id": interview.application_id,
+        "start": interview.interview_date.strftime('%Y-%m-%dT%H:%M:%SZ'),
+        "end": interview_end(interview).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        "status": interview.status,
+        "conflicts_on": reasons,
+    }
+
+
+def free_slots(start_date, end_date, slot_minutes, day_start, day_end, freelancer_id=None, job_id=None):
+    """
+    Free slots of `slot_minutes` between day_start and day_end (local hours) on each
+    day from start_date to end_date inclusive, skipping past and busy time.
+
+    Busy intervals come from one query and are swept alongside the slots in order.
+    """
+    tz = timezone.get_current_timezone()
+    range_start = timezone.make_aware(datetime.combine(start_date, time(day_start)), tz)
+    range_end = timezone.make_aware(datetime.combine(end_date, time(0)), tz) + timedelta(days=1)
+    busy = [(iv.interview_date, interview_end(iv)) for iv in busy_interviews(
+        range_start, range_end, freelancer_id=freelancer_id, job_id=job_id,
+    )]
+
+    now = timezone.now()
+    step = timedelta(minutes=slot_minutes)
+    slots = []
+    b = 0
+    day = start_date
+    while day <= end_date:
+        slot_start = timezone.make_aware(datetime.combine(day, time(day_start)), tz)
+        day_close = timezone.make_aware(datetime.combine(day, time(0)), tz) + timedelta(hours=day_end)
+        while slot_start + step <= day_close:
+            slot_end = slot_start + step
+            # Busy intervals ending before this slot can never matter again
+            while b < len(busy) and busy[b][1] <= slot_start:
+                b += 1
+            if slot_start >= now and not _overlaps_any(busy, b, slot_start, slot_end):
+                slots.append((slot_start, slot_end))
+            slot_start = slot_end
+        day += timedelta(days=1)
+    return slots
+
+
+def _overlaps_any(busy, first, slot_start, slot_end):
+    """Check busy[first:] (sorted by start) for overlap with the slot"""
+    for bs, be in busy[first:]:
+        if bs >= slot_end:
+            return False
+        if be > slot_start:
+            return True
+    return False
@@ -0,0 +1,68 @@
+import re
+
+from django.contrib.postgres.search import (
+    SearchHeadline, SearchQuery, SearchRank, SearchVector,
+)
+from django.db.models import F, FloatField
+from django.db.models.functions import Cast
+
+from .models import JobPosting
+
+
+SEARCH_CONFIG = 'english'
+
+# Weighted document for JobPosting.search_vector: title > department > role text > qualifications
+JOB_SEARCH_VECTOR = (
+    SearchVector('job_title', weight='A', config=SEARCH_CONFIG)
+    + SearchVector('department', weight='B', config=SEARCH_CONFIG)
+    + SearchVector('role_overview', 'key_responsibilities', weight='C', config=SEARCH_CONFIG)
+    + SearchVector('required_qualifications', 'preferred_qualifications', weight='D', config=SEARCH_CONFIG)
+)
+
+# Columns that feed JOB_SEARCH_VECTOR; saves touching none of them skip the refresh
+JOB_SEARCH_FIELDS = (
+    'job_title', 'department', 'role_overview', 'key_responsibilities',
+    'required_qualifications', 'preferred_qualifications',
+)
+
+_PREFIX_TERM = re.compile(r'(?<![\w"])(\w+)\*')
+
+
+def refresh_search_vectors(job_ids):
+    """Recompute search_vector for the given postings in one UPDATE"""
+    return JobPosting.objects.filter(id__in=list(job_ids)).update(search_vector=JOB_SEARCH_VECTOR)
+
+
+def build_search_query(text):
+    """
+    Turn the ?q= string into a tsquery.
+
+    Supports web-search syntax ("exact phrase", or, -exclude) plus prefix terms
+    written as word* (e.g. "develop*" matches developer, development).
+    Returns None when nothing searchable is left.
+    """
+    prefixes = _PREFIX_TERM.findall(text)
+    remainder = _PREFIX_TERM.sub(' ', text).strip()
+
+    query = None
+    if remainder:
+        query = SearchQuery(remainder, search_type='websearch', config=SEARCH_CONFIG)
+    for term in prefixes:
+        prefix_query = SearchQuery(f"{term.lower()}:*", search_type='raw', config=SEARCH_CONFIG)
+        query = prefix_query if query is None else query & prefix_query
+    return query
+
+
+def annotate_search(queryset, query):
+    """
+    Annotate postings already filtered on search_vector=query with
+    search_rank (weighted ts_rank) and search_snippet (highlighted role overview).
+    """
+    return queryset.annotate(
+        # ts_rank is float4; widen it so keyset cursors round-trip the exact value
+        search_rank=Cast(SearchRank(F('search_vector'), query), FloatField()),
+        search_snippet=SearchHeadline(
+            'role_overview', query, config=SEARCH_CONFIG,
+            start_sel='<mark>', stop_sel='</mark>', max_fragments=2,
+        ),
+    )
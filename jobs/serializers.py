@@ -1,6 +1,8 @@
 from rest_framework import serializers
 from django.utils import timezone
-from .models import JobPosting, JobApplication, JobInterview, JobOffer, ApplicationWithdrawal
+from .models import JobPosting, JobApplication, JobInterview, JobOffer, ApplicationWithdrawal, SavedJobSearch
+from .scheduling import MIN_INTERVIEW_MINUTES, MAX_INTERVIEW_MINUTES
+from .transitions import MAX_BATCH_APPLICATIONS
 
 
 class JobPostingSerializer(serializers.ModelSerializer):
@@ -10,7 +12,7 @@ class JobPostingSerializer(serializers.ModelSerializer):
     """
     class Meta:
         model = JobPosting
-        exclude = ['job_provider']
+        exclude = ['job_provider', 'search_vector', 'latitude', 'longitude', 'geohash']
         # Allow job_status to be writable so updates can change it
         # (validation for required-on-update is performed in the view)
         read_only_fields = []
@@ -24,6 +26,18 @@ class JobApplicationSerializer(serializers.ModelSerializer):
     job_id = serializers.IntegerField(write_only=True)
     # Resume is now a FileField on the model; expose it as a file field in the API
     resume = serializers.FileField(required=False, allow_null=True, use_url=True)
+    # Reference an already stored file instead of uploading it again
+    resume_upload_id = serializers.UUIDField(
+        write_only=True,
+        required=False,
+        help_text="Completed chunked upload to attach as the resume"
+    )
+    use_profile_resume = serializers.BooleanField(
+        write_only=True,
+        required=False,
+        default=False,
+        help_text="Attach the resume stored on the freelancer's profile"
+    )
     
     class Meta:
         model = JobApplication
@@ -61,6 +75,61 @@ class JobApplicationUpdateSerializer(serializers.Serializer):
     )
 
 
+class JobApplicationBatchUpdateSerializer(serializers.Serializer):
+    """
+    Serializer for batch status/rating updates - same fields as the single update plus the ids
+    """
+    application_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=MAX_BATCH_APPLICATIONS,
+        help_text="Applications to update"
+    )
+    rating = serializers.DecimalField(
+        max_digits=2, 
+        decimal_places=1, 
+        min_value=1, 
+        max_value=5,
+        required=False,
+        help_text="Rating from 1 to 5"
+    )
+    status = serializers.ChoiceField(
+        choices=[
+            ('Pending', 'Pending'),
+            ('Accepted', 'Accepted'),
+            ('Rejected', 'Rejected'),
+            ('Save for Later', 'Save for Later'),
+        ],
+        required=False,
+        help_text="Target application status"
+    )
+    comments = serializers.CharField(
+        max_length=1000,
+        required=False,
+        allow_blank=True,
+        help_text="Update comments"
+    )
+
+    def validate(self, attrs):
+        if 'status' not in attrs and 'rating' not in attrs:
+            raise serializers.ValidationError("Provide at least 'status' or 'rating' to update.")
+        return attrs
+
+
+class UploadSessionSerializer(serializers.Serializer):
+    """
+    Serializer for starting a resumable chunked upload
+    """
+    filename = serializers.CharField(max_length=255)
+    size = serializers.IntegerField(min_value=1, help_text="Total file size in bytes")
+    sha256 = serializers.RegexField(
+        r'^[0-9a-fA-F]{64}$',
+        required=False,
+        allow_blank=True,
+        help_text="Optional SHA-256 of the whole file; lets already stored files skip the transfer"
+    )
+
+
 class JobInterviewSerializer(serializers.ModelSerializer):
     """
     Simplified JobInterview serializer - common fields only
@@ -72,8 +141,11 @@ class JobInterviewSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = JobInterview
-        fields = ['application_id', 'job_id', 'freelance_id', 'date_time', 'interview_mode', 'interview_link', 'interview_notes', 'id', 'interview_date', 'status', 'rating']
+        fields = ['application_id', 'job_id', 'freelance_id', 'date_time', 'duration_minutes', 'interview_mode', 'interview_link', 'interview_notes', 'id', 'interview_date', 'status', 'rating']
         read_only_fields = ['id', 'interview_date', 'status', 'rating']
+        extra_kwargs = {
+            'duration_minutes': {'min_value': MIN_INTERVIEW_MINUTES, 'max_value': MAX_INTERVIEW_MINUTES},
+        }
 
 
 class JobOfferSerializer(serializers.ModelSerializer):
@@ -176,4 +248,23 @@ class ApplicationWithdrawalSerializer(serializers.ModelSerializer):
     """
     class Meta:
         model = ApplicationWithdrawal
-        fields = '__all__'
\ No newline at end of file
+        fields = '__all__'
+
+class SavedJobSearchSerializer(serializers.ModelSerializer):
+    """
+    Saved job search; filters take the same values as the JobPosting fields they match
+    """
+    job_category = serializers.ChoiceField(
+        choices=JobPosting._meta.get_field('job_category').choices, required=False, allow_blank=True
+    )
+    job_type = serializers.ChoiceField(
+        choices=JobPosting._meta.get_field('job_type').choices, required=False, allow_blank=True
+    )
+    work_mode = serializers.ChoiceField(
+        choices=JobPosting._meta.get_field('work_mode').choices, required=False, allow_blank=True
+    )
+    
+    class Meta:
+        model = SavedJobSearch
+        fields = ['id', 'name', 'keywords', 'job_category', 'job_type', 'work_mode', 'min_salary', 'is_active', 'date_created']
+        read_only_fields = ['id', 'date_created']
@@ -0,0 +1,95 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_save
+from django.dispatch import Signal, receiver
+
+from profiles.models import FreelancerProfile
+
+from .alerts import ALERT_TEXT_FIELDS, index_term, percolate
+from .dedupe import DEDUPE_FIELDS, compute_signature
+from .history import invalidate_for_postings, invalidate_freelancer_jobs
+from .models import JobApplication, JobPosting, SavedJobSearch
+from .ranking import invalidate_applicant_scores
+from .recommend import recommender
+from .resumes import queue_resumes
+from .search import JOB_SEARCH_FIELDS, refresh_search_vectors
+
+
+# Sent after postings are closed in bulk by jobs.deadlines (QuerySet.update skips post_save).
+# Arguments: job_ids
+job_postings_closed = Signal()
+
+
+@receiver(post_save, sender=JobPosting)
+def update_job_search_vector(sender, instance, created, update_fields=None, **kwargs):
+    """Keep job_posting.search_vector in step with the text columns it indexes"""
+    if update_fields is not None and not set(update_fields) & set(JOB_SEARCH_FIELDS):
+        return
+    refresh_search_vectors([instance.pk])
+
+
+@receiver(post_delete, sender=JobPosting)
+def drop_job_from_recommender(sender, instance, **kwargs):
+    """Deleted postings leave this process's index at once; other processes drop them when ranking"""
+    recommender.discard(instance.pk)
+
+
+@receiver(post_save, sender=JobApplication)
+@receiver(post_save, sender=FreelancerProfile)
+def queue_resume_extraction(sender, instance, update_fields=None, **kwargs):
+    """Queue new resumes for the extract_resumes worker; nothing is parsed in the request"""
+    if update_fields is not None and 'resume' not in update_fields:
+        return
+    if instance.resume:
+        queue_resumes([instance.resume.name])
+
+
+@receiver(post_save, sender=JobApplication)
+@receiver(post_delete, sender=JobApplication)
+def invalidate_freelancer_history(sender, instance, **kwargs):
+    """A freelancer's cached job history changes with any of their applications"""
+    invalidate_freelancer_jobs([instance.freelancer_id])
+
+
+@receiver(post_save, sender=JobPosting)
+def invalidate_applicant_histories(sender, instance, created, **kwargs):
+    """Histories show the posting's title and status, so refresh them for its applicants"""
+    if not created:
+        invalidate_for_postings([instance.pk])
+
+
+@receiver(job_postings_closed)
+def invalidate_closed_posting_histories(sender, job_ids, **kwargs):
+    invalidate_for_postings(job_ids)
+
+
+@receiver(post_save, sender=FreelancerProfile)
+def invalidate_scores_for_profile(sender, instance, **kwargs):
+    """Profile edits change the freelancer's fit for every posting they applied to"""
+    invalidate_applicant_scores(
+        JobApplication.objects.filter(freelancer_id=instance.user_id).values_list('job_id', flat=True)
+    )
+
+
+@receiver(post_save, sender=JobPosting)
+def update_job_signature(sender, instance, update_fields=None, **kwargs):
+    """Recompute the posting's own MinHash signature when its compared text may have changed"""
+    if update_fields is not None and not set(update_fields) & set(DEDUPE_FIELDS):
+        return
+    compute_signature(instance)
+
+
+# Posting fields a saved search can match on
+ALERT_FIELDS = set(ALERT_TEXT_FIELDS) | {'job_type', 'work_mode', 'salary_from', 'salary_to', 'job_status'}
+
+
+@receiver(pre_save, sender=SavedJobSearch)
+def set_saved_search_index_term(sender, instance, **kwargs):
+    instance.index_term = index_term(instance)
+
+
+@receiver(post_save, sender=JobPosting)
+def match_saved_searches(sender, instance, update_fields=None, **kwargs):
+    """Match new or changed postings against the saved searches indexed under their terms"""
+    if update_fields is not None and not set(update_fields) & ALERT_FIELDS:
+        return
+    transaction.on_commit(lambda: percolate([instance]))
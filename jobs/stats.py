@@ -0,0 +1,124 @@
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Count, F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from .models import JobApplication, JobInterview, JobOffer, JobPipelineStats
+
+
+# Status value -> JobPipelineStats counter column
+APPLICATION_STATUS_FIELDS = {
+    'Pending': 'applications_pending',
+    'Accepted': 'applications_accepted',
+    'Rejected': 'applications_rejected',
+    'Save for Later': 'applications_saved',
+    'Withdrawn': 'applications_withdrawn',
+}
+
+INTERVIEW_STATUS_FIELDS = {
+    'Scheduled': 'interviews_scheduled',
+    'Completed': 'interviews_completed',
+    'Cancelled': 'interviews_cancelled',
+    'Rescheduled': 'interviews_rescheduled',
+    'No-show': 'interviews_no_show',
+}
+
+OFFER_STATUS_FIELDS = {
+    'Pending': 'offers_pending',
+    'Accepted': 'offers_accepted',
+    'Rejected': 'offers_rejected',
+    'Withdrawn': 'offers_withdrawn',
+}
+
+COUNTER_FIELDS = (
+    list(APPLICATION_STATUS_FIELDS.values())
+    + list(INTERVIEW_STATUS_FIELDS.values())
+    + list(OFFER_STATUS_FIELDS.values())
+)
+
+
+def transition_deltas(status_fields, old_status, new_status, count=1):
+    """Counter deltas for `count` rows moving old_status -> new_status (either may be None)"""
+    deltas = defaultdict(int)
+    if old_status == new_status:
+        return deltas
+    if old_status in status_fields:
+        deltas[status_fields[old_status]] -= count
+    if new_status in status_fields:
+        deltas[status_fields[new_status]] += count
+    return deltas
+
+
+def apply_deltas(deltas_by_job):
+    """
+    Apply {job_id: {counter: delta}} with one UPDATE per job.
+
+    Call inside the transaction that changed the underlying rows so the
+    counters commit (or roll back) together with them. Counters are clamped at 0:
+    a row that has drifted low (admin edits, jobs older than the table) must not
+    fail the write that triggered it; rebuild_job_stats repairs the drift.
+    """
+    deltas_by_job = {
+        job_id: {f: d for f, d in deltas.items() if d}
+        for job_id, deltas in deltas_by_job.items() if job_id is not None
+    }
+    deltas_by_job = {job_id: deltas for job_id, deltas in deltas_by_job.items() if deltas}
+    if not deltas_by_job:
+        return
+
+    with transaction.atomic():
+        # INSERT ... ON CONFLICT DO NOTHING so concurrent first writers don't collide
+        JobPipelineStats.objects.bulk_create(
+            [JobPipelineStats(job_id=job_id) for job_id in deltas_by_job],
+            ignore_conflicts=True,
+        )
+        for job_id, deltas in deltas_by_job.items():
+            JobPipelineStats.objects.filter(job_id=job_id).update(
+                date_updated=timezone.now(),
+                **{field: Greatest(F(field) + delta, 0) for field, delta in deltas.items()}
+            )
+
+
+def record_application_status(job_id, old_status, new_status):
+    apply_deltas({job_id: transition_deltas(APPLICATION_STATUS_FIELDS, old_status, new_status)})
+
+
+def record_interview_status(job_id, old_status, new_status):
+    apply_deltas({job_id: transition_deltas(INTERVIEW_STATUS_FIELDS, old_status, new_status)})
+
+
+def record_offer_status(job_id, old_status, new_status):
+    apply_deltas({job_id: transition_deltas(OFFER_STATUS_FIELDS, old_status, new_status)})
+
+
+def stats_dict(stats):
+    """Shape a JobPipelineStats row (or None for a job with no activity) for API responses"""
+    def counts(status_fields):
+        return {status: getattr(stats, field) if stats else 0 for status, field in status_fields.items()}
+    return {
+        "applications": counts(APPLICATION_STATUS_FIELDS),
+        "interviews": counts(INTERVIEW_STATUS_FIELDS),
+        "offers": counts(OFFER_STATUS_FIELDS),
+    }
+
+
+def compute_stats(job_ids):
+    """Recount the pipeline for job_ids from the source tables (three grouped queries)"""
+    rows = {job_id: JobPipelineStats(job_id=job_id) for job_id in job_ids}
+
+    grouped = (
+        (JobApplication.objects.filter(job_id__in=job_ids).values_list('job_id', 'status'),
+         APPLICATION_STATUS_FIELDS),
+        (JobInterview.objects.filter(application__job_id__in=job_ids).values_list('application__job_id', 'status'),
+         INTERVIEW_STATUS_FIELDS),
+        (JobOffer.objects.filter(application__job_id__in=job_ids).values_list('application__job_id', 'offer_status'),
+         OFFER_STATUS_FIELDS),
+    )
+    for values, status_fields in grouped:
+        for job_id, status, n in values.order_by().annotate(n=Count('id')):
+            field = status_fields.get(status)
+            if field:
+                setattr(rows[job_id], field, n)
+    return list(rows.values())
@@ -0,0 +1,94 @@
+import hashlib
+import os
+import tempfile
+
+from django.core.files.storage import FileSystemStorage
+
+
+# Read/write block size while hashing and copying uploads
+HASH_CHUNK_SIZE = 64 * 1024
+
+BLOB_PREFIX = 'blobs'
+TEMP_DIR = 'blobs/tmp'
+
+
+def hash_file(path):
+    """SHA-256 hex digest of a file on disk, read in blocks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    Filesystem storage that names files by the SHA-256 of their content.
+
+    Uploads are streamed to a temporary file in chunks while being hashed, then
+    moved to blobs/ab/cd/<sha256><ext>. Saving content that is already stored
+    returns the existing name, so an identical resume attached to many
+    applications is kept on disk once. Blobs are never overwritten.
+    """
+
+    def blob_name(self, digest, ext=''):
+        return f'{BLOB_PREFIX}/{digest[:2]}/{digest[2:4]}/{digest}{ext.lower()[:10]}'
+
+    def find_blob(self, digest):
+        """Name of an existing blob with this digest (any extension), or None"""
+        directory = os.path.dirname(self.blob_name(digest))
+        try:
+            entries = os.listdir(self.path(directory))
+        except FileNotFoundError:
+            return None
+        for entry in entries:
+            if entry.startswith(digest):
+                return f'{directory}/{entry}'
+        return None
+
+    def get_available_name(self, name, max_length=None):
+        # Names are derived from content in _save; an existing name means the same bytes
+        return name
+
+    def temp_path(self, name):
+        os.makedirs(self.path(TEMP_DIR), exist_ok=True)
+        return self.path(f'{TEMP_DIR}/{name}')
+
+    def _save(self, name, content):
+        ext = os.path.splitext(name)[1]
+        os.makedirs(self.path(TEMP_DIR), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path(TEMP_DIR))
+        digest = hashlib.sha256()
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                for chunk in content.chunks(chunk_size=HASH_CHUNK_SIZE):
+                    digest.update(chunk)
+                    out.write(chunk)
+            return self.store_file(tmp_path, digest.hexdigest(), ext)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def store_file(self, path, digest, ext=''):
+        """
+        Move a fully written local file (on the same filesystem) into the blob
+        tree under its digest, or drop it if that content is already stored.
+        """
+        name = self.blob_name(digest, ext)
+        full_path = self.path(name)
+        if os.path.exists(full_path):
+            os.remove(path)
+            return name
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        os.replace(path, full_path)
+        if self.file_permissions_mode is not None:
+            os.chmod(full_path, self.file_permissions_mode)
+        return name
+
+
+content_storage = ContentAddressedStorage()
+
+
+def get_content_storage():
+    """Callable for FileField(storage=...) so migrations don't serialize the instance"""
+    return content_storage
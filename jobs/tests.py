@@ -0,0 +1,46 @@
+import math
+import random
+
+from django.test import SimpleTestCase
+
+from .geo import EARTH_RADIUS_KM, covering_cells, geohash, haversine_km
+
+
+def _destination(lat, lon, bearing, distance_km):
+    """The point distance_km from (lat, lon) along the initial bearing (radians)"""
+    d = distance_km / EARTH_RADIUS_KM
+    lat1, lon1 = math.radians(lat), math.radians(lon)
+    lat2 = math.asin(math.sin(lat1) * math.cos(d) + math.cos(lat1) * math.sin(d) * math.cos(bearing))
+    lon2 = lon1 + math.atan2(
+        math.sin(bearing) * math.sin(d) * math.cos(lat1),
+        math.cos(d) - math.sin(lat1) * math.sin(lat2),
+    )
+    return math.degrees(lat2), (math.degrees(lon2) + 180) % 360 - 180
+
+
+class CoveringCellsTests(SimpleTestCase):
+    def assertCovered(self, lat, lon, radius_km, rng, points=200):
+        cells = covering_cells(lat, lon, radius_km)
+        for _ in range(points):
+            distance = radius_km * math.sqrt(rng.random())
+            point = _destination(lat, lon, rng.uniform(0, 2 * math.pi), distance)
+            if haversine_km(lat, lon, *point) > radius_km:
+                continue
+            code = geohash(*point)
+            self.assertTrue(
+                any(code.startswith(cell) for cell in cells),
+                f"{point} is within {radius_km} km of {(lat, lon)} but outside {sorted(cells)}",
+            )
+
+    def test_random_points_in_radius_are_covered(self):
+        rng = random.Random(2022)
+        for _ in range(300):
+            lat, lon = rng.uniform(-90, 90), rng.uniform(-180, 180)
+            self.assertCovered(lat, lon, rng.choice([1, 5, 50, 300, 1000]), rng)
+
+    def test_polar_and_antimeridian_circles_are_covered(self):
+        rng = random.Random(7)
+        for lat in (80.5, 84, 88, 89.9, 90, -83, -89.5, -90):
+            for lon in (-179.9, 0, 179.9):
+                for radius in (10, 50, 300, 1000):
+                    self.assertCovered(lat, lon, radius, rng)
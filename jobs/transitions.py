@@ -0,0 +1,93 @@
+from collections import defaultdict
+
+from django.db import transaction
+
+from .history import invalidate_freelancer_jobs
+from .models import JobApplication
+from .stats import APPLICATION_STATUS_FIELDS, apply_deltas, transition_deltas
+
+
+# Status changes a provider may make; Withdrawn is set by the freelancer and is final
+APPLICATION_TRANSITIONS = {
+    'Pending': {'Accepted', 'Rejected', 'Save for Later'},
+    'Save for Later': {'Pending', 'Accepted', 'Rejected'},
+    'Accepted': {'Rejected'},
+    'Rejected': {'Pending'},
+    'Withdrawn': set(),
+}
+
+MAX_BATCH_APPLICATIONS = 1000
+
+
+def can_transition(old_status, new_status):
+    return old_status == new_status or new_status in APPLICATION_TRANSITIONS.get(old_status, ())
+
+
+def batch_update_applications(application_ids, provider_user_id, status=None, rating=None, comments=None):
+    """
+    Apply status/rating/comments to many applications in one transaction.
+    Only applications to postings of the job provider owned by provider_user_id
+    are touched; any other id is reported as not found.
+
+    Current statuses are read (and locked) in one query, disallowed transitions are
+    reported per id, and the remaining rows are written with a single
+    UPDATE ... WHERE id IN (...). Pipeline counters are adjusted once for the batch.
+
+    Returns a list of per-id results in request order.
+    """
+    ids = list(dict.fromkeys(application_ids))
+    results = []
+
+    with transaction.atomic():
+        current = {}
+        freelancer_ids = set()
+        rows = JobApplication.objects.select_for_update(of=('self',)).filter(
+            id__in=ids, job__job_provider__user_id=provider_user_id
+        ).values_list(
+            'id', 'job_id', 'freelancer_id', 'status'
+        )
+        for app_id, job_id, freelancer_id, old_status in rows:
+            current[app_id] = (job_id, old_status)
+            freelancer_ids.add(freelancer_id)
+
+        updated_ids = []
+        deltas_by_job = defaultdict(lambda: defaultdict(int))
+        for app_id in ids:
+            if app_id not in current:
+                results.append({"application_id": app_id, "updated": False, "error": "Application not found"})
+                continue
+            job_id, old_status = current[app_id]
+            if status and not can_transition(old_status, status):
+                results.append({
+                    "application_id": app_id,
+                    "updated": False,
+                    "status": old_status,
+                    "error": f"Cannot change status from '{old_status}' to '{status}'",
+                })
+                continue
+
+            updated_ids.append(app_id)
+            if status:
+                for field, delta in transition_deltas(APPLICATION_STATUS_FIELDS, old_status, status).items():
+                    deltas_by_job[job_id][field] += delta
+            results.append({
+                "application_id": app_id,
+                "updated": True,
+                "previous_status": old_status,
+                "status": status or old_status,
+            })
+
+        changes = {}
+        if status:
+            changes['status'] = status
+        if rating is not None:
+            changes['rating'] = rating
+        if comments is not None:
+            changes['comments'] = comments
+        if updated_ids and changes:
+            JobApplication.objects.filter(id__in=updated_ids).update(**changes)
+            apply_deltas(deltas_by_job)
+            # QuerySet.update() skips post_save, so drop the cached histories here
+            transaction.on_commit(lambda: invalidate_freelancer_jobs(freelancer_ids))
+
+    return results
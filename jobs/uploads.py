@@ -0,0 +1,157 @@
+import os
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from profiles.models import FreelancerProfile
+
+from .models import JobApplication, UploadSession
+from .storage import HASH_CHUNK_SIZE, content_storage, hash_file
+
+
+# Largest file accepted through a chunked upload, and largest single chunk request
+MAX_UPLOAD_SIZE = 25 * 1024 * 1024
+MAX_CHUNK_SIZE = 5 * 1024 * 1024
+RECOMMENDED_CHUNK_SIZE = 1024 * 1024
+
+ALLOWED_UPLOAD_EXTENSIONS = ('.pdf', '.doc', '.docx', '.txt', '.rtf', '.odt')
+
+# Unfinished sessions older than this are purged with their partial data
+UPLOAD_SESSION_TTL = timedelta(hours=24)
+
+
+class UploadError(Exception):
+    pass
+
+
+class OffsetMismatch(UploadError):
+    """The client resumed at a different offset than the server has stored"""
+
+    def __init__(self, expected):
+        super().__init__(f"Expected chunk at offset {expected}")
+        self.expected = expected
+
+
+def part_path(session):
+    return content_storage.temp_path(f'{session.id}.part')
+
+
+def user_owns_blob(user, blob):
+    """Whether the user uploaded this stored file themselves (an upload, their profile or an application)"""
+    return (
+        UploadSession.objects.filter(user=user, status='complete', blob=blob).exists()
+        or FreelancerProfile.objects.filter(user=user, resume=blob).exists()
+        or JobApplication.objects.filter(freelancer_id=user.id, resume=blob).exists()
+    )
+
+
+def start_upload(user, filename, size, sha256=''):
+    """
+    Open a resumable upload. When the client already knows the digest and the
+    user already owns a stored file with that content, the session completes
+    immediately without any transfer. Content stored only by other users is
+    never attached by digest alone: it is uploaded and hashed like any file.
+    """
+    ext = os.path.splitext(filename)[1].lower()
+    if ext not in ALLOWED_UPLOAD_EXTENSIONS:
+        raise UploadError(f"File type '{ext or filename}' is not allowed")
+    if size <= 0 or size > MAX_UPLOAD_SIZE:
+        raise UploadError(f"size must be between 1 and {MAX_UPLOAD_SIZE} bytes")
+
+    session = UploadSession(user=user, filename=filename, total_size=size, sha256=sha256.lower())
+    existing = content_storage.find_blob(session.sha256) if session.sha256 and user else None
+    if existing and content_storage.size(existing) == size and user_owns_blob(user, existing):
+        session.blob = existing
+        session.received = size
+        session.status = 'complete'
+    session.save()
+    return session
+
+
+def append_chunk(session_id, stream, offset, length):
+    """
+    Append `length` bytes read from `stream` at `offset`; returns the session.
+
+    The session row is locked so two requests for the same upload cannot
+    interleave, and a chunk is only accepted at the current end of the data.
+    """
+    if length <= 0 or length > MAX_CHUNK_SIZE:
+        raise UploadError(f"Chunks must be between 1 and {MAX_CHUNK_SIZE} bytes")
+
+    with transaction.atomic():
+        session = UploadSession.objects.select_for_update().get(id=session_id)
+        if session.status != 'active':
+            raise UploadError("Upload is already complete")
+        if offset != session.received:
+            raise OffsetMismatch(session.received)
+        if session.received + length > session.total_size:
+            raise UploadError("Chunk exceeds the declared file size")
+
+        written = 0
+        with open(part_path(session), 'ab') as out:
+            # Drop anything past the committed offset left by an interrupted request
+            out.truncate(session.received)
+            while written < length:
+                block = stream.read(min(HASH_CHUNK_SIZE, length - written))
+                if not block:
+                    break
+                out.write(block)
+                written += len(block)
+        if written != length:
+            raise UploadError(f"Received {written} of {length} bytes")
+
+        session.received += written
+        session.save(update_fields=['received', 'date_updated'])
+    return session
+
+
+def complete_upload(session_id):
+    """Verify the assembled file and move it into content-addressed storage"""
+    with transaction.atomic():
+        session = UploadSession.objects.select_for_update().get(id=session_id)
+        if session.status == 'complete':
+            return session
+        if session.received != session.total_size:
+            raise UploadError(f"Upload incomplete: {session.received} of {session.total_size} bytes received")
+
+        path = part_path(session)
+        try:
+            digest = hash_file(path)
+        except FileNotFoundError:
+            digest = None
+            failure = "Uploaded data is missing; the upload has been reset"
+        else:
+            failure = None
+            if session.sha256 and digest != session.sha256:
+                os.remove(path)
+                failure = "Checksum mismatch; the upload has been reset"
+
+        if failure:
+            # Committed before raising so the client can start over from offset 0
+            session.received = 0
+            session.save(update_fields=['received', 'date_updated'])
+        else:
+            session.blob = content_storage.store_file(path, digest, os.path.splitext(session.filename)[1])
+            session.sha256 = digest
+            session.status = 'complete'
+            session.save(update_fields=['blob', 'sha256', 'status', 'date_updated'])
+
+    if failure:
+        raise UploadError(failure)
+    return session
+
+
+def purge_stale_uploads(now=None):
+    """Delete unfinished sessions older than UPLOAD_SESSION_TTL and their partial files"""
+    cutoff = (now or timezone.now()) - UPLOAD_SESSION_TTL
+    stale = UploadSession.objects.filter(status='active', date_updated__lt=cutoff)
+    count = 0
+    for session in stale.iterator():
+        try:
+            os.remove(part_path(session))
+        except FileNotFoundError:
+            pass
+        session.delete()
+        count += 1
+    return count
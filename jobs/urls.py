@@ -5,7 +5,10 @@ from .views import (
     JobApplicationViewSet, 
     JobInterviewViewSet, 
     JobOfferViewSet, 
-    ApplicationWithdrawalViewSet
+    ApplicationWithdrawalViewSet,
+    UploadSessionViewSet,
+    ArchivedJobPostingViewSet,
+    SavedJobSearchViewSet
 )
 
 app_name = 'jobs'
@@ -26,6 +29,18 @@ job_posting_manage = JobPostingViewSet.as_view({
     'get': 'job_manage'
 })
 
+job_posting_import = JobPostingViewSet.as_view({
+    'post': 'bulk_import'
+})
+
+job_posting_stats = JobPostingViewSet.as_view({
+    'get': 'pipeline_stats'
+})
+
+job_posting_views = JobPostingViewSet.as_view({
+    'get': 'view_counts'
+})
+
 # ===== JOB APPLICATION URLS =====
 job_application_list = JobApplicationViewSet.as_view({
     'get': 'list',
@@ -44,6 +59,51 @@ job_application_update_status = JobApplicationViewSet.as_view({
     'put': 'update_application_status'
 })
 
+job_application_batch_update = JobApplicationViewSet.as_view({
+    'post': 'batch_update_status'
+})
+
+# ===== ARCHIVE URLS =====
+archive_list = ArchivedJobPostingViewSet.as_view({
+    'get': 'list'
+})
+
+archive_detail = ArchivedJobPostingViewSet.as_view({
+    'get': 'retrieve'
+})
+
+# ===== SAVED SEARCH URLS =====
+saved_search_list = SavedJobSearchViewSet.as_view({
+    'get': 'list',
+    'post': 'create'
+})
+
+saved_search_detail = SavedJobSearchViewSet.as_view({
+    'patch': 'partial_update',
+    'delete': 'destroy'
+})
+
+saved_search_matches = SavedJobSearchViewSet.as_view({
+    'get': 'matches'
+})
+
+# ===== UPLOAD URLS =====
+upload_start = UploadSessionViewSet.as_view({
+    'post': 'create'
+})
+
+upload_detail = UploadSessionViewSet.as_view({
+    'get': 'retrieve'
+})
+
+upload_chunk = UploadSessionViewSet.as_view({
+    'put': 'upload_chunk'
+})
+
+upload_complete = UploadSessionViewSet.as_view({
+    'post': 'complete'
+})
+
 # ===== JOB INTERVIEW URLS =====
 interview_schedule = JobInterviewViewSet.as_view({
     'post': 'schedule_interview'
@@ -65,6 +125,10 @@ interview_reschedule = JobInterviewViewSet.as_view({
     'post': 'reschedule_interview'
 })
 
+interview_availability = JobInterviewViewSet.as_view({
+    'get': 'availability'
+})
+
 # ===== JOB OFFER URLS =====
 job_offer_create = JobOfferViewSet.as_view({
     'post': 'create_offer'
@@ -94,7 +158,10 @@ withdrawal_detail = ApplicationWithdrawalViewSet.as_view({
 urlpatterns = [
     # ===== JOB POSTING ENDPOINTS =====
     path('posting/', job_posting_list, name='job-posting-list'),
+    path('posting/import/', job_posting_import, name='job-posting-import'),
     path('posting/<int:job_id>/', job_posting_detail, name='job-posting-detail'),
+    path('posting/<int:job_id>/stats/', job_posting_stats, name='job-posting-stats'),
+    path('posting/<int:job_id>/views/', job_posting_views, name='job-posting-views'),
     path('manage/', job_posting_manage, name='job-manage'),
 
     # ===== JOB APPLICATION ENDPOINTS =====
@@ -102,6 +169,22 @@ urlpatterns = [
     path('application/job/<int:job_id>/', job_application_by_job, name='job-application-by-job'),
     path('applications/review/<int:application_id>/', job_application_review, name='job-application-review'),
     path('application/update/<int:application_id>/', job_application_update_status, name='job-application-update'),
+    path('application/batch-update/', job_application_batch_update, name='job-application-batch-update'),
+    
+    # ===== ARCHIVE ENDPOINTS =====
+    path('archive/', archive_list, name='job-archive-list'),
+    path('archive/<int:job_id>/', archive_detail, name='job-archive-detail'),
+    
+    # ===== SAVED SEARCH ENDPOINTS =====
+    path('saved-search/', saved_search_list, name='saved-search-list'),
+    path('saved-search/<int:search_id>/', saved_search_detail, name='saved-search-detail'),
+    path('saved-search/<int:search_id>/matches/', saved_search_matches, name='saved-search-matches'),
+    
+    # ===== UPLOAD ENDPOINTS =====
+    path('upload/', upload_start, name='upload-start'),
+    path('upload/<uuid:upload_id>/', upload_detail, name='upload-detail'),
+    path('upload/<uuid:upload_id>/chunk/', upload_chunk, name='upload-chunk'),
+    path('upload/<uuid:upload_id>/complete/', upload_complete, name='upload-complete'),
     
     # ===== JOB INTERVIEW ENDPOINTS =====
     path('interview/schedule/', interview_schedule, name='interview-schedule'),
@@ -109,6 +192,7 @@ urlpatterns = [
     path('interview/application/<int:application_id>/', interview_by_application, name='interview-by-application'),
     path('interview/feedback/', interview_feedback, name='interview-feedback'),
     path('interview/reschedule/', interview_reschedule, name='interview-reschedule'),
+    path('interview/availability/', interview_availability, name='interview-availability'),
     
     # ===== JOB OFFER ENDPOINTS =====
     path('offer/create/', job_offer_create, name='job-offer-create'),
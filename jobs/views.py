@@ -1,16 +1,28 @@
+from datetime import date, timedelta
+from decimal import Decimal, InvalidOperation
+
 from rest_framework import viewsets, status, permissions
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from drf_yasg.utils import swagger_auto_schema
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Exists, F, OuterRef, Prefetch, Subquery
+from django.contrib.postgres.search import SearchRank
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
 from django.contrib.auth.models import User
-from .models import JobPosting, JobApplication, JobInterview, JobOffer, ApplicationWithdrawal
+from .models import (
+    JobPosting, JobApplication, JobInterview, JobOffer, ApplicationWithdrawal, JobPipelineStats, UploadSession,
+    ResumeDocument, ArchivedJobPosting, SavedJobSearch, SavedSearchMatch,
+)
 from .serializers import (
     JobPostingSerializer, JobApplicationSerializer, JobApplicationUpdateSerializer,
+    JobApplicationBatchUpdateSerializer, UploadSessionSerializer,
     JobInterviewSerializer, JobOfferSerializer, JobOfferCreateSerializer,
-    JobOfferUpdateSerializer, ApplicationWithdrawalSerializer
+    JobOfferUpdateSerializer, ApplicationWithdrawalSerializer, SavedJobSearchSerializer
 )
 
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
@@ -18,6 +30,280 @@ from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework import permissions
 from profiles.models import FreelancerProfile
+from profiles.utils import resolve_freelancers, fallback_freelancer
+from .pagination import keyset_paginate, get_page_size, InvalidCursor
+from .recommend import CANDIDATE_OVERFETCH, recommend_jobs, recommender
+from .search import build_search_query, annotate_search
+from .facets import get_facets
+from .importer import IMPORT_FORMATS, ImportFileError, detect_format, import_job_postings
+from .stats import (
+    record_application_status, record_interview_status, record_offer_status, stats_dict,
+)
+from .transitions import batch_update_applications
+from .history import freelancer_job_history
+from .caching import get_job_detail, job_detail_etag, job_detail_state
+from .counters import get_counts, record_impressions, record_views
+from .ranking import get_applicant_scores
+from .dedupe import find_duplicates
+from .geo import filter_near, parse_point, parse_radius
+from .uploads import (
+    RECOMMENDED_CHUNK_SIZE, OffsetMismatch, UploadError, append_chunk, complete_upload, start_upload,
+)
+from .scheduling import (
+    MIN_INTERVIEW_MINUTES, MAX_INTERVIEW_MINUTES, MAX_AVAILABILITY_DAYS,
+    can_view_availability, conflict_dict, find_conflicts, free_slots, lock_schedules,
+)
+
+
+# Columns read by get_all_offers
+OFFER_LIST_FIELDS = (
+    'id', 'application_id', 'offer_status', 'offer_details', 'salary', 'start_date',
+    'date_offered', 'date_accepted', 'date_rejected', 'multi_doc',
+)
+
+# Columns read by the public job listing (see _job_list_item)
+JOB_LIST_FIELDS = (
+    'id', 'job_title', 'salary_from', 'salary_to', 'currency', 'work_location',
+    'date_posted', 'job_status', 'job_category', 'job_type',
+)
+
+
+def _filter_job_postings(queryset, params):
+    """
+    Apply the job listing's query-parameter filters.
+
+    Returns (queryset, search_query, filters): search_query is the tsquery for ?q=
+    (or None) and filters is the normalized filter set, used as the facet cache key.
+    With ?near= rows are annotated with distance_km.
+    """
+    filters = {}
+    
+    location = params.get('location')
+    if location:
+        queryset = queryset.filter(work_location__icontains=location)
+        filters['location'] = location.strip().lower()
+    
+    # ?near=<place or lat,lon>&radius_km= ; raises ValueError on an unknown place or bad radius
+    near = params.get('near', '').strip()
+    if near:
+        lat, lon = parse_point(near)
+        radius_km = parse_radius(params.get('radius_km'))
+        queryset = filter_near(queryset, lat, lon, radius_km)
+        filters['near'] = f"{lat:.4f},{lon:.4f},{radius_km:g}"
+    
+    job_type = params.get('job_type')
+    if job_type:
+        queryset = queryset.filter(job_type__icontains=job_type)
+        filters['job_type'] = job_type.strip().lower()
+    
+    category = params.get('category')
+    if category:
+        queryset = queryset.filter(job_category__icontains=category)
+        filters['category'] = category.strip().lower()
+    
+    search_query = None
+    q = params.get('q', '').strip()
+    if q:
+        search_query = build_search_query(q)
+        if search_query is not None:
+            queryset = queryset.filter(search_vector=search_query)
+            filters['q'] = ' '.join(q.lower().split())
+    
+    return queryset, search_query, filters
+
+
+def _job_detail_dict(job):
+    return {
+        "job_id": job.id,
+        "job_title": job.job_title,
+        "department": job.department,
+        "job_type": job.job_type,
+        "work_location": job.work_location,
+        "work_mode": job.work_mode,
+        "role_overview": job.role_overview,
+        "key_responsibilities": job.key_responsibilities,
+        "required_qualifications": job.required_qualifications,
+        "preferred_qualifications": job.preferred_qualifications,
+        "language_required": job.languages_required,
+        "category": job.job_category,
+        "salary_from": job.salary_from,
+        "salary_to": job.salary_to,
+        "currency": job.currency,
+        "application_deadline": job.application_deadline.strftime('%Y-%m-%d') if job.application_deadline else None,
+        "interview_mode": job.interview_mode,
+        "hiring_manager": job.hiring_manager,
+        "number_of_openings": job.number_of_openings,
+        "expected_start_date": job.expected_start_date.strftime('%Y-%m-%d') if job.expected_start_date else None,
+        "screening_questions": job.screening_questions,
+        "health_insurance": job.health_insurance,
+        "remote_work": job.remote_work,
+        "paid_leave": job.paid_leave,
+        "bonus": job.bonus,
+        "date_posted": job.date_posted.strftime('%Y-%m-%d') if job.date_posted else None,
+        "job_status": job.job_status,
+    }
+
+
+def _filter_offers(queryset, params):
+    """Apply the get_all_offers query filters; raises ValueError for malformed values"""
+    offer_status = params.get('status')
+    if offer_status:
+        queryset = queryset.filter(offer_status=offer_status)
+    for param, lookup in (('job_id', 'application__job_id'), ('application_id', 'application_id')):
+        if params.get(param):
+            try:
+                queryset = queryset.filter(**{lookup: int(params[param])})
+            except ValueError:
+                raise ValueError(f"{param} must be an integer")
+    for param, lookup in (('salary_min', 'salary__gte'), ('salary_max', 'salary__lte')):
+        if params.get(param):
+            try:
+                queryset = queryset.filter(**{lookup: Decimal(params[param])})
+            except InvalidOperation:
+                raise ValueError(f"{param} must be a number")
+    for param, lookup in (('start_from', 'start_date__gte'), ('start_to', 'start_date__lte')):
+        if params.get(param):
+            try:
+                queryset = queryset.filter(**{lookup: date.fromisoformat(params[param])})
+            except ValueError:
+                raise ValueError(f"{param} must be a date (YYYY-MM-DD)")
+    return queryset
+
+
+def _job_list_item(job):
+    """Shape a JobPosting as a row of the public job listing"""
+    return {
+        "job_id": job.id,
+        "job_title": job.job_title,
+        "salary_range": f"{job.salary_from:,} - {job.salary_to:,} {job.currency}" if job.salary_from and job.salary_to else "Not specified",
+        "location": job.work_location,
+        "date_posted": job.date_posted.strftime('%Y-%m-%d') if job.date_posted else None,
+        "job_status": job.job_status,
+        "job_category": job.job_category,
+        "job_type": job.job_type,
+    }
+
+
+# Nested collections job_manage can attach to each application
+MANAGE_INCLUDES = ('interviews', 'offers')
+
+
+def _parse_manage_include(value):
+    """Parse ?include= for job_manage; absent means everything, empty means nothing"""
+    if value is None:
+        return set(MANAGE_INCLUDES)
+    return {part.strip() for part in value.split(',') if part.strip() in MANAGE_INCLUDES}
+
+
+def _manage_job_dict(job):
+    return {
+        "job_id": job.id,
+        "job_title": job.job_title,
+        "department": job.department,
+        "job_type": job.job_type,
+        "work_location": job.work_location,
+        "work_mode": job.work_mode,
+        "role_overview": job.role_overview,
+        "key_responsibilities": job.key_responsibilities,
+        "required_qualifications": job.required_qualifications,
+        "preferred_qualifications": job.preferred_qualifications,
+        "languages_required": job.languages_required,
+        "job_category": job.job_category,
+        "salary_from": job.salary_from,
+        "salary_to": job.salary_to,
+        "currency": job.currency,
+        "application_deadline": job.application_deadline.strftime('%Y-%m-%d') if job.application_deadline else None,
+        "interview_mode": job.interview_mode,
+        "hiring_manager": job.hiring_manager,
+        "number_of_openings": job.number_of_openings,
+        "expected_start_date": job.expected_start_date.strftime('%Y-%m-%d') if job.expected_start_date else None,
+        "screening_questions": job.screening_questions,
+        "file_upload": job.file_upload,
+        "health_insurance": job.health_insurance,
+        "remote_work": job.remote_work,
+        "paid_leave": job.paid_leave,
+        "bonus": job.bonus,
+        "date_posted": job.date_posted.strftime('%Y-%m-%d %H:%M:%S') if job.date_posted else None,
+        "job_status": job.job_status,
+    }
+
+
+def _pipeline_stats_or_none(job):
+    """The job's JobPipelineStats row, or None if nothing has been counted yet"""
+    try:
+        return job.pipeline_stats
+    except JobPipelineStats.DoesNotExist:
+        return None
+
+
+def _manage_application_dict(app):
+    return {
+        "application_id": app.id,
+        "freelancer_id": app.freelancer_id,
+        "resume_url": app.resume.url if app.resume else None,
+        "cover_letter": app.cover_letter,
+        "expected_rate": app.expected_rate,
+        "status": app.status,
+        "date_applied": app.date_applied.strftime('%Y-%m-%d %H:%M:%S') if app.date_applied else None,
+        "rating": app.rating,
+        "comments": app.comments,
+    }
+
+
+def _manage_interview_dict(iv):
+    return {
+        "interview_id": iv.id,
+        "interview_date": iv.interview_date.strftime('%Y-%m-%d %H:%M:%S') if iv.interview_date else None,
+        "interview_mode": iv.interview_mode,
+        "status": iv.status,
+        "interview_link": iv.interview_link,
+        "interview_notes": iv.interview_notes,
+        "rating": iv.rating,
+        "comments": iv.comments,
+    }
+
+
+def _manage_offer_dict(of):
+    return {
+        "offer_id": of.id,
+        "offer_status": of.offer_status,
+        "offer_details": of.offer_details,
+        "date_offered": of.date_offered.strftime('%Y-%m-%d %H:%M:%S') if of.date_offered else None,
+        "date_accepted": of.date_accepted.strftime('%Y-%m-%d %H:%M:%S') if of.date_accepted else None,
+        "date_rejected": of.date_rejected.strftime('%Y-%m-%d %H:%M:%S') if of.date_rejected else None,
+    }
+
+
+def _applicant_pool(job_id):
+    """Every application of a posting paired with its FreelancerProfile (or None), for ranking"""
+    applications = list(
+        JobApplication.objects.filter(job_id=job_id).only('id', 'freelancer_id', 'cover_letter', 'expected_rate')
+    )
+    freelancers = resolve_freelancers(app.freelancer_id for app in applications)
+    return [(app, freelancers[app.freelancer_id].profile) for app in applications]
+
+
+def _upload_dict(session):
+    return {
+        "upload_id": str(session.id),
+        "filename": session.filename,
+        "size": session.total_size,
+        "offset": session.received,
+        "status": session.status,
+        "sha256": session.sha256 or None,
+        "blob": session.blob or None,
+        "chunk_size": RECOMMENDED_CHUNK_SIZE,
+    }
+
+
+def _parse_flag(value):
+    """Interpret a request flag sent as JSON bool or form/query string"""
+    return str(value).lower() in ('1', 'true')
+
+
+def _conflict_dict(interview, application):
+    return conflict_dict(interview, freelancer_id=application.freelancer_id, job_id=application.job_id)
+
 
 class JobPostingViewSet(viewsets.ModelViewSet):
     queryset = JobPosting.objects.all()
@@ -40,9 +326,15 @@ class JobPostingViewSet(viewsets.ModelViewSet):
             try:
                 job_provider = JobProviderProfile.objects.filter(user=request.user).first()
                 job = serializer.save(job_provider=job_provider)
+                # post_save stored the signature; LSH lookup keeps this sub-linear in the table size
+                duplicates = find_duplicates(job.id, job.signature.minhash)
                 return Response({
                     "job_id": job.id,
-                    "message": "Job posted successfully"
+                    "message": "Job posted successfully",
+                    "possible_duplicates": [
+                        {"job_id": dup_id, "job_title": title, "similarity": score}
+                        for dup_id, title, score in duplicates
+                    ],
                 }, status=status.HTTP_201_CREATED)
             except Exception as e:
                 return Response({
@@ -51,76 +343,79 @@ class JobPostingViewSet(viewsets.ModelViewSet):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
     def retrieve(self, request, *args, **kwargs):
-        """GET /api/job-posting/{job_id} - Get job posting details"""
-        instance = self.get_object()
-        return Response({
-            "job_id": instance.id,
-            "job_title": instance.job_title,
-            "department": instance.department,
-            "job_type": instance.job_type,
-            "work_location": instance.work_location,
-            "work_mode": instance.work_mode,
-            "role_overview": instance.role_overview,
-            "key_responsibilities": instance.key_responsibilities,
-            "required_qualifications": instance.required_qualifications,
-            "preferred_qualifications": instance.preferred_qualifications,
-            "language_required": instance.languages_required,
-            "category": instance.job_category,
-            "salary_from": instance.salary_from,
-            "salary_to": instance.salary_to,
-            "currency": instance.currency,
-            "application_deadline": instance.application_deadline.strftime('%Y-%m-%d') if instance.application_deadline else None,
-            "interview_mode": instance.interview_mode,
-            "hiring_manager": instance.hiring_manager,
-            "number_of_openings": instance.number_of_openings,
-            "expected_start_date": instance.expected_start_date.strftime('%Y-%m-%d') if instance.expected_start_date else None,
-            "screening_questions": instance.screening_questions,
-            "health_insurance": instance.health_insurance,
-            "remote_work": instance.remote_work,
-            "paid_leave": instance.paid_leave,
-            "bonus": instance.bonus,
-            "date_posted": instance.date_posted.strftime('%Y-%m-%d') if instance.date_posted else None,
-            "job_status": instance.job_status,
-            
+        """GET /api/job-posting/{job_id} - Get job posting details (supports If-None-Match / If-Modified-Since)"""
+        job_id = kwargs.get(self.lookup_url_kwarg)
+        # Version and Last-Modified come from the row itself, so every worker agrees on them
+        state = job_detail_state(job_id)
+        if state is None:
+            raise Http404("No JobPosting matches the given query.")
+        version, last_modified = state
+        etag = job_detail_etag(job_id, version)
 
-        })
+        # Revalidation with a current ETag needs no payload at all
+        not_modified = get_conditional_response(request._request, etag=etag, last_modified=last_modified)
+        if not_modified is not None:
+            record_views('job_posting', [job_id])
+            return not_modified
+
+        payload = get_job_detail(job_id, version, lambda: _job_detail_dict(get_object_or_404(JobPosting, id=job_id)))
+        record_views('job_posting', [job_id])
+
+        response = Response(payload)
+        response['ETag'] = etag
+        if last_modified:
+            response['Last-Modified'] = http_date(last_modified)
+        # Shared caches may store it but must revalidate; the 304 path is cheap
+        patch_cache_control(response, public=True, no_cache=True)
+        return response
     
     def list(self, request, *args, **kwargs):
-        """GET /api/job-posting - List all job postings"""
-        queryset = self.get_queryset()
+        """GET /api/job-posting?q=&near=&radius_km=&facets=true&cursor=&limit= - List job postings, newest first or by relevance when ?q= is given (keyset paginated)"""
+        # Only load the columns the listing emits; the long text columns are never needed here
+        try:
+            queryset, search_query, filters = _filter_job_postings(
+                self.get_queryset().only(*JOB_LIST_FIELDS), request.query_params
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         
-        # Apply filters from query parameters
-        location = request.query_params.get('location')
-        if location:
-            queryset = queryset.filter(work_location__icontains=location)
+        facets = None
+        if request.query_params.get('facets') in ('1', 'true', 'True'):
+            facets = get_facets(queryset, filters)
         
-        job_type = request.query_params.get('job_type')
-        if job_type:
-            queryset = queryset.filter(job_type__icontains=job_type)
+        # Full-text search mode: relevance-ordered, served from the GIN index on search_vector
+        searching = search_query is not None
+        if searching:
+            queryset = annotate_search(queryset, search_query)
         
-        category = request.query_params.get('category')
-        if category:
-            queryset = queryset.filter(job_category__icontains=category)
+        try:
+            if searching:
+                jobs, next_cursor = keyset_paginate(queryset, request, ('search_rank', 'id'))
+            else:
+                jobs, next_cursor = keyset_paginate(queryset, request, ('date_posted', 'id'))
+        except InvalidCursor:
+            return Response({"error": "Invalid cursor"}, status=status.HTTP_400_BAD_REQUEST)
         
         # Format response
         jobs_list = []
-        for job in queryset:
-            jobs_list.append({
-                "job_id": job.id,
-                "job_title": job.job_title,
-                "salary_range": f"{job.salary_from:,} - {job.salary_to:,} {job.currency}" if job.salary_from and job.salary_to else "Not specified",
-                "location": job.work_location,
-                "date_posted": job.date_posted.strftime('%Y-%m-%d') if job.date_posted else None,
-                "job_status": job.job_status,
-                "job_category": job.job_category,
-                "job_type": job.job_type,
-            })
+        for job in jobs:
+            item = _job_list_item(job)
+            if searching:
+                item["rank"] = job.search_rank
+                item["snippet"] = job.search_snippet
+            if 'near' in filters:
+                item["distance_km"] = round(job.distance_km, 1)
+            jobs_list.append(item)
+        record_impressions('job_posting', [job.id for job in jobs])
         
-        return Response({"jobs": jobs_list})
+        response = {"jobs": jobs_list, "next_cursor": next_cursor}
+        if facets is not None:
+            response["facets"] = facets
+        return Response(response)
 
     @action(detail=False, methods=['get'], url_path='job-manage')
     def job_manage(self, request):
-        """GET /api/job-posting/job-manage?job_provider_id=ID - Return all jobs, applications, interviews and offers for a job provider"""
+        """GET /api/job-posting/job-manage?job_provider_id=ID&include=interviews,offers&limit=&cursor= - Return jobs, applications, interviews and offers for a job provider"""
         job_provider_id = request.query_params.get('job_provider_id') or request.query_params.get('provider_id')
 
         # If not provided, try to infer from authenticated user's JobProviderProfile
@@ -136,97 +431,104 @@ class JobPostingViewSet(viewsets.ModelViewSet):
         if not job_provider_id:
             return Response({"error": "job_provider_id is required"}, status=status.HTTP_400_BAD_REQUEST)
 
-        # Collect jobs for this provider
-        jobs_qs = JobPosting.objects.filter(job_provider_id=job_provider_id)
+        include = _parse_manage_include(request.query_params.get('include'))
+
+        # Fetch the whole job -> application -> interview/offer tree in a fixed
+        # number of queries (one per level) and group it in memory.
+        applications_qs = JobApplication.objects.order_by('-date_applied')
+        prefetches = []
+        if 'interviews' in include:
+            prefetches.append(Prefetch('interviews', queryset=JobInterview.objects.order_by('-interview_date')))
+        if 'offers' in include:
+            prefetches.append(Prefetch('offers', queryset=JobOffer.objects.order_by('-date_offered')))
+        if prefetches:
+            applications_qs = applications_qs.prefetch_related(*prefetches)
+
+        jobs_qs = JobPosting.objects.filter(job_provider_id=job_provider_id).select_related('pipeline_stats').prefetch_related(
+            Prefetch('jobapplication_set', queryset=applications_qs)
+        )
+
+        # Pagination over jobs is optional: only applied when ?limit= or ?cursor= is sent
+        next_cursor = None
+        paginated = 'limit' in request.query_params or 'cursor' in request.query_params
+        if paginated:
+            try:
+                jobs, next_cursor = keyset_paginate(jobs_qs, request, ('date_posted', 'id'))
+            except InvalidCursor:
+                return Response({"error": "Invalid cursor"}, status=status.HTTP_400_BAD_REQUEST)
+        else:
+            jobs = jobs_qs
 
         result_jobs = []
-        for job in jobs_qs:
-            job_dict = {
-                "job_id": job.id,
-                "job_title": job.job_title,
-                "department": job.department,
-                "job_type": job.job_type,
-                "work_location": job.work_location,
-                "work_mode": job.work_mode,
-                "role_overview": job.role_overview,
-                "key_responsibilities": job.key_responsibilities,
-                "required_qualifications": job.required_qualifications,
-                "preferred_qualifications": job.preferred_qualifications,
-                "languages_required": job.languages_required,
-                "job_category": job.job_category,
-                "salary_from": job.salary_from,
-                "salary_to": job.salary_to,
-                "currency": job.currency,
-                "application_deadline": job.application_deadline.strftime('%Y-%m-%d') if job.application_deadline else None,
-                "interview_mode": job.interview_mode,
-                "hiring_manager": job.hiring_manager,
-                "number_of_openings": job.number_of_openings,
-                "expected_start_date": job.expected_start_date.strftime('%Y-%m-%d') if job.expected_start_date else None,
-                "screening_questions": job.screening_questions,
-                "file_upload": job.file_upload,
-                "health_insurance": job.health_insurance,
-                "remote_work": job.remote_work,
-                "paid_leave": job.paid_leave,
-                "bonus": job.bonus,
-                "date_posted": job.date_posted.strftime('%Y-%m-%d %H:%M:%S') if job.date_posted else None,
-                "job_status": job.job_status,
-            }
-
-            # Applications for this job
-            applications_qs = JobApplication.objects.filter(job=job)
-            applications_list = []
-            for app in applications_qs:
-                app_dict = {
-                    "application_id": app.id,
-                    "freelancer_id": app.freelancer_id,
-                    "resume_url": app.resume.url if app.resume else None,
-                    "cover_letter": app.cover_letter,
-                    "expected_rate": app.expected_rate,
-                    "status": app.status,
-                    "date_applied": app.date_applied.strftime('%Y-%m-%d %H:%M:%S') if app.date_applied else None,
-                    "rating": app.rating,
-                    "comments": app.comments,
-                }
-
-                # Interviews for this application
-                interviews_qs = JobInterview.objects.filter(application=app)
-                interviews_list = []
-                for iv in interviews_qs:
-                    interviews_list.append({
-                        "interview_id": iv.id,
-                        "interview_date": iv.interview_date.strftime('%Y-%m-%d %H:%M:%S') if iv.interview_date else None,
-                        "interview_mode": iv.interview_mode,
-                        "status": iv.status,
-                        "interview_link": iv.interview_link,
-                        "interview_notes": iv.interview_notes,
-                        "rating": iv.rating,
-                        "comments": iv.comments,
-                    })
-
-                # Offers for this application
-                offers_qs = JobOffer.objects.filter(application=app)
-                offers_list = []
-                for of in offers_qs:
-                    offers_list.append({
-                        "offer_id": of.id,
-                        "offer_status": of.offer_status,
-                        "offer_details": of.offer_details,
-                        "date_offered": of.date_offered.strftime('%Y-%m-%d %H:%M:%S') if of.date_offered else None,
-                        "date_accepted": of.date_accepted.strftime('%Y-%m-%d %H:%M:%S') if of.date_accepted else None,
-                        "date_rejected": of.date_rejected.strftime('%Y-%m-%d %H:%M:%S') if of.date_rejected else None,
-                    })
-
-                app_dict['interviews'] = interviews_list
-                app_dict['offers'] = offers_list
+        for job in jobs:
+            job_dict = _manage_job_dict(job)
 
+            applications_list = []
+            for app in job.jobapplication_set.all():
+                app_dict = _manage_application_dict(app)
+                if 'interviews' in include:
+                    app_dict['interviews'] = [_manage_interview_dict(iv) for iv in app.interviews.all()]
+                if 'offers' in include:
+                    app_dict['offers'] = [_manage_offer_dict(of) for of in app.offers.all()]
                 applications_list.append(app_dict)
 
             job_dict['applications'] = applications_list
+            job_dict['pipeline'] = stats_dict(_pipeline_stats_or_none(job))
 
             result_jobs.append(job_dict)
 
+        if paginated:
+            return Response({"job_provider_id": job_provider_id, "jobs": result_jobs, "next_cursor": next_cursor})
         return Response({"job_provider_id": job_provider_id, "jobs": result_jobs})
     
+    @action(detail=False, methods=['post'], url_path='import')
+    def bulk_import(self, request):
+        """POST /api/job-posting/import - Bulk create postings from an uploaded CSV or JSONL file
+
+        Multipart field 'file'; optional 'format' (csv|jsonl, defaults to the file extension)
+        and 'dry_run'. Returns counts plus a per-row error report.
+        """
+        from profiles.models import JobProviderProfile
+        job_provider = JobProviderProfile.objects.filter(user=request.user).first()
+        if not job_provider:
+            return Response({"error": "A job provider profile is required to import postings"}, status=status.HTTP_403_FORBIDDEN)
+
+        upload = request.FILES.get('file')
+        if not upload:
+            return Response({"error": "file is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        fmt = request.data.get('format') or detect_format(upload.name)
+        if fmt not in IMPORT_FORMATS:
+            return Response({"error": f"format must be one of: {', '.join(IMPORT_FORMATS)}"}, status=status.HTTP_400_BAD_REQUEST)
+
+        dry_run = str(request.data.get('dry_run', '')).lower() in ('1', 'true')
+        try:
+            report = import_job_postings(upload.file, fmt, job_provider, dry_run=dry_run)
+        except ImportFileError as e:
+            # e.report lists any rows committed before the problem was reached
+            return Response({"error": str(e), **(e.report or {"created": 0})}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(report, status=status.HTTP_200_OK if dry_run or not report["created"] else status.HTTP_201_CREATED)
+    
+    @action(detail=True, methods=['get'], url_path='views')
+    def view_counts(self, request, job_id=None):
+        """GET /api/job-posting/{job_id}/views - Detail views and listing impressions (job provider only)"""
+        job = get_object_or_404(JobPosting.objects.select_related('job_provider').only('id', 'job_provider__user_id'), id=job_id)
+        
+        if job.job_provider.user_id != request.user.id:
+            return Response(
+                {"error": "You do not have permission to view stats for this job posting"},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        
+        return Response({"job_id": job.id, **get_counts('job_posting', job.id)})
+
+    @action(detail=True, methods=['get'], url_path='stats')
+    def pipeline_stats(self, request, job_id=None):
+        """GET /api/job-posting/{job_id}/stats - Application, interview and offer counts by status"""
+        job = get_object_or_404(JobPosting.objects.select_related('pipeline_stats'), id=job_id)
+        return Response({"job_id": job.id, **stats_dict(_pipeline_stats_or_none(job))})
+    
     def update(self, request, *args, **kwargs):
         """PUT /api/job-posting/{job_id} - Update job posting"""
         partial = kwargs.pop('partial', False)
@@ -261,6 +563,12 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
     lookup_field = 'id'
     lookup_url_kwarg = 'application_id'
     parser_classes = [JSONParser, FormParser, MultiPartParser]
+
+    def get_permissions(self):
+        """Batch updates act on a provider's own postings, so they require auth."""
+        if getattr(self, 'action', None) == 'batch_update_status':
+            return [permissions.IsAuthenticated()]
+        return super().get_permissions()
     
     def create(self, request, *args, **kwargs):
         """POST /api/job-application - Apply to job"""
@@ -273,13 +581,34 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
             except JobPosting.DoesNotExist:
                 return Response({"error": "Job posting not found"}, status=status.HTTP_404_NOT_FOUND)
 
-            application = JobApplication.objects.create(
-                job=job,
-                freelancer_id=serializer.validated_data.get('freelancer_id'),
-                resume=serializer.validated_data.get('resume'),
-                cover_letter=serializer.validated_data.get('cover_letter'),
-                expected_rate=serializer.validated_data.get('expected_rate'),
-            )
+            resume = serializer.validated_data.get('resume')
+            upload_id = serializer.validated_data.pop('resume_upload_id', None)
+            if upload_id:
+                upload = UploadSession.objects.filter(id=upload_id, status='complete').first()
+                if upload is None or (upload.user_id and upload.user_id != request.user.id):
+                    return Response({"error": "Completed upload not found"}, status=status.HTTP_404_NOT_FOUND)
+                # Point at the stored blob; nothing is copied
+                resume = upload.blob
+            elif serializer.validated_data.pop('use_profile_resume', False) and not resume:
+                freelancer_id = serializer.validated_data.get('freelancer_id')
+                if not request.user.is_authenticated or freelancer_id != request.user.id:
+                    return Response(
+                        {"error": "You can only apply with your own profile resume"},
+                        status=status.HTTP_403_FORBIDDEN
+                    )
+                resume = FreelancerProfile.objects.filter(user_id=freelancer_id).values_list('resume', flat=True).first()
+                if not resume:
+                    return Response({"error": "Freelancer profile has no resume"}, status=status.HTTP_400_BAD_REQUEST)
+
+            with transaction.atomic():
+                application = JobApplication.objects.create(
+                    job=job,
+                    freelancer_id=serializer.validated_data.get('freelancer_id'),
+                    resume=resume,
+                    cover_letter=serializer.validated_data.get('cover_letter'),
+                    expected_rate=serializer.validated_data.get('expected_rate'),
+                )
+                record_application_status(job.id, None, application.status)
 
             return Response({
                 "application_id": application.id,
@@ -291,26 +620,40 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
     # ✅ Single version of get_applications_for_job
     @action(detail=False, methods=['get'], url_path=r'job/(?P<job_id>[0-9]+)')
     def get_applications_for_job(self, request, job_id=None):
-        """GET /api/job-application/job/{job_id} - Fetch applications for a job"""
+        """GET /api/job-application/job/{job_id} - Fetch applications for a job (?q= searches resume text, ?sort=score ranks by fit)"""
         applications = self.queryset.filter(job_id=job_id)
         applications_list = []
 
+        search_query = None
+        q = request.query_params.get('q', '').strip()
+        if q:
+            search_query = build_search_query(q)
+            if search_query is None:
+                return Response({"applications": []})
+            resumes = ResumeDocument.objects.filter(blob=OuterRef('resume'), search_vector=search_query)
+            applications = applications.filter(Exists(resumes)).annotate(
+                resume_rank=Subquery(resumes.annotate(
+                    rank=SearchRank(F('search_vector'), search_query)
+                ).values('rank')[:1])
+            ).order_by('-resume_rank', '-date_applied')
+
         # Fetch jobprovider info
         job_posting = JobPosting.objects.select_related('job_provider').filter(id=job_id).first()
         jobprovider_user_id = job_posting.job_provider.user_id if job_posting and job_posting.job_provider else None
 
+        # Resolve every applicant's profile up front instead of one query per application
+        applications = list(applications)
+        freelancers = resolve_freelancers(app.freelancer_id for app in applications)
+
+        scores = None
+        if request.query_params.get('sort') == 'score' and job_posting is not None:
+            scores = get_applicant_scores(job_posting, lambda: _applicant_pool(job_posting.id))
+            applications.sort(key=lambda app: scores.get(app.id, {}).get("score", 0), reverse=True)
+
         for app in applications:
-            # Get freelancer profile and name
-            profile = FreelancerProfile.objects.select_related('user').filter(user_id=app.freelancer_id).first()
-            if profile:
-                freelancer_name = (
-                    profile.full_name
-                    or (profile.user.username if profile.user else f"Freelancer {app.freelancer_id}")
-                )
-                freelancer_user_id = profile.user_id
-            else:
-                freelancer_name = f"Freelancer {app.freelancer_id}"
-                freelancer_user_id = app.freelancer_id
+            freelancer = freelancers.get(app.freelancer_id) or fallback_freelancer(app.freelancer_id)
+            freelancer_name = freelancer.name
+            freelancer_user_id = freelancer.user_id
 
             applications_list.append({
                 "application_id": app.id,
@@ -324,6 +667,12 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
                 "rating": app.rating,
                 "chat_users": [freelancer_user_id, jobprovider_user_id] if jobprovider_user_id else [freelancer_user_id],
             })
+            if search_query is not None:
+                applications_list[-1]["resume_rank"] = app.resume_rank
+            if scores is not None:
+                fit = scores.get(app.id, {})
+                applications_list[-1]["score"] = fit.get("score")
+                applications_list[-1]["score_breakdown"] = fit.get("breakdown")
 
         return Response({"applications": applications_list})
 
@@ -343,12 +692,16 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
             return Response({"error": "Provide at least 'status' or 'rating' to update."},
                             status=status.HTTP_400_BAD_REQUEST)
 
-        if status_value:
-            application.status = status_value
-        if rating_value is not None:
-            application.rating = rating_value
-
-        application.save()
+        with transaction.atomic():
+            # Lock and re-read the row so concurrent updates cannot both apply the same counter delta
+            application = JobApplication.objects.select_for_update().get(id=application.id)
+            old_status = application.status
+            if status_value:
+                application.status = status_value
+            if rating_value is not None:
+                application.rating = rating_value
+            application.save()
+            record_application_status(application.job_id, old_status, application.status)
 
         return Response({
             "message": "Application updated successfully",
@@ -357,6 +710,200 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
             "rating": application.rating
         }, status=status.HTTP_200_OK)
 
+    @action(detail=False, methods=['post'], url_path='batch-update')
+    def batch_update_status(self, request):
+        """POST /api/job-application/batch-update/ - Update status or rating of many applications at once"""
+        serializer = JobApplicationBatchUpdateSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        data = serializer.validated_data
+        results = batch_update_applications(
+            data['application_ids'],
+            request.user.id,
+            status=data.get('status'),
+            rating=data.get('rating'),
+            comments=data.get('comments'),
+        )
+        updated = sum(1 for r in results if r["updated"])
+        return Response({
+            "message": f"{updated} of {len(results)} applications updated",
+            "updated": updated,
+            "failed": len(results) - updated,
+            "results": results,
+        }, status=status.HTTP_200_OK)
+
+class ArchivedJobPostingViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Read-only access to postings moved to the archive by `manage.py archive_job_postings`
+    """
+    queryset = ArchivedJobPosting.objects.all()
+    lookup_field = 'job_id'
+    lookup_url_kwarg = 'job_id'
+    permission_classes = [permissions.IsAuthenticated]
+
+    def list(self, request, *args, **kwargs):
+        """GET /api/job-archive/?job_provider_id=ID&limit=&cursor= - Archived postings of a job provider, newest first"""
+        job_provider_id = request.query_params.get('job_provider_id')
+        if not job_provider_id:
+            from profiles.models import JobProviderProfile
+            profile = JobProviderProfile.objects.filter(user=request.user).first()
+            job_provider_id = profile.id if profile else None
+        if not job_provider_id:
+            return Response({"error": "job_provider_id is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        archived = ArchivedJobPosting.objects.filter(job_provider_id=job_provider_id).values(
+            'job_id', 'job_title', 'job_status', 'date_posted', 'date_archived', 'application_count'
+        )
+        try:
+            rows, next_cursor = keyset_paginate(archived, request, ('date_posted', 'job_id'))
+        except InvalidCursor:
+            return Response({"error": "Invalid cursor"}, status=status.HTTP_400_BAD_REQUEST)
+
+        jobs = [{
+            "job_id": row['job_id'],
+            "job_title": row['job_title'],
+            "job_status": row['job_status'],
+            "date_posted": row['date_posted'].strftime('%Y-%m-%d') if row['date_posted'] else None,
+            "date_archived": row['date_archived'].strftime('%Y-%m-%d') if row['date_archived'] else None,
+            "application_count": row['application_count'],
+        } for row in rows]
+        return Response({"jobs": jobs, "next_cursor": next_cursor})
+
+    def retrieve(self, request, *args, **kwargs):
+        """GET /api/job-archive/{job_id}/ - Archived posting with its applications, interviews and offers"""
+        archived = self.get_object()
+        return Response({
+            "job_id": archived.job_id,
+            "date_archived": archived.date_archived.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            **archived.data,
+        })
+
+
+class SavedJobSearchViewSet(viewsets.ModelViewSet):
+    """
+    A freelancer's saved job searches; matching postings are collected as they are
+    posted and emailed by `manage.py send_job_alerts`
+    """
+    serializer_class = SavedJobSearchSerializer
+    lookup_field = 'id'
+    lookup_url_kwarg = 'search_id'
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        return SavedJobSearch.objects.filter(user=self.request.user)
+
+    def list(self, request, *args, **kwargs):
+        """GET /api/job-saved-search/ - The user's saved searches"""
+        return Response({"searches": self.get_serializer(self.get_queryset(), many=True).data})
+
+    def create(self, request, *args, **kwargs):
+        """POST /api/job-saved-search/ - Save a job search"""
+        serializer = self.get_serializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        search = serializer.save(user=request.user)
+        return Response(self.get_serializer(search).data, status=status.HTTP_201_CREATED)
+
+    def partial_update(self, request, *args, **kwargs):
+        """PATCH /api/job-saved-search/{search_id}/ - Change a saved search or pause it (is_active)"""
+        serializer = self.get_serializer(self.get_object(), data=request.data, partial=True)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        return Response(self.get_serializer(serializer.save()).data)
+
+    def destroy(self, request, *args, **kwargs):
+        """DELETE /api/job-saved-search/{search_id}/ - Delete a saved search"""
+        self.get_object().delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @action(detail=True, methods=['get'], url_path='matches')
+    def matches(self, request, search_id=None):
+        """GET /api/job-saved-search/{search_id}/matches/?limit=&cursor= - Postings that matched, newest first"""
+        search = self.get_object()
+        matched = SavedSearchMatch.objects.filter(search=search).values(
+            'id', 'job_id', 'job__job_title', 'job__work_location', 'job__job_status', 'date_matched', 'notified_at'
+        )
+        try:
+            rows, next_cursor = keyset_paginate(matched, request, ('date_matched', 'id'))
+        except InvalidCursor:
+            return Response({"error": "Invalid cursor"}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            "search_id": search.id,
+            "matches": [{
+                "job_id": row['job_id'],
+                "job_title": row['job__job_title'],
+                "work_location": row['job__work_location'],
+                "job_status": row['job__job_status'],
+                "date_matched": row['date_matched'].strftime('%Y-%m-%dT%H:%M:%SZ'),
+                "notified": row['notified_at'] is not None,
+            } for row in rows],
+            "next_cursor": next_cursor,
+        })
+
+
+class UploadSessionViewSet(viewsets.ModelViewSet):
+    """
+    Resumable chunked uploads into content-addressed storage
+    """
+    queryset = UploadSession.objects.all()
+    serializer_class = UploadSessionSerializer
+    lookup_field = 'id'
+    lookup_url_kwarg = 'upload_id'
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        return UploadSession.objects.filter(user=self.request.user)
+
+    def create(self, request, *args, **kwargs):
+        """POST /api/job-upload/ - Start a chunked upload"""
+        serializer = self.get_serializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            session = start_upload(
+                request.user,
+                serializer.validated_data['filename'],
+                serializer.validated_data['size'],
+                serializer.validated_data.get('sha256', ''),
+            )
+        except UploadError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(_upload_dict(session), status=status.HTTP_201_CREATED)
+
+    def retrieve(self, request, *args, **kwargs):
+        """GET /api/job-upload/{upload_id}/ - Upload progress (the offset to resume from)"""
+        return Response(_upload_dict(self.get_object()))
+
+    @action(detail=True, methods=['put'], url_path='chunk')
+    def upload_chunk(self, request, upload_id=None):
+        """PUT /api/job-upload/{upload_id}/chunk/?offset=N - Append raw bytes (application/octet-stream)"""
+        session = self.get_object()
+        try:
+            offset = int(request.query_params.get('offset', session.received))
+            length = int(request.META.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            return Response({"error": "offset and Content-Length must be integers"}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            session = append_chunk(session.id, request.stream, offset, length)
+        except OffsetMismatch as e:
+            return Response({"error": str(e), "offset": e.expected}, status=status.HTTP_409_CONFLICT)
+        except UploadError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(_upload_dict(session))
+
+    @action(detail=True, methods=['post'], url_path='complete')
+    def complete(self, request, upload_id=None):
+        """POST /api/job-upload/{upload_id}/complete/ - Verify and store the uploaded file"""
+        session = self.get_object()
+        try:
+            session = complete_upload(session.id)
+        except UploadError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(_upload_dict(session))
+
+
 class JobInterviewViewSet(viewsets.ModelViewSet):
     """
     Simplified JobInterview ViewSet following the example pattern
@@ -365,6 +912,12 @@ class JobInterviewViewSet(viewsets.ModelViewSet):
     serializer_class = JobInterviewSerializer
     lookup_field = 'id'
     lookup_url_kwarg = 'interview_id'
+
+    def get_permissions(self):
+        """Availability reveals booked interviews, so it requires auth."""
+        if getattr(self, 'action', None) == 'availability':
+            return [permissions.IsAuthenticated()]
+        return super().get_permissions()
     
     @action(detail=False, methods=['post'], url_path='schedule')
     def schedule_interview(self, request):
@@ -396,22 +949,42 @@ class JobInterviewViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
+            interview_date = serializer.validated_data['interview_date']
+            duration = serializer.validated_data.get('duration_minutes', 60)
+            allow_conflicts = _parse_flag(request.data.get('allow_conflicts'))
+
             # Create the interview manually to ensure proper field handling
-            interview = JobInterview.objects.create(
-                application=application,
-                # Populate new denormalized fields for convenience/queries
-                job=application.job,
-                freelancer_id=application.freelancer_id,
-                interview_date=serializer.validated_data['interview_date'],
-                interview_mode=serializer.validated_data['interview_mode'],
-                interview_link=serializer.validated_data.get('interview_link', ''),
-                interview_notes=serializer.validated_data.get('interview_notes', ''),
-                status='Scheduled'
-            )
+            with transaction.atomic():
+                # Serialize scheduling per job and freelancer so concurrent requests can't both pass the check
+                lock_schedules(application.job_id, application.freelancer_id)
+                conflicts = find_conflicts(
+                    interview_date, duration,
+                    freelancer_id=application.freelancer_id, job_id=application.job_id,
+                )
+                if conflicts and not allow_conflicts:
+                    return Response({
+                        "error": "Interview overlaps an existing interview",
+                        "conflicts": [_conflict_dict(iv, application) for iv in conflicts],
+                    }, status=status.HTTP_409_CONFLICT)
+
+                interview = JobInterview.objects.create(
+                    application=application,
+                    # Populate new denormalized fields for convenience/queries
+                    job=application.job,
+                    freelancer_id=application.freelancer_id,
+                    interview_date=interview_date,
+                    duration_minutes=duration,
+                    interview_mode=serializer.validated_data['interview_mode'],
+                    interview_link=serializer.validated_data.get('interview_link', ''),
+                    interview_notes=serializer.validated_data.get('interview_notes', ''),
+                    status='Scheduled'
+                )
+                record_interview_status(application.job_id, None, interview.status)
             
             return Response({
                 "interview_id": interview.id,
-                "message": "Interview scheduled successfully"
+                "message": "Interview scheduled successfully",
+                "conflicts": [_conflict_dict(iv, application) for iv in conflicts],
             }, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
@@ -452,17 +1025,22 @@ class JobInterviewViewSet(viewsets.ModelViewSet):
         if not interview_id:
             return Response({"error": "interview_id is required"}, status=status.HTTP_400_BAD_REQUEST)
         
-        interview = get_object_or_404(JobInterview, id=interview_id)
-        
         rating = request.data.get('rating')
         comments = request.data.get('comments')
         
-        if rating:
-            interview.rating = rating
-        if comments:
-            interview.comments = comments
-        interview.status = 'Completed'
-        interview.save()
+        with transaction.atomic():
+            # Locked read of the current status; see update_application_status
+            interview = get_object_or_404(
+                JobInterview.objects.select_related('application').select_for_update(of=('self',)), id=interview_id
+            )
+            old_status = interview.status
+            if rating:
+                interview.rating = rating
+            if comments:
+                interview.comments = comments
+            interview.status = 'Completed'
+            interview.save()
+            record_interview_status(interview.application.job_id, old_status, interview.status)
         
         return Response({"message": "Feedback submitted successfully"})
     
@@ -473,20 +1051,118 @@ class JobInterviewViewSet(viewsets.ModelViewSet):
         if not interview_id:
             return Response({"error": "interview_id is required"}, status=status.HTTP_400_BAD_REQUEST)
         
-        interview = get_object_or_404(JobInterview, id=interview_id)
+        interview = get_object_or_404(JobInterview.objects.select_related('application'), id=interview_id)
         
         new_date_time = request.data.get('new_date_time')
         new_interview_link = request.data.get('new_interview_link')
+        new_duration = request.data.get('new_duration_minutes')
         
         if new_date_time:
             from datetime import datetime
-            interview.interview_date = datetime.fromisoformat(new_date_time.replace('Z', '+00:00'))
-        if new_interview_link:
-            interview.interview_link = new_interview_link
-        interview.status = 'Rescheduled'
-        interview.save()
+            try:
+                new_date_time = datetime.fromisoformat(new_date_time.replace('Z', '+00:00'))
+            except ValueError:
+                return Response({"error": "new_date_time must be an ISO 8601 datetime"}, status=status.HTTP_400_BAD_REQUEST)
+            if timezone.is_naive(new_date_time):
+                new_date_time = timezone.make_aware(new_date_time)
+        if new_duration not in (None, ''):
+            try:
+                new_duration = int(new_duration)
+            except (TypeError, ValueError):
+                new_duration = None
+            if new_duration is None or not MIN_INTERVIEW_MINUTES <= new_duration <= MAX_INTERVIEW_MINUTES:
+                return Response(
+                    {"error": f"new_duration_minutes must be between {MIN_INTERVIEW_MINUTES} and {MAX_INTERVIEW_MINUTES}"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        allow_conflicts = _parse_flag(request.data.get('allow_conflicts'))
+        with transaction.atomic():
+            lock_schedules(interview.application.job_id, interview.application.freelancer_id)
+            # Locked re-read: the status the counter delta is computed from must be current
+            interview = JobInterview.objects.select_related('application').select_for_update(of=('self',)).get(id=interview.id)
+            old_status = interview.status
+            if new_date_time:
+                interview.interview_date = new_date_time
+            if new_duration not in (None, ''):
+                interview.duration_minutes = new_duration
+            if new_interview_link:
+                interview.interview_link = new_interview_link
+            interview.status = 'Rescheduled'
+            conflicts = find_conflicts(
+                interview.interview_date, interview.duration_minutes,
+                freelancer_id=interview.application.freelancer_id, job_id=interview.application.job_id,
+                exclude_id=interview.id,
+            )
+            if conflicts and not allow_conflicts:
+                return Response({
+                    "error": "Interview overlaps an existing interview",
+                    "conflicts": [_conflict_dict(iv, interview.application) for iv in conflicts],
+                }, status=status.HTTP_409_CONFLICT)
+            interview.save()
+            record_interview_status(interview.application.job_id, old_status, interview.status)
         
-        return Response({"message": "Interview rescheduled successfully"})
+        return Response({
+            "message": "Interview rescheduled successfully",
+            "conflicts": [_conflict_dict(iv, interview.application) for iv in conflicts],
+        })
+
+    @action(detail=False, methods=['get'], url_path='availability')
+    def availability(self, request):
+        """GET /api/job-interview/availability - Free interview slots for a job and/or freelancer over a date range"""
+        params = request.query_params
+        job_id = params.get('job_id')
+        freelancer_id = params.get('freelancer_id')
+        if not job_id and not freelancer_id:
+            return Response({"error": "job_id or freelancer_id is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            job_id = int(job_id) if job_id else None
+            freelancer_id = int(freelancer_id) if freelancer_id else None
+            today = timezone.localdate()
+            start_date = date.fromisoformat(params['start']) if params.get('start') else today
+            end_date = date.fromisoformat(params['end']) if params.get('end') else start_date + timedelta(days=6)
+            slot_minutes = int(params.get('slot_minutes', 60))
+            day_start = int(params.get('day_start', 9))
+            day_end = int(params.get('day_end', 17))
+        except ValueError:
+            return Response(
+                {"error": "job_id, freelancer_id, slot_minutes, day_start and day_end must be integers; start and end must be YYYY-MM-DD"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if not can_view_availability(request.user, job_id=job_id, freelancer_id=freelancer_id):
+            return Response(
+                {"error": "You do not have permission to view this availability"},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        if end_date < start_date or (end_date - start_date).days >= MAX_AVAILABILITY_DAYS:
+            return Response(
+                {"error": f"end must be on or after start and within {MAX_AVAILABILITY_DAYS} days"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if not MIN_INTERVIEW_MINUTES <= slot_minutes <= MAX_INTERVIEW_MINUTES:
+            return Response(
+                {"error": f"slot_minutes must be between {MIN_INTERVIEW_MINUTES} and {MAX_INTERVIEW_MINUTES}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if not 0 <= day_start < day_end <= 24:
+            return Response({"error": "day_start and day_end must satisfy 0 <= day_start < day_end <= 24"}, status=status.HTTP_400_BAD_REQUEST)
+
+        slots = free_slots(
+            start_date, end_date, slot_minutes, day_start, day_end,
+            freelancer_id=freelancer_id, job_id=job_id,
+        )
+        return Response({
+            "job_id": job_id,
+            "freelancer_id": freelancer_id,
+            "start": start_date.isoformat(),
+            "end": end_date.isoformat(),
+            "slot_minutes": slot_minutes,
+            "slots": [
+                {"start": s.isoformat(), "end": e.isoformat()}
+                for s, e in slots
+            ],
+        })
 
 
 class JobOfferViewSet(viewsets.ModelViewSet):
@@ -517,16 +1193,14 @@ class JobOfferViewSet(viewsets.ModelViewSet):
         except JobApplication.DoesNotExist:
             return Response({"error": "Job application not found"}, status=status.HTTP_404_NOT_FOUND)
 
-        # store offer_details as JSON string in the TextField
-        import json
-        offer_details_text = json.dumps(offer_details)
-
-        offer = JobOffer.objects.create(
-            application=application,
-            offer_status=offer_status,
-            offer_details=offer_details_text,
-            multi_doc=multi_doc
-        )
+        with transaction.atomic():
+            offer = JobOffer.objects.create(
+                application=application,
+                offer_status=offer_status,
+                offer_details=offer_details,
+                multi_doc=multi_doc
+            )
+            record_offer_status(application.job_id, None, offer.offer_status)
 
         return Response({
             "offer_id": offer.id,
@@ -551,7 +1225,7 @@ class JobOfferViewSet(viewsets.ModelViewSet):
             )
         
         try:
-            offer = JobOffer.objects.get(id=offer_id)
+            offer = JobOffer.objects.select_related('application').get(id=offer_id)
         except JobOffer.DoesNotExist:
             return Response(
                 {"error": "Job offer not found"},
@@ -565,37 +1239,41 @@ class JobOfferViewSet(viewsets.ModelViewSet):
         
         validated = serializer.validated_data
         
-        # Update offer_status
-        if 'offer_status' in validated:
-            old_status = offer.offer_status
-            new_status = validated['offer_status']
-            offer.offer_status = new_status
+        with transaction.atomic():
+            # Lock and re-read the offer so concurrent updates cannot both apply the same counter delta
+            offer = JobOffer.objects.select_related('application').select_for_update(of=('self',)).get(id=offer.id)
+            old_offer_status = offer.offer_status
             
-            # Update date fields based on status changes
-            if new_status == 'Accepted' and old_status != 'Accepted':
-                offer.date_accepted = timezone.now()
-            elif new_status == 'Rejected' and old_status != 'Rejected':
-                offer.date_rejected = timezone.now()
-        
-        # Update offer_details
-        if 'offer_details' in validated:
-            offer_details = validated['offer_details']
-            # If it's already a JSON string, keep it; otherwise convert it
-            if isinstance(offer_details, str):
-                try:
-                    # Validate it's valid JSON
-                    json.loads(offer_details)
-                    offer.offer_details = offer_details
-                except json.JSONDecodeError:
+            # Update offer_status
+            if 'offer_status' in validated:
+                old_status = offer.offer_status
+                new_status = validated['offer_status']
+                offer.offer_status = new_status
+                
+                # Update date fields based on status changes
+                if new_status == 'Accepted' and old_status != 'Accepted':
+                    offer.date_accepted = timezone.now()
+                elif new_status == 'Rejected' and old_status != 'Rejected':
+                    offer.date_rejected = timezone.now()
+            
+            # Update offer_details
+            if 'offer_details' in validated:
+                offer_details = validated['offer_details']
+                # Clients send a JSON string; store the decoded document (plain text is kept as a JSON string)
+                if isinstance(offer_details, str):
+                    try:
+                        offer.offer_details = json.loads(offer_details)
+                    except json.JSONDecodeError:
+                        offer.offer_details = offer_details
+                else:
                     offer.offer_details = offer_details
-            else:
-                offer.offer_details = json.dumps(offer_details)
-        
-        # Update multi_doc if provided
-        if 'multi_doc' in validated and validated['multi_doc']:
-            offer.multi_doc = validated['multi_doc']
-        
-        offer.save()
+            
+            # Update multi_doc if provided
+            if 'multi_doc' in validated and validated['multi_doc']:
+                offer.multi_doc = validated['multi_doc']
+            
+            offer.save()
+            record_offer_status(offer.application.job_id, old_offer_status, offer.offer_status)
         
         return Response({
             "offer_id": offer.id,
@@ -609,23 +1287,38 @@ class JobOfferViewSet(viewsets.ModelViewSet):
     )
     @action(detail=False, methods=['get'], url_path='all')
     def get_all_offers(self, request):
-        """GET /api/job-offer/all - Get all job offers with all fields"""
-        offers = JobOffer.objects.all().select_related('application')
-        
+        """GET /api/job-offer/all - Job offers, newest first, filtered and paginated
+
+        Filters: status, job_id, application_id, salary_min, salary_max,
+        start_from, start_to (YYYY-MM-DD). Page with ?limit= and ?cursor=.
+        """
+        offers = JobOffer.objects.only(*OFFER_LIST_FIELDS)
+        try:
+            offers = _filter_offers(offers, request.query_params)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            page, next_cursor = keyset_paginate(offers, request, ('date_offered', 'id'))
+        except InvalidCursor:
+            return Response({"error": "Invalid cursor"}, status=status.HTTP_400_BAD_REQUEST)
+
         offers_list = []
-        for offer in offers:
+        for offer in page:
             offers_list.append({
                 "offer_id": offer.id,
-                "application_id": offer.application.id,
+                "application_id": offer.application_id,
                 "offer_status": offer.offer_status,
                 "offer_details": offer.offer_details,
+                "salary": offer.salary,
+                "start_date": offer.start_date.strftime('%Y-%m-%d') if offer.start_date else None,
                 "date_offered": offer.date_offered.strftime('%Y-%m-%d %H:%M:%S') if offer.date_offered else None,
                 "date_accepted": offer.date_accepted.strftime('%Y-%m-%d %H:%M:%S') if offer.date_accepted else None,
                 "date_rejected": offer.date_rejected.strftime('%Y-%m-%d %H:%M:%S') if offer.date_rejected else None,
                 "multi_doc": offer.multi_doc.url if offer.multi_doc else None,
             })
         
-        return Response({"offers": offers_list}, status=status.HTTP_200_OK)
+        return Response({"offers": offers_list, "next_cursor": next_cursor}, status=status.HTTP_200_OK)
 
 
 class ApplicationWithdrawalViewSet(viewsets.ModelViewSet):
@@ -638,26 +1331,17 @@ class ApplicationWithdrawalViewSet(viewsets.ModelViewSet):
 def get_jobs_for_freelancer(request, freelance_id):
     """GET /api/freelance/{freelance_id} - Return jobs related to a freelancer.
 
-    Response: list of jobs with fields: job_id, job_title, job_category, date_posted, job_status
+    Response: list of jobs with fields: job_id, job_title, job_category, date_posted, job_status,
+    application_id, application_status, date_applied (newest application first).
+    Send ?limit= and/or ?cursor= to page through the list.
     """
-    # Find applications by this freelancer id
-    applications = JobApplication.objects.filter(freelancer_id=freelance_id).select_related('job')
-
-    jobs_map = {}
-    for app in applications:
-        job = app.job
-        if job and job.id not in jobs_map:
-            jobs_map[job.id] = {
-                "job_id": job.id,
-                "job_title": job.job_title,
-                "job_category": job.job_category,
-                "date_posted": job.date_posted.strftime('%Y-%m-%d') if job.date_posted else None,
-                "job_status": job.job_status,
-            }
-
-    jobs_list = list(jobs_map.values())
+    paginate = 'limit' in request.query_params or 'cursor' in request.query_params
+    try:
+        history = freelancer_job_history(freelance_id, request, paginate)
+    except InvalidCursor:
+        return Response({"error": "Invalid cursor"}, status=status.HTTP_400_BAD_REQUEST)
 
-    return Response({"freelance_id": freelance_id, "jobs": jobs_list})
+    return Response({"freelance_id": freelance_id, **history})
 
 
 @api_view(['GET'])
@@ -704,3 +1388,38 @@ def get_interviews_by_job(request, job_id):
         })
 
     return Response({"interviews": interviews_list})
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def get_recommended_jobs(request, freelance_id):
+    """GET /api/freelance/{freelance_id}/recommended-jobs?limit= - Open jobs ranked against the freelancer's profile
+
+    Response: { "freelance_id": id, "jobs": [ {job listing fields..., "score"}, ... ] }
+    Jobs the freelancer has already applied to are left out.
+    """
+    profile = FreelancerProfile.objects.filter(user_id=freelance_id).first()
+    if not profile:
+        return Response({"error": "Freelancer profile not found"}, status=status.HTTP_404_NOT_FOUND)
+
+    limit = get_page_size(request)
+    applied = JobApplication.objects.filter(freelancer_id=freelance_id).values_list('job_id', flat=True)
+    ranked = recommend_jobs(profile, limit=limit * CANDIDATE_OVERFETCH, exclude=applied)
+
+    # The index may lag a few seconds behind; re-check status while loading the rows
+    jobs = JobPosting.objects.filter(id__in=[job_id for job_id, _score in ranked], job_status='open').only(*JOB_LIST_FIELDS)
+    jobs_by_id = {job.id: job for job in jobs}
+
+    jobs_list = []
+    for job_id, score in ranked:
+        job = jobs_by_id.get(job_id)
+        if job is None:
+            recommender.discard(job_id)
+            continue
+        item = _job_list_item(job)
+        item["score"] = round(score, 4)
+        jobs_list.append(item)
+        if len(jobs_list) == limit:
+            break
+
+    return Response({"freelance_id": freelance_id, "jobs": jobs_list})
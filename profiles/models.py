@@ -2,6 +2,8 @@ from django.db import models
 from django.contrib.auth.models import User
 from django.utils.timezone import now
 
+from jobs.storage import get_content_storage
+
 class FreelancerProfile(models.Model):
     GENDER_CHOICES = [
         ('male', 'Male'),
@@ -73,7 +75,7 @@ class FreelancerProfile(models.Model):
     linkedin_or_github = models.URLField(blank=True, null=True)
     bio = models.TextField(null=True, blank=True)
     profile_image = models.ImageField(upload_to='profile_images/', blank=True, null=True)
-    resume = models.FileField(upload_to='resumes/', blank=True, null=True)
+    resume = models.FileField(upload_to='resumes/', storage=get_content_storage, blank=True, null=True)
     education = models.JSONField(
         null=True, 
         blank=True, 
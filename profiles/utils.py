@@ -0,0 +1,34 @@
+from collections import namedtuple
+
+from .models import FreelancerProfile
+
+
+# Display info for a freelancer referenced by id from another app
+# (JobApplication.freelancer_id, JobInterview.freelancer_id, ...)
+FreelancerRef = namedtuple('FreelancerRef', ['freelancer_id', 'user_id', 'name', 'profile'])
+
+
+def fallback_freelancer(freelancer_id):
+    """Placeholder used when no FreelancerProfile exists for the id"""
+    return FreelancerRef(freelancer_id, freelancer_id, f"Freelancer {freelancer_id}", None)
+
+
+def resolve_freelancers(freelancer_ids):
+    """
+    Resolve many freelancer ids to FreelancerRef in a single query.
+
+    The jobs app stores the freelancer's auth user id in freelancer_id, so profiles
+    are matched on user_id. Every requested id is present in the returned dict;
+    ids without a profile map to fallback_freelancer(id).
+    """
+    ids = {int(fid) for fid in freelancer_ids if fid is not None}
+    resolved = {}
+    if ids:
+        profiles = FreelancerProfile.objects.select_related('user').filter(user_id__in=ids)
+        for profile in profiles:
+            name = profile.full_name or (profile.user.username if profile.user else f"Freelancer {profile.user_id}")
+            resolved[profile.user_id] = FreelancerRef(profile.user_id, profile.user_id, name, profile)
+    for fid in ids:
+        if fid not in resolved:
+            resolved[fid] = fallback_freelancer(fid)
+    return resolved
@@ -1,6 +1,7 @@
 from rest_framework import viewsets, permissions, status
 from .models import FreelancerProfile, JobProviderProfile
 from .serializers import FreelancerProfileSerializer, JobProviderProfileSerializer
+from jobs.geo import parse_point, parse_radius, places_within
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from django.http import Http404
@@ -182,8 +183,25 @@ class FreelancerListView(APIView):
     def get(self, request, *args, **kwargs):
         """
         Retrieve all freelancer profiles for public viewing.
+        Optional filters: ?city=, ?country=, ?near=<place or lat,lon>&radius_km=
         """
         profiles = FreelancerProfile.objects.all()
+        city = request.query_params.get('city')
+        if city:
+            profiles = profiles.filter(city=city)
+        country = request.query_params.get('country')
+        if country:
+            profiles = profiles.filter(country=country)
+        near = request.query_params.get('near', '').strip()
+        if near:
+            # city is a fixed choice list, so the radius is resolved against it in memory
+            try:
+                lat, lon = parse_point(near)
+                radius_km = parse_radius(request.query_params.get('radius_km'))
+            except ValueError as e:
+                return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+            cities = [value for value, _label in FreelancerProfile.CITY_CHOICES]
+            profiles = profiles.filter(city__in=places_within(lat, lon, radius_km, cities))
         serializer = self.serializer_class(profiles, many=True, context={'request': request})
         return Response(serializer.data, status=status.HTTP_200_OK)
 # ============================================
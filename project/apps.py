@@ -1,6 +1,21 @@
 from django.apps import AppConfig
+from django.db.models.signals import pre_migrate
+
+
+def create_search_extensions(using, **kwargs):
+    """project_title_trgm_idx needs pg_trgm before the tables are created"""
+    from django.db import connections
+    connection = connections[using]
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
 
 
 class ProjectConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "project"
+
+    def ready(self):
+        from . import signals  # noqa: F401
+
+        pre_migrate.connect(create_search_extensions, sender=self)
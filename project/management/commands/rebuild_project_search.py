@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from project.models import Project
+from project.search import refresh_search_vectors
+
+
+class Command(BaseCommand):
+    help = "Recompute project.search_vector (backfill after deploy or repair drift)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help="Projects updated per statement")
+        parser.add_argument('--missing-only', action='store_true', help="Only rows whose search_vector is NULL")
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        queryset = Project.objects.order_by('id')
+        if options['missing_only']:
+            queryset = queryset.filter(search_vector__isnull=True)
+
+        total = 0
+        last_id = 0
+        while True:
+            ids = list(queryset.filter(id__gt=last_id).values_list('id', flat=True)[:batch_size])
+            if not ids:
+                break
+            total += refresh_search_vectors(ids)
+            last_id = ids[-1]
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt search vectors for {total} projects"))
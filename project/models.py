@@ -1,5 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
 
@@ -39,10 +41,20 @@ class Project(models.Model):
         blank=True,
         help_text='Project cover image'
     )
+    
+    # Full-text search document, maintained by project.signals (see project.search)
+    search_vector = SearchVectorField(null=True, blank=True, editable=False)
 
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # ProjectCursorPagination: ORDER BY created_at DESC, id DESC
+            models.Index(fields=['-created_at', '-id'], name='project_created_id_idx'),
+            GinIndex(fields=['search_vector'], name='project_search_idx'),
+            # Typo-tolerant title matching; needs pg_trgm (created by project.apps on migrate)
+            GinIndex(fields=['title'], opclasses=['gin_trgm_ops'], name='project_title_trgm_idx'),
+        ]
     
     def __str__(self):
         return self.title
@@ -66,6 +78,9 @@ class Proposal(models.Model):
     class Meta:
         ordering = ['-submitted_at']
         unique_together = ['project', 'freelancer']
+        indexes = [
+            models.Index(fields=['-submitted_at', '-id'], name='proposal_submitted_id_idx'),
+        ]
     
     def __str__(self):
         return f"Proposal by {self.freelancer.username} for {self.project.title}"
@@ -92,6 +107,9 @@ class Milestone(models.Model):
     
     class Meta:
         ordering = ['start_date']
+        indexes = [
+            models.Index(fields=['start_date', 'id'], name='milestone_start_id_idx'),
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.project.title}"
@@ -116,6 +134,9 @@ class MilestonePayment(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='payment_created_id_idx'),
+        ]
     
     def __str__(self):
         return f"Payment for {self.milestone.name} - {self.payment_status}"
@@ -132,6 +153,9 @@ class Feedback(models.Model):
     class Meta:
         ordering = ['-submitted_at']
         unique_together = ['project', 'client', 'freelancer']
+        indexes = [
+            models.Index(fields=['-submitted_at', '-id'], name='feedback_submitted_id_idx'),
+        ]
     
     def __str__(self):
         return f"Feedback for {self.freelancer.username} - {self.rating} stars"
@@ -0,0 +1,37 @@
+from rest_framework.pagination import CursorPagination
+
+
+class ProjectAPICursorPagination(CursorPagination):
+    """
+    Cursor (keyset) pagination for the project API: ?cursor=&limit=, bounded by max_page_size.
+    Subclasses set `ordering` to the viewset's natural key, with id as the tie-breaker.
+    """
+    page_size = 20
+    page_size_query_param = 'limit'
+    max_page_size = 100
+
+
+class ProjectCursorPagination(ProjectAPICursorPagination):
+    ordering = ('-created_at', '-id')
+
+    def get_ordering(self, request, queryset, view):
+        # ?search=&ordering=relevance pages by the search_rank annotation (project.search)
+        if request.query_params.get('ordering') == 'relevance' and request.query_params.get('search', '').strip():
+            return ('-search_rank', '-id')
+        return self.ordering
+
+
+class ProposalCursorPagination(ProjectAPICursorPagination):
+    ordering = ('-submitted_at', '-id')
+
+
+class MilestoneCursorPagination(ProjectAPICursorPagination):
+    ordering = ('start_date', 'id')
+
+
+class MilestonePaymentCursorPagination(ProjectAPICursorPagination):
+    ordering = ('-created_at', '-id')
+
+
+class FeedbackCursorPagination(ProjectAPICursorPagination):
+    ordering = ('-submitted_at', '-id')
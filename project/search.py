@@ -0,0 +1,63 @@
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import (
+    SearchHeadline, SearchRank, SearchVector, TrigramWordSimilarity,
+)
+from django.db.models import F, FloatField, OuterRef, Q, Subquery, TextField, Value
+from django.db.models.functions import Cast, Coalesce
+
+from jobs.search import SEARCH_CONFIG, build_search_query
+
+from .models import Project, ProjectTag
+
+
+# Columns that feed the project document; saves touching none of them skip the refresh
+PROJECT_SEARCH_FIELDS = ('title', 'category', 'description')
+
+# A trigram match counts for this much of a full-text match when ranking
+TRIGRAM_RANK_WEIGHT = 0.5
+
+
+def _tags_text():
+    tags = ProjectTag.objects.filter(project=OuterRef('pk')).order_by().values('project')
+    return Coalesce(Subquery(tags.annotate(text=StringAgg('tag', ' ')).values('text')), Value(''), output_field=TextField())
+
+
+def project_search_vector():
+    """Weighted document for Project.search_vector: title > tags > category > description"""
+    return (
+        SearchVector('title', weight='A', config=SEARCH_CONFIG)
+        + SearchVector(_tags_text(), weight='B', config=SEARCH_CONFIG)
+        + SearchVector('category', weight='C', config=SEARCH_CONFIG)
+        + SearchVector('description', weight='D', config=SEARCH_CONFIG)
+    )
+
+
+def refresh_search_vectors(project_ids):
+    """Recompute search_vector for the given projects in one UPDATE"""
+    return Project.objects.filter(id__in=list(project_ids)).update(search_vector=project_search_vector())
+
+
+def search_projects(queryset, text):
+    """
+    Projects matching ?search= either in the full-text document or, for typos, by
+    trigram word similarity on the title (both served by GIN indexes). Rows are
+    annotated with search_rank and search_snippet (highlighted description).
+    """
+    query = build_search_query(text)
+    trigram = TrigramWordSimilarity(text, 'title')
+    match = Q(title__trigram_word_similar=text)
+    if query is None:
+        return queryset.filter(match).annotate(
+            search_rank=Cast(trigram * TRIGRAM_RANK_WEIGHT, FloatField()),
+            search_snippet=Value(None, output_field=TextField()),
+        )
+    return queryset.filter(match | Q(search_vector=query)).annotate(
+        search_rank=Cast(
+            Coalesce(SearchRank(F('search_vector'), query), 0.0) + trigram * TRIGRAM_RANK_WEIGHT,
+            FloatField(),
+        ),
+        search_snippet=SearchHeadline(
+            'description', query, config=SEARCH_CONFIG,
+            start_sel='<mark>', stop_sel='</mark>', max_fragments=2,
+        ),
+    )
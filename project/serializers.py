@@ -35,10 +35,18 @@ class ProjectSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['created_at', 'updated_at', 'user','country_name', 'company_name', 'project_count', 'join_date']
 
+    def to_representation(self, obj):
+        data = super().to_representation(obj)
+        # Present when the list was searched (see project.search.search_projects)
+        if hasattr(obj, 'search_rank'):
+            data['search_rank'] = obj.search_rank
+            data['search_snippet'] = obj.search_snippet
+        return data
+
     def get_company_name(self, obj):
+        # ProjectViewSet.get_queryset select_related()s the profile, so no query here
         try:
-            profile = JobProviderProfile.objects.get(user=obj.user)
-            return profile.company_name
+            return obj.user.job_provider_profile.company_name
         except JobProviderProfile.DoesNotExist:
             return None
 
@@ -51,7 +59,11 @@ class ProjectSerializer(serializers.ModelSerializer):
         
     def get_project_count(self, obj):
         """Count how many projects this job provider (user) has."""
-        return Project.objects.filter(user=obj.user).count()
+        # Annotated by ProjectViewSet.get_queryset; only freshly saved instances fall back to a COUNT
+        count = getattr(obj, 'owner_project_count', None)
+        if count is None:
+            count = Project.objects.filter(user_id=obj.user_id).count()
+        return count
         
     def get_image_url(self, obj):
         """Return full URL for image"""
@@ -0,0 +1,20 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Project, ProjectTag
+from .search import PROJECT_SEARCH_FIELDS, refresh_search_vectors
+
+
+@receiver(post_save, sender=Project)
+def update_project_search_vector(sender, instance, update_fields=None, **kwargs):
+    """Keep project.search_vector in step with the text columns it indexes"""
+    if update_fields is not None and not set(update_fields) & set(PROJECT_SEARCH_FIELDS):
+        return
+    refresh_search_vectors([instance.pk])
+
+
+@receiver(post_save, sender=ProjectTag)
+@receiver(post_delete, sender=ProjectTag)
+def update_tagged_project_search_vector(sender, instance, **kwargs):
+    """Tags are part of the project document"""
+    refresh_search_vectors([instance.project_id])
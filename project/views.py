@@ -8,12 +8,20 @@ from drf_yasg import openapi
 from django.contrib.auth.models import User
 from rest_framework.exceptions import PermissionDenied
 from django.utils import timezone
+from django.db.models import Count, OuterRef, Subquery
+
+from jobs.counters import get_counts, record_impressions, record_views
 
 from .models import Project, Proposal, Milestone, MilestonePayment, Feedback, ProjectTag
 from .serializers import (
     ProjectSerializer, ProposalSerializer, MilestoneSerializer,
     MilestonePaymentSerializer, FeedbackSerializer, ProjectTagSerializer
 )
+from .pagination import (
+    ProjectCursorPagination, ProposalCursorPagination, MilestoneCursorPagination,
+    MilestonePaymentCursorPagination, FeedbackCursorPagination
+)
+from .search import search_projects
 
 
 def get_user_profile_type(user):
@@ -53,6 +61,7 @@ class ProjectViewSet(viewsets.ModelViewSet):
     """
     queryset = Project.objects.all().select_related('user').order_by('-created_at')
     serializer_class = ProjectSerializer
+    pagination_class = ProjectCursorPagination
     
     def get_permissions(self):
         """
@@ -140,16 +149,46 @@ class ProjectViewSet(viewsets.ModelViewSet):
         if project_type:
             queryset = queryset.filter(project_type=project_type)
         
-        # Search by title or description
-        search = self.request.query_params.get('search', None)
+        # Search title, tags, category and description (full-text, plus trigram matching on
+        # the title for typos); ?ordering=relevance sorts by search_rank instead of newest first
+        search = self.request.query_params.get('search', '').strip()
         if search:
-            queryset = queryset.filter(
-                title__icontains=search
-            ) | queryset.filter(
-                description__icontains=search
+            queryset = search_projects(queryset, search)
+            if self.request.query_params.get('ordering') == 'relevance':
+                queryset = queryset.order_by('-search_rank', '-created_at')
+        
+        # Owner details and project count for ProjectSerializer, fetched with the page
+        # instead of one profile query and one COUNT per project
+        owner_projects = Project.objects.filter(user_id=OuterRef('user_id')).order_by().values('user_id')
+        return queryset.select_related('user__job_provider_profile').annotate(
+            owner_project_count=Subquery(owner_projects.annotate(count=Count('id')).values('count'))
+        )
+    
+    def list(self, request, *args, **kwargs):
+        """List projects and count an impression for each one returned"""
+        response = super().list(request, *args, **kwargs)
+        items = response.data.get('results', []) if isinstance(response.data, dict) else response.data
+        record_impressions('project', [item['id'] for item in items])
+        return response
+    
+    def retrieve(self, request, *args, **kwargs):
+        """Get a project and count a view"""
+        response = super().retrieve(request, *args, **kwargs)
+        record_views('project', [response.data['id']])
+        return response
+    
+    @action(detail=True, methods=['get'], permission_classes=[IsAuthenticated])
+    def views(self, request, pk=None):
+        """Get view and impression counts for a project (owner only)"""
+        project = self.get_object()
+        
+        if project.user != request.user:
+            return Response(
+                {'error': 'You do not have permission to view stats for this project'}, 
+                status=status.HTTP_403_FORBIDDEN
             )
         
-        return queryset
+        return Response({'project_id': project.id, **get_counts('project', project.id)})
     
     @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated])
     def add_tag(self, request, pk=None):
@@ -208,6 +247,7 @@ class ProposalViewSet(viewsets.ModelViewSet):
     """
     queryset = Proposal.objects.all().select_related('freelancer', 'project').order_by('-submitted_at')
     serializer_class = ProposalSerializer
+    pagination_class = ProposalCursorPagination
     permission_classes = [IsAuthenticated]
     
     def get_permissions(self):
@@ -360,6 +400,7 @@ class MilestoneViewSet(viewsets.ModelViewSet):
     """
     queryset = Milestone.objects.all().select_related('freelancer', 'project').order_by('-created_at')
     serializer_class = MilestoneSerializer
+    pagination_class = MilestoneCursorPagination
     permission_classes = [IsAuthenticated]
     
     def get_permissions(self):
@@ -593,6 +634,7 @@ class MilestonePaymentViewSet(viewsets.ModelViewSet):
     """
     queryset = MilestonePayment.objects.all().select_related('freelancer', 'project', 'milestone').order_by('-created_at')
     serializer_class = MilestonePaymentSerializer
+    pagination_class = MilestonePaymentCursorPagination
     permission_classes = [IsAuthenticated]
     
     def get_permissions(self):
@@ -684,6 +726,7 @@ class FeedbackViewSet(viewsets.ModelViewSet):
     """
     queryset = Feedback.objects.all().select_related('client', 'freelancer', 'project').order_by('-submitted_at')
     serializer_class = FeedbackSerializer
+    pagination_class = FeedbackCursorPagination
     permission_classes = [IsAuthenticated]
     
     def get_permissions(self):